@@ -1,3 +1,64 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from ._blosum import BLOSUM, loadMatrix
+from ._profile import QueryProfile
+from ._align import Aligner, Alignment
+from ._neighborhood import WordIndex, neighborhood
+from ._statistics import KarlinAltschul, ScoreDistribution, karlinAltschul, scoreDistribution
+
+if TYPE_CHECKING:
+    from ._shared import shareMatrix, attachMatrix
+    from ._allvsall import allVsAll, pairIndex
+    from ._search import Hit, readFasta, search
+    from ._seeds import DatabaseIndex, seedSearch
+
+# Imported on first access, they pull in multiprocessing, concurrent.futures, mmap and gzip
+_LAZY = {
+    "shareMatrix": "._shared",
+    "attachMatrix": "._shared",
+    "allVsAll": "._allvsall",
+    "pairIndex": "._allvsall",
+    "Hit": "._search",
+    "readFasta": "._search",
+    "search": "._search",
+    "DatabaseIndex": "._seeds",
+    "seedSearch": "._seeds",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> Any:
+    return sorted(set(globals()) | set(_LAZY))
+
 
-__all__ = ["BLOSUM", "loadMatrix"]
+__all__ = [
+    "BLOSUM",
+    "loadMatrix",
+    "shareMatrix",
+    "attachMatrix",
+    "QueryProfile",
+    "Aligner",
+    "Alignment",
+    "allVsAll",
+    "pairIndex",
+    "Hit",
+    "readFasta",
+    "search",
+    "WordIndex",
+    "neighborhood",
+    "DatabaseIndex",
+    "seedSearch",
+    "KarlinAltschul",
+    "karlinAltschul",
+    "ScoreDistribution",
+    "scoreDistribution",
+]
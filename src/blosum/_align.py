@@ -0,0 +1,899 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+Pairwise alignment scored by a BLOSUM matrix.
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+from itertools import accumulate
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from warnings import warn
+
+from . import _compat
+from ._profile import QueryProfile
+from ._scoring import BytesLike, Sequence, asBytes, encode, ndTable
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._blosum import BLOSUM
+
+NEG = float("-inf")
+
+# One DP row: scores H, horizontal gaps E (consuming seq2), vertical gaps F (consuming seq1)
+Row = Tuple[Any, Any, Any]
+
+
+class Alignment(NamedTuple):
+    """
+    Result of Aligner.align.
+
+    Attributes
+    ----------
+        score: float
+            The alignment score. An int in integer mode.
+        seq1: str
+            Aligned part of the first sequence, gaps are written as "-".
+        seq2: str
+            Aligned part of the second sequence, gaps are written as "-".
+        start1, end1: int
+            Aligned range of the first sequence, end exclusive.
+        start2, end2: int
+            Aligned range of the second sequence, end exclusive.
+        optimal: bool
+            False if a banded alignment may have missed a better path outside the band.
+    """
+
+    score: float
+    seq1: str
+    seq2: str
+    start1: int
+    end1: int
+    start2: int
+    end2: int
+    optimal: bool = True
+
+
+class Aligner:
+    MODES = ("local", "global")
+
+    def __init__(
+        self,
+        bm: "BLOSUM",
+        gapOpen: float = 11,
+        gapExtend: float = 1,
+        mode: str = "local",
+        band: Optional[int] = None,
+        adaptive: bool = False,
+    ):
+        """
+        Pairwise alignment with affine gap costs, scored by a BLOSUM matrix.
+        A gap of length L costs gapOpen + L * gapExtend (as in BLAST).
+
+        With NumPy installed the score-only path computes the DP one row at a time,
+        vectorized over the whole row. Horizontal gaps are resolved by a running
+        maximum instead of a loop over the columns.
+
+        Parameters
+        ----------
+            bm: BLOSUM
+                The substitution scores.
+            gapOpen: float
+                Penalty for opening a gap, >= 0. Integral in integer mode.
+            gapExtend: float
+                Penalty for every gap position, >= 0. Integral in integer mode.
+            mode: str
+                "local" (Smith-Waterman) or "global" (Needleman-Wunsch).
+            band: int, optional
+                Only for global mode. Restricts the DP to the diagonals that lie at
+                most band cells outside of the diagonals of the two corners.
+                Work and memory scale with length * band instead of length^2.
+            adaptive: bool
+                Doubles the band until the result is guaranteed to be optimal.
+
+        Attributes
+        ----------
+            cells: int
+                Number of DP cells computed so far.
+            seconds: float
+                Time spent computing them.
+            optimal: bool
+                False if the last banded result may not be optimal. A path leaving
+                the band has to contain gaps in both directions, its score is bounded
+                by the best substitution score times the remaining aligned pairs.
+                If the banded score is below this bound a UserWarning is issued.
+
+        Examples
+        --------
+            >>> aligner = Aligner(BLOSUM(62), gapOpen=11, gapExtend=1)
+            >>> aligner.score("HEAGAWGHEE", "PAWHEAE")
+            >>> aligner.align("HEAGAWGHEE", "PAWHEAE")
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode '{mode}'. Choose one of {self.MODES}.")
+        if gapOpen < 0 or gapExtend < 0:
+            raise ValueError("Gap penalties have to be non-negative.")
+        if bm.integer and not (float(gapOpen).is_integer() and float(gapExtend).is_integer()):
+            raise ValueError(
+                f"Gap penalties {gapOpen}, {gapExtend} are not integers, "
+                "as needed with a BLOSUM in integer mode."
+            )
+        if band is not None:
+            if mode != "global":
+                raise ValueError("Banded alignment is only available in global mode.")
+            if band < 0:
+                raise ValueError("Band has to be non-negative.")
+        elif adaptive:
+            raise ValueError("Adaptive banding needs an initial band.")
+
+        self.bm = bm
+        self.gapOpen = gapOpen
+        self.gapExtend = gapExtend
+        self.mode = mode
+        self.band = band
+        self.adaptive = adaptive
+
+        self.cells = 0
+        self.seconds = 0.0
+        self.optimal = True
+
+    def __repr__(self) -> str:
+        band = "" if self.band is None else f", band={self.band}, adaptive={self.adaptive}"
+        return (
+            f"Aligner({self.bm!r}, gapOpen={self.gapOpen}, "
+            f"gapExtend={self.gapExtend}, mode='{self.mode}'{band})"
+        )
+
+    @property
+    def cellsPerSecond(self) -> float:
+        """
+        Throughput of all alignments computed so far, in DP cells per second.
+        """
+        return self.cells / self.seconds if self.seconds else 0.0
+
+    def _record(self, cells: int, start: float) -> None:
+        self.cells += cells
+        self.seconds += perf_counter() - start
+
+    def _result(self, score: Any) -> Any:
+        return int(score) if self.bm.integer else float(score)
+
+    def _backend(self, seq1: Sequence, seq2: Sequence) -> Tuple[Any, Any, Any, Any]:
+        """
+        Returns both sequences as symbols, the matching row kernel and substitution
+        table: label codes with NumPy, raw bytes and the byte table without.
+        """
+        if _compat.numpy() is None:
+            return asBytes(seq1), asBytes(seq2), self._rowsPython, self.bm.byteTable()
+
+        table = self.bm._tables.get("codes")
+        if table is None:
+            table = self.bm._tables["codes"] = ndTable(self.bm).tolist()
+        return encode(self.bm, seq1), encode(self.bm, seq2), self._rowsNumpy, table
+
+    def _columns(self, seq2: Sequence) -> Any:
+        """
+        Returns the precomputed scores against seq2 for the row kernels
+        if it is a QueryProfile of this matrix, otherwise None.
+        """
+        if not (isinstance(seq2, QueryProfile) and seq2.bm is self.bm):
+            return None
+        if _compat.numpy() is None:
+            return seq2.column
+        return None if seq2.codes is None else seq2.columns
+
+    def score(self, seq1: Sequence, seq2: Sequence) -> float:
+        """
+        Returns the optimal alignment score without building the alignment.
+
+        Parameters
+        ----------
+            seq1: str, bytes, bytearray or memoryview
+                First sequence.
+            seq2: str, bytes, bytearray or memoryview
+                Second sequence.
+
+        Returns
+        -------
+            score: float
+                The score. An int in integer mode.
+        """
+        if self.band is not None:
+            return self._banded(seq1, seq2, False)  # type: ignore[no-any-return]
+
+        start = perf_counter()
+        s1, s2, rows, _ = self._backend(seq1, seq2)
+        columns = self._columns(seq2)
+        if self.mode == "local":
+            best = 0
+            for H, _, _ in rows(s1, s2, True, self.gapOpen, columns):
+                best = max(best, H.max() if hasattr(H, "max") else max(H))
+        else:
+            for H, _, _ in rows(s1, s2, False, self.gapOpen, columns):
+                pass
+            best = H[-1]
+        self._record(len(s1) * len(s2), start)
+        return self._result(best)  # type: ignore[no-any-return]
+
+    def scoreBatch(
+        self, query: Sequence, targets: Iterable[Sequence], lanes: int = 256, out: Any = None
+    ) -> Any:
+        """
+        Returns the scores of one query against many targets, see score.
+        With NumPy the targets are sorted by length and packed into groups of lanes.
+        Each group advances through the DP together, one target per row of a 2D array,
+        so every NumPy call works on lanes * len(query) cells. Targets leave their group
+        as soon as they end. This is much faster than score for many short targets.
+
+        In integer mode the DP runs in saturating int8 first. Only targets whose scores
+        overflow are rerun with int16, then int32 and int64, so the results stay exact.
+
+        Parameters
+        ----------
+            query: str, bytes, bytearray, memoryview or QueryProfile
+                The query (seq1).
+            targets: iterable of str, bytes, bytearray or memoryview
+                The targets (seq2).
+            lanes: int
+                Number of targets aligned at once.
+            out: optional
+                Writable sequence of at least len(targets) items the scores are written
+                to, e.g. a numpy.memmap or an array onto a memory mapped file.
+
+        Returns
+        -------
+            scores: list of float
+                The scores in the order of targets. Ints in integer mode.
+                out if given.
+        """
+        if lanes < 1:
+            raise ValueError("lanes has to be positive.")
+        targets = list(targets)
+        if out is not None and len(out) < len(targets):
+            raise ValueError(f"out holds {len(out)} scores, {len(targets)} are needed.")
+        if _compat.numpy() is None or self.band is not None:
+            return _store([self.score(query, target) for target in targets], out)
+
+        start = perf_counter()
+        np = _compat.numpy()
+        q = encode(self.bm, query)
+        codes = [encode(self.bm, target) for target in targets]
+        lengths = np.array([len(c) for c in codes], dtype=np.intp)
+        order = np.argsort(lengths, kind="stable")
+
+        # Scores of all query positions against every residue code, as precomputed
+        # by a QueryProfile of this matrix
+        if isinstance(query, QueryProfile) and query.bm is self.bm and query.codes is not None:
+            profile = query.transposed
+        else:
+            profile = np.ascontiguousarray(ndTable(self.bm)[q].T)
+        scores = np.empty(len(targets), dtype=profile.dtype)
+        for group in range(0, len(order), lanes):
+            members = order[group : group + lanes]
+            for dtype in self._widths(profile, len(q)):
+                result, overflow = self._scoreLanes(profile, [codes[i] for i in members], dtype)
+                scores[members] = result
+                self.cells += len(q) * int(lengths[members].sum())
+                # Rerun the saturated targets with the next width
+                members = members[overflow]
+                if not len(members):
+                    break
+
+        self.seconds += perf_counter() - start
+        return _store([self._result(score) for score in scores.tolist()], out)
+
+    def _widths(self, profile: Any, n: int) -> List[Any]:
+        """
+        Returns the dtypes for scoreBatch to try in turn. In integer mode these are the
+        integer types from int8 up, skipping those that cannot hold the profile (or the
+        first row of a global alignment), otherwise float64.
+        """
+        np = _compat.numpy()
+        o, e = self.gapOpen, self.gapExtend
+        if not self.bm.integer:
+            return [np.float64]
+
+        low = int(profile.min(initial=0))
+        high = int(profile.max(initial=0))
+        if self.mode == "global":
+            low = min(low, -int(o + e * n))
+        widths = []
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min < low and high < info.max:
+                widths.append(dtype)
+        return widths + [np.int64]
+
+    def _scoreLanes(self, profile: Any, codes: List[Any], dtype: Any) -> Tuple[Any, Any]:
+        """
+        Scores a group of targets sorted by length against the query of profile.
+        Row j of the DP holds the j-th residue of every target that is still running.
+
+        Narrow integer types (int8 to int32) saturate: every row is computed at a wider
+        width and clipped into the range of dtype. A target whose scores reach the
+        bounds of dtype is flagged as overflowing, all other scores are exact.
+        Returns the scores and the overflow flags.
+        """
+        np = _compat.numpy()
+        o, e = self.gapOpen, self.gapExtend
+        local = self.mode == "local"
+        K, n = len(codes), profile.shape[1]
+        ends = np.array([len(c) for c in codes], dtype=np.intp)
+        L = int(ends[-1]) if K else 0
+
+        T = np.zeros((K, L), dtype=np.intp)
+        for k, c in enumerate(codes):
+            T[k, : len(c)] = c
+
+        saturating = dtype in (np.int8, np.int16, np.int32)
+        low: float = NEG
+        high: float = -NEG
+        wide = dtype
+        if saturating:
+            info = np.iinfo(dtype)
+            low, high = info.min, info.max
+            wide = np.int64 if dtype == np.int32 else np.int32
+        if dtype != np.float64:
+            profile = profile.astype(dtype)
+            o, e = int(o), int(e)
+            if not saturating:
+                # int64 does not overflow for any sequence, -2**62 acts as -inf
+                low = -(1 << 62)
+
+        def narrow(values: Any) -> Any:
+            return np.clip(values, low, high).astype(dtype) if saturating else values
+
+        steps = e * np.arange(n + 1, dtype=wide)
+        H = np.zeros((K, n + 1), dtype) if local else narrow(np.tile(-(o + steps), (K, 1)))
+        H[:, 0] = 0
+        F = np.full((K, n + 1), low, dtype)
+        best = np.zeros(K, dtype)
+        overflow = np.zeros(K, dtype=bool)
+        scores = np.empty(K, dtype)
+        flags = np.empty(K, dtype=bool)
+
+        done = 0
+        for j in range(L + 1):
+            # Targets that ended with the previous row leave the group
+            finished = int(np.searchsorted(ends, j, side="right"))
+            if finished > done:
+                count = finished - done
+                scores[done:finished] = best[:count] if local else H[:count, n]
+                flags[done:finished] = overflow[:count]
+                H, F, T = H[count:], F[count:], T[count:]
+                best, overflow = best[count:], overflow[count:]
+                done = finished
+            if j == L:
+                break
+
+            F = narrow(np.maximum(np.subtract(H, o + e, dtype=wide), np.subtract(F, e, dtype=wide)))
+            Hn = np.empty(H.shape, dtype=wide)
+            Hn[:, 0] = 0 if local else -(o + e * (j + 1))
+            F[:, 0] = narrow(Hn[:, 0])
+            np.maximum(np.add(H[:, :-1], profile[T[:, j]], dtype=wide), F[:, 1:], out=Hn[:, 1:])
+            if local:
+                np.maximum(Hn, 0, out=Hn)
+
+            # E[j] = max_{k<j} Hn[k] - o - e * (j - k), as running maximum
+            E = np.maximum.accumulate(Hn + steps, axis=1)[:, :-1] - steps[1:] - o
+            np.maximum(Hn[:, 1:], E, out=Hn[:, 1:])
+
+            if saturating:
+                overflow |= (Hn >= high).any(axis=1)
+                if not local:
+                    overflow |= (Hn <= low).any(axis=1)
+            H = narrow(Hn)
+            if local:
+                np.maximum(best, H.max(axis=1), out=best)
+        return scores, flags
+
+    def align(self, seq1: Sequence, seq2: Sequence) -> Alignment:
+        """
+        Returns an optimal alignment including its traceback.
+        Local alignments need memory proportional to len(seq1) * len(seq2),
+        global ones are recovered in linear space (Hirschberg / Myers-Miller).
+        Banded alignments store the band only.
+
+        Parameters
+        ----------
+            seq1: str, bytes, bytearray or memoryview
+                First sequence.
+            seq2: str, bytes, bytearray or memoryview
+                Second sequence.
+
+        Returns
+        -------
+            alignment: Alignment
+        """
+        if self.band is not None:
+            return self._banded(seq1, seq2, True)  # type: ignore[no-any-return]
+
+        start = perf_counter()
+        s1, s2, rows, table = self._backend(seq1, seq2)
+        if self.mode == "global":
+            ops: List[str] = []
+            self._hirschberg(s1, s2, self.gapOpen, self.gapOpen, rows, table, ops)
+            alignment = self._fromOps(ops, s1, s2, seq1, seq2, table)
+            # Forward and reverse pass on each level of the recursion
+            self._record(2 * len(s1) * len(s2), start)
+            return alignment
+
+        H: List[Any] = []
+        E: List[Any] = []
+        F: List[Any] = []
+        for h, e, f in rows(s1, s2, True, self.gapOpen, self._columns(seq2)):
+            H.append(h)
+            E.append(e)
+            F.append(f)
+
+        # End of the best local alignment, first one on ties
+        i, j, best = 0, 0, NEG
+        for row, h in enumerate(H):
+            col = int(h.argmax()) if hasattr(h, "argmax") else h.index(max(h))
+            if h[col] > best:
+                i, j, best = row, col, h[col]
+
+        alignment = self._traceback(H, E, F, s1, s2, seq1, seq2, table, i, j)
+        self._record(len(s1) * len(s2), start)
+        return alignment
+
+    def _banded(self, seq1: Sequence, seq2: Sequence, traceback: bool) -> Any:
+        """
+        Banded global score or alignment, widening the band in adaptive mode.
+        Sets self.optimal and warns if the band was too narrow.
+        """
+        start = perf_counter()
+        s1, s2, _, table = self._backend(seq1, seq2)
+        numpy = _compat.numpy() is not None
+        n, m = len(s1), len(s2)
+
+        band = self.band
+        while True:
+            # Diagonals k = j - i, the band always contains both corners
+            lo, hi = min(0, m - n) - band, max(0, m - n) + band  # type: ignore[operator]
+            kernel = self._bandRowsNumpy if numpy else self._bandRowsPython
+            rows = kernel(s1, s2, lo, hi)
+            if traceback:
+                H, E, F = map(list, zip(*rows))
+            else:
+                for h, _, _ in rows:
+                    pass
+                H = [h]
+            self.cells += (n + 1) * (hi - lo + 1)
+
+            best = H[-1][m - n - lo]
+            self.optimal = lo <= -n and m <= hi or best >= self._outsideBound(s1, s2, table, lo, hi)
+            if self.optimal or not self.adaptive:
+                break
+            band = 2 * band + 1  # type: ignore[operator]
+
+        if not self.optimal:
+            warn(UserWarning(f"Band of {band} is too narrow to guarantee an optimal alignment."))
+
+        if traceback:
+            ops = self._bandTraceback(H, E, F, s1, s2, table, lo)
+            result = self._fromOps(ops, s1, s2, seq1, seq2, table)._replace(optimal=self.optimal)
+        else:
+            result = self._result(best)
+        self.seconds += perf_counter() - start
+        return result
+
+    def _outsideBound(self, s1: Any, s2: Any, table: Any, lo: int, hi: int) -> float:
+        """
+        Upper bound for the score of any global path that leaves the diagonals lo..hi.
+        Reaching diagonal hi + 1 needs at least hi + 1 insertions and as many deletions
+        as are needed to come back (and vice versa for lo - 1).
+        Every aligned pair scores at most the mean of the best scores its two residues
+        can reach, so a path with I insertions and D deletions scores at most half of
+        the best m - I and n - D of those, minus the cost of two gaps.
+        """
+        o, e = self.gapOpen, self.gapExtend
+        b1, b2 = bytes(s1), bytes(s2)
+        n, m = len(b1), len(b2)
+
+        best1 = {a: max(table[a][b] for b in set(b2)) for a in set(b1)}
+        best2 = {b: max(table[a][b] for a in set(b1)) for b in set(b2)}
+        top1 = list(accumulate(sorted(map(best1.__getitem__, b1), reverse=True), initial=0))
+        top2 = list(accumulate(sorted(map(best2.__getitem__, b2), reverse=True), initial=0))
+
+        bound = NEG
+        if hi < m:
+            for ins in range(hi + 1, m + 1):
+                dels = ins - (m - n)
+                bound = max(bound, (top1[n - dels] + top2[m - ins]) / 2 - 2 * o - e * (ins + dels))
+        if lo > -n:
+            for dels in range(1 - lo, n + 1):
+                ins = dels + (m - n)
+                bound = max(bound, (top1[n - dels] + top2[m - ins]) / 2 - 2 * o - e * (ins + dels))
+        return bound
+
+    def _bandRowsNumpy(self, c1: Any, c2: Any, lo: int, hi: int) -> Iterator[Row]:
+        """
+        Yields the global DP rows restricted to the diagonals lo <= j - i <= hi.
+        Cell (i, j) is stored at index j - i - lo, so the diagonal predecessor has the
+        same index in the previous row and the vertical one the next index.
+        Every row has one trailing -inf cell outside of the band.
+        """
+        np = _compat.numpy()
+        o, e = self.gapOpen, self.gapExtend
+        m = len(c2)
+        W = hi - lo + 1
+
+        # Profile of seq2 along the band: column i - 1 + d holds the scores of cell d in
+        # row i, -inf outside of the matrix
+        table = ndTable(self.bm).astype(np.float64)
+        profile = np.full((len(table), len(c1) + W), NEG)
+        profile[:, -lo : m - lo] = table[:, c2]
+        steps = e * np.arange(W)
+
+        js = lo + np.arange(W)
+        H = np.full(W + 1, NEG)
+        H[:W] = np.where((js >= 0) & (js <= m), -(o + e * js), NEG)
+        H[-lo] = 0
+        F = np.full(W + 1, NEG)
+        yield H, np.full(W + 1, NEG), F
+
+        for i, c in enumerate(c1, 1):
+            Fn = np.empty(W + 1)
+            Fn[W] = NEG
+            np.maximum(H[1:] - (o + e), F[1:] - e, out=Fn[:W])
+
+            Hn = np.empty(W + 1)
+            Hn[W] = NEG
+            np.maximum(H[:W] + profile[c, i - 1 : i - 1 + W], Fn[:W], out=Hn[:W])
+            col = -i - lo
+            if 0 <= col < W:
+                Hn[col] = Fn[col] = -(o + e * i)
+
+            En = np.empty(W + 1)
+            En[0] = En[W] = NEG
+            En[1:W] = np.maximum.accumulate(Hn[:W] + steps)[:-1] - steps[1:] - o
+            # Beyond the last column
+            En[max(0, m - i - lo + 1) :] = NEG
+            np.maximum(Hn, En, out=Hn)
+
+            H, F = Hn, Fn
+            yield H, En, F
+
+    def _bandRowsPython(self, b1: BytesLike, b2: BytesLike, lo: int, hi: int) -> Iterator[Row]:
+        """
+        Pure Python version of _bandRowsNumpy on raw bytes.
+        """
+        table = self.bm.byteTable()
+        o, e = self.gapOpen, self.gapExtend
+        oe = o + e
+        m = len(b2)
+        W = hi - lo + 1
+
+        H = [NEG] * (W + 1)
+        for d in range(W):
+            j = lo + d
+            if 0 <= j <= m:
+                H[d] = -(o + e * j) if j else 0.0
+        F = [NEG] * (W + 1)
+        yield H, [NEG] * (W + 1), F
+
+        for i, x in enumerate(b1, 1):
+            row = table[x]
+            Hn = [NEG] * (W + 1)
+            En = [NEG] * (W + 1)
+            Fn = [NEG] * (W + 1)
+            left = ev = NEG
+            for d in range(max(0, -i - lo), min(W, m - i - lo + 1)):
+                j = i + lo + d
+                f = max(H[d + 1] - oe, F[d + 1] - e)
+                if j == 0:
+                    left = Hn[d] = Fn[d] = -(o + e * i)
+                    continue
+                ev = max(left - oe, ev - e)
+                left = max(H[d] + row[b2[j - 1]], ev, f)
+                Hn[d], En[d], Fn[d] = left, ev, f
+            H, F = Hn, Fn
+            yield H, En, F
+
+    def _bandTraceback(
+        self, H: List[Any], E: List[Any], F: List[Any], s1: Any, s2: Any, table: Any, lo: int
+    ) -> List[str]:
+        """
+        Follows the banded global DP back from the last cell, returns the edit operations.
+        """
+        oe = self.gapOpen + self.gapExtend
+        i, j = len(s1), len(s2)
+
+        ops: List[str] = []
+        state = "H"
+        while i > 0 and j > 0:
+            d = j - i - lo
+            if state == "H":
+                h = H[i][d]
+                if h == H[i - 1][d] + table[s1[i - 1]][s2[j - 1]]:
+                    i, j = i - 1, j - 1
+                    ops.append("M")
+                    continue
+                state = "E" if h == E[i][d] else "F"
+            elif state == "E":
+                if E[i][d] == H[i][d - 1] - oe:
+                    state = "H"
+                j -= 1
+                ops.append("I")
+            else:
+                if F[i][d] == H[i - 1][d + 1] - oe:
+                    state = "H"
+                i -= 1
+                ops.append("D")
+
+        ops.extend("D" * i + "I" * j)
+        ops.reverse()
+        return ops
+
+    def _rowsNumpy(
+        self, c1: Any, c2: Any, local: bool, startGap: float, columns: Any = None
+    ) -> Iterator[Row]:
+        """
+        Yields the DP rows 0..len(c1) of label codes, vectorized over the columns.
+        In global mode the first column costs startGap + e * i, see _hirschberg.
+        columns are the precomputed scores against c2, see QueryProfile.
+        """
+        np = _compat.numpy()
+        o, e = self.gapOpen, self.gapExtend
+        m = len(c2)
+
+        # Profile of seq2: one row of scores against seq2 per residue code
+        profile = ndTable(self.bm).astype(np.float64)[:, c2] if columns is None else columns
+        steps = e * np.arange(m + 1)
+
+        H = np.zeros(m + 1) if local else -(o + steps)
+        H[0] = 0
+        F = np.full(m + 1, NEG)
+        yield H, np.full(m + 1, NEG), F
+
+        for i, c in enumerate(c1, 1):
+            F = np.maximum(H - (o + e), F - e)
+
+            Hn = np.empty(m + 1)
+            Hn[0] = 0 if local else -(startGap + e * i)
+            F[0] = Hn[0]
+            np.maximum(H[:-1] + profile[c], F[1:], out=Hn[1:])
+            if local:
+                np.maximum(Hn, 0, out=Hn)
+
+            # E[j] = max_{k<j} Hn[k] - o - e * (j - k), as running maximum
+            E = np.empty(m + 1)
+            E[0] = NEG
+            E[1:] = np.maximum.accumulate(Hn + steps)[:-1] - steps[1:] - o
+            np.maximum(Hn, E, out=Hn)
+
+            H = Hn
+            yield H, E, F
+
+    def _rowsPython(
+        self, b1: BytesLike, b2: BytesLike, local: bool, startGap: float, columns: Any = None
+    ) -> Iterator[Row]:
+        """
+        Pure Python version of _rowsNumpy on raw bytes.
+        columns returns the scores of a byte against b2, see QueryProfile.column.
+        """
+        table = self.bm.byteTable()
+        o, e = self.gapOpen, self.gapExtend
+        oe = o + e
+        m = len(b2)
+        floor = 0.0 if local else NEG
+
+        H: List[float] = [0.0] + [0.0 if local else -(o + e * j) for j in range(1, m + 1)]
+        F: List[float] = [NEG] * (m + 1)
+        yield H, [NEG] * (m + 1), F
+
+        for i, x in enumerate(b1, 1):
+            if columns is None:
+                row = table[x]
+                scores = [row[y] for y in b2]
+            else:
+                scores = columns(x)
+            F = [max(h - oe, f - e) for h, f in zip(H, F)]
+            left = 0.0 if local else -(startGap + e * i)
+            F[0] = left
+            Hn = [left]
+            En = [NEG]
+            ev = NEG
+            for j in range(1, m + 1):
+                ev = max(left - oe, ev - e)
+                left = max(H[j - 1] + scores[j - 1], ev, F[j], floor)
+                Hn.append(left)
+                En.append(ev)
+            H = Hn
+            yield H, En, F
+
+    def _hirschberg(
+        self,
+        s1: Any,
+        s2: Any,
+        tb: float,
+        te: float,
+        rows: Any,
+        table: Any,
+        ops: List[str],
+    ) -> None:
+        """
+        Global alignment in linear space (Myers & Miller, 1988).
+        Appends "M" (aligned pair), "D" (s1 residue against a gap) and
+        "I" (s2 residue against a gap) to ops.
+
+        tb / te are the opening costs of a vertical gap at the start / end of s1.
+        They are 0 if such a gap continues one of the neighbouring subproblem.
+        """
+        o, e = self.gapOpen, self.gapExtend
+        M, N = len(s1), len(s2)
+
+        if N == 0:
+            ops.extend("D" * M)
+            return
+        if M == 0:
+            ops.extend("I" * N)
+            return
+
+        if M == 1:
+            # Either delete s1[0] and insert all of s2, or align s1[0] to some s2[j]
+            row = table[s1[0]]
+            best = -(min(tb, te) + e) - (o + e * N)
+            choice = -1
+            for j in range(N):
+                score = (
+                    row[s2[j]] - (o + e * j if j else 0) - (o + e * (N - 1 - j) if j < N - 1 else 0)
+                )
+                if score > best:
+                    best, choice = score, j
+            if choice < 0:
+                ops.extend("D" + "I" * N if tb <= te else "I" * N + "D")
+            else:
+                ops.extend("I" * choice + "M" + "I" * (N - 1 - choice))
+            return
+
+        mid = M // 2
+        for H1, _, F1 in rows(s1[:mid], s2, False, tb):
+            pass
+        for H2, _, F2 in rows(s1[mid:][::-1], s2[::-1], False, te):
+            pass
+
+        # Split column: either any path through (mid, j) or a vertical gap spanning mid
+        if hasattr(H1, "argmax"):
+            through = H1 + H2[::-1]
+            gap = F1 + F2[::-1] + o
+            split = int(_compat.numpy().maximum(through, gap).argmax())
+            spanning = bool(gap[split] > through[split])
+        else:
+            best, split, spanning = NEG, 0, False
+            for j in range(N + 1):
+                if H1[j] + H2[N - j] > best:
+                    best, split, spanning = H1[j] + H2[N - j], j, False
+                if F1[j] + F2[N - j] + o > best:
+                    best, split, spanning = F1[j] + F2[N - j] + o, j, True
+
+        if spanning:
+            self._hirschberg(s1[: mid - 1], s2[:split], tb, 0, rows, table, ops)
+            ops.extend("DD")
+            self._hirschberg(s1[mid + 1 :], s2[split:], 0, te, rows, table, ops)
+        else:
+            self._hirschberg(s1[:mid], s2[:split], tb, o, rows, table, ops)
+            self._hirschberg(s1[mid:], s2[split:], o, te, rows, table, ops)
+
+    def _fromOps(
+        self,
+        ops: List[str],
+        s1: Any,
+        s2: Any,
+        seq1: Sequence,
+        seq2: Sequence,
+        table: Any,
+    ) -> Alignment:
+        """
+        Builds a global Alignment from edit operations and scores it.
+        """
+        text1 = _text(seq1)
+        text2 = _text(seq2)
+        o, e = self.gapOpen, self.gapExtend
+
+        out1: List[str] = []
+        out2: List[str] = []
+        score = 0.0
+        i = j = 0
+        last = "M"
+        for op in ops:
+            if op == "M":
+                score += table[s1[i]][s2[j]]
+                out1.append(text1[i])
+                out2.append(text2[j])
+                i += 1
+                j += 1
+            elif op == "D":
+                score -= e if last == "D" else o + e
+                out1.append(text1[i])
+                out2.append("-")
+                i += 1
+            else:
+                score -= e if last == "I" else o + e
+                out1.append("-")
+                out2.append(text2[j])
+                j += 1
+            last = op
+
+        return Alignment(self._result(score), "".join(out1), "".join(out2), 0, i, 0, j)
+
+    def _traceback(
+        self,
+        H: List[Any],
+        E: List[Any],
+        F: List[Any],
+        s1: Any,
+        s2: Any,
+        seq1: Sequence,
+        seq2: Sequence,
+        table: Any,
+        i: int,
+        j: int,
+    ) -> Alignment:
+        """
+        Follows the local DP matrices back from cell (i, j).
+        """
+        text1 = _text(seq1)
+        text2 = _text(seq2)
+        oe = self.gapOpen + self.gapExtend
+        score = H[i][j]
+        end1, end2 = i, j
+
+        out1: List[str] = []
+        out2: List[str] = []
+        state = "H"
+        while i > 0 and j > 0:
+            if state == "H":
+                h = H[i][j]
+                if h <= 0:
+                    break
+                if h == H[i - 1][j - 1] + table[s1[i - 1]][s2[j - 1]]:
+                    i, j = i - 1, j - 1
+                    out1.append(text1[i])
+                    out2.append(text2[j])
+                    continue
+                state = "E" if h == E[i][j] else "F"
+            elif state == "E":
+                if E[i][j] == H[i][j - 1] - oe:
+                    state = "H"
+                j -= 1
+                out1.append("-")
+                out2.append(text2[j])
+            else:
+                if F[i][j] == H[i - 1][j] - oe:
+                    state = "H"
+                i -= 1
+                out1.append(text1[i])
+                out2.append("-")
+
+        return Alignment(
+            self._result(score),
+            "".join(reversed(out1)),
+            "".join(reversed(out2)),
+            i,
+            end1,
+            j,
+            end2,
+        )
+
+
+def _store(scores: List[Any], out: Any) -> Any:
+    """
+    Writes scores into out and returns it, or returns scores if out is None.
+    """
+    if out is None:
+        return scores
+    for i, score in enumerate(scores):
+        out[i] = score
+    return out
+
+
+def _text(seq: Sequence) -> str:
+    """
+    Returns a sequence as str, bytes are decoded as latin-1.
+    """
+    return seq if isinstance(seq, str) else bytes(asBytes(seq)).decode("latin-1")
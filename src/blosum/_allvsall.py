@@ -0,0 +1,374 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+All-vs-all alignment scores of a sequence collection.
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from ._align import Aligner
+from ._blosum import BLOSUM
+from ._matrix import INTEGER_TYPECODES
+from ._scoring import Sequence, asBytes
+from ._shared import attachMatrix, shareMatrix
+
+# First row and first column of a tile
+Tile = Tuple[int, int]
+
+
+class Progress(NamedTuple):
+    """
+    Passed to the progress callback of allVsAll after every finished tile.
+
+    Attributes
+    ----------
+        pairs: int
+            Number of pairs scored so far.
+        total: int
+            Number of pairs to score.
+        seconds: float
+            Time since the start.
+        resumed: int
+            Number of pairs taken from a checkpoint, see allVsAll.
+    """
+
+    pairs: int
+    total: int
+    seconds: float
+    resumed: int = 0
+
+    @property
+    def pairsPerSecond(self) -> float:
+        return (self.pairs - self.resumed) / self.seconds if self.seconds else 0.0
+
+
+def pairIndex(n: int, i: int, j: int) -> int:
+    """
+    Returns the position of pair (i, j), i < j, in the condensed upper triangle of
+    n sequences, as returned by allVsAll (same order as scipy.spatial.distance.pdist).
+    """
+    return n * i - i * (i + 1) // 2 + j - i - 1
+
+
+def allVsAll(
+    bm: BLOSUM,
+    sequences: Iterable[Sequence],
+    gapOpen: float = 11,
+    gapExtend: float = 1,
+    mode: str = "local",
+    tileSize: int = 128,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[Progress], Any]] = None,
+    path: Optional[str] = None,
+    typecode: Optional[str] = None,
+) -> Union["array[Any]", memoryview]:
+    """
+    Aligns every pair of sequences once (the upper triangle only), see Aligner.
+
+    The triangle is cut into tiles of tileSize x tileSize pairs that are scored by a
+    process pool, each row of a tile with one call of Aligner.scoreBatch.
+    The matrix is published once through shared memory and every worker receives the
+    sequences once, at start-up; tasks only carry the tile coordinates.
+
+    Parameters
+    ----------
+        bm: BLOSUM
+            The substitution scores.
+        sequences: iterable of str, bytes, bytearray or memoryview
+            The collection to compare.
+        gapOpen, gapExtend: float
+            Gap costs, see Aligner.
+        mode: str
+            "local" or "global".
+        tileSize: int
+            Number of sequences per tile side.
+        workers: int, optional
+            Number of worker processes, defaults to the number of CPUs.
+            0 scores all tiles in the calling process.
+        progress: callable, optional
+            Called with a Progress after every finished tile.
+        path: str, optional
+            Write the scores into this file through mmap instead of memory.
+            Finished tiles are recorded in path + ".tiles", a run that was interrupted
+            resumes with the first tile that has not been written yet.
+        typecode: str, optional
+            Array typecode of the scores, "i" in integer mode and "d" otherwise by
+            default. Integer typecodes need integer mode.
+
+    Returns
+    -------
+        scores: array or memoryview
+            Condensed upper triangle: the score of (i, j), i < j, is at pairIndex(n, i, j).
+            With path a memoryview onto the mapped file, also readable with
+            numpy.memmap(path, dtype=typecode).
+
+    Examples
+    --------
+        >>> scores = allVsAll(BLOSUM(62), ["HEAGAWGHEE", "PAWHEAE", "MKTAYIAK"])
+        >>> scores[pairIndex(3, 0, 1)]
+    """
+    if tileSize < 1:
+        raise ValueError("tileSize has to be positive.")
+    options = {"gapOpen": gapOpen, "gapExtend": gapExtend, "mode": mode}
+    # Validates the options before any worker is started
+    Aligner(bm, **options)  # type: ignore[arg-type]
+
+    typecode = typecode or ("i" if bm.integer else "d")
+    if typecode in INTEGER_TYPECODES and not bm.integer:
+        raise ValueError(f"Typecode '{typecode}' needs a BLOSUM in integer mode.")
+
+    seqs = [bytes(asBytes(seq)) for seq in sequences]
+    n = len(seqs)
+    total = n * (n - 1) // 2
+    tiles = [(a, b) for a in range(0, n, tileSize) for b in range(a, n, tileSize)]
+
+    scores: Any
+    checkpoint = None
+    if path is None:
+        scores = array(typecode, [0]) * total
+        todo = tiles
+    else:
+        checkpoint = _Checkpoint(
+            path, n, tileSize, typecode, len(tiles), _fingerprint(bm, seqs, options)
+        )
+        scores = checkpoint.scores
+        todo = [tile for index, tile in enumerate(tiles) if not checkpoint.done[index]]
+
+    start = perf_counter()
+    pairs = resumed = total - sum(_tilePairs(n, tileSize, tile) for tile in todo)
+    index = {tile: i for i, tile in enumerate(tiles)}
+    failed = True
+    try:
+        for (a, b), tile in _run(bm, seqs, options, tileSize, typecode, todo, workers):
+            pos = 0
+            span = []
+            for i in range(a, min(a + tileSize, n)):
+                first, last = max(b, i + 1), min(b + tileSize, n)
+                if first < last:
+                    k = pairIndex(n, i, first)
+                    scores[k : k + last - first] = tile[pos : pos + last - first]
+                    pos += last - first
+                    span += [k, k + last - first]
+            if checkpoint is not None:
+                checkpoint.finish(index[a, b], span[0] if span else 0, span[-1] if span else 0)
+            pairs += len(tile)
+            if progress is not None:
+                progress(Progress(pairs, total, perf_counter() - start, resumed))
+        failed = False
+    finally:
+        if checkpoint is not None:
+            checkpoint.close(failed)
+    return scores  # type: ignore[no-any-return]
+
+
+def _fingerprint(bm: BLOSUM, sequences: List[bytes], options: Dict[str, Any]) -> bytes:
+    """
+    Hashes everything the scores depend on, so a checkpoint is never resumed with
+    other sequences, scores or gap costs.
+    """
+    digest = hashlib.sha1(repr((sorted(options.items()), bm.default, bm.integer)).encode())
+    digest.update(memoryview(bm.matrix.scores).cast("B"))
+    for seq in sequences:
+        digest.update(len(seq).to_bytes(8, "little"))
+        digest.update(seq)
+    return digest.digest()
+
+
+def _tilePairs(n: int, size: int, tile: Tile) -> int:
+    """
+    Returns the number of pairs i < j in a tile.
+    """
+    a, b = tile
+    return sum(max(0, min(b + size, n) - max(b, i + 1)) for i in range(a, min(a + size, n)))
+
+
+class _Checkpoint:
+    """
+    Scores in a memory mapped file, with one flag per finished tile in a sidecar file.
+    The sidecar starts with a header that has to match when a run is resumed.
+    """
+
+    # magic, sequence count, tile size, typecode, fingerprint of the inputs
+    HEADER = struct.Struct("<4sQQc20s")
+    MAGIC = b"BLAV"
+
+    def __init__(self, path: str, n: int, size: int, typecode: str, tiles: int, fingerprint: bytes):
+        self.itemsize = array(typecode).itemsize
+        header = self.HEADER.pack(self.MAGIC, n, size, typecode.encode(), fingerprint)
+        nbytes = n * (n - 1) // 2 * self.itemsize
+
+        sidecar = path + ".tiles"
+        resume = os.path.exists(path) and os.path.exists(sidecar)
+        if resume:
+            with open(sidecar, "rb") as f:
+                if not f.read(len(header)) == header:
+                    raise ValueError(f"Checkpoint '{sidecar}' belongs to a different run.")
+            if not os.path.getsize(path) == nbytes:
+                raise ValueError(f"'{path}' does not match its checkpoint.")
+
+        # The flags are only written after the data of their tile has been synced
+        self.data = open(path, "r+b" if resume else "w+b")
+        self.data.truncate(nbytes)
+        self.flags = open(sidecar, "r+b" if resume else "w+b")
+        if not resume:
+            self.flags.write(header + bytes(tiles))
+            self.flags.flush()
+        self.offset = len(header)
+        self.flags.seek(self.offset)
+        self.done = self.flags.read(tiles)
+
+        if nbytes:
+            self.map: Optional[mmap.mmap] = mmap.mmap(self.data.fileno(), nbytes)
+            self.view = memoryview(self.map)
+        else:
+            self.map = None
+            self.view = memoryview(bytearray())
+        self.scores: memoryview = self.view.cast(typecode)  # type: ignore[call-overload]
+
+    def finish(self, tile: int, first: int, end: int) -> None:
+        """
+        Syncs the scores of the pairs first..end - 1 to the file, which includes
+        those of the tile, then marks the tile as done.
+        """
+        if end > first and self.map is not None:
+            page = mmap.ALLOCATIONGRANULARITY
+            start = first * self.itemsize // page * page
+            self.map.flush(start, end * self.itemsize - start)
+        self.flags.seek(self.offset + tile)
+        self.flags.write(b"\1")
+        self.flags.flush()
+
+    def close(self, failed: bool = False) -> None:
+        """
+        Closes the files. The scores stay mapped for the caller, unless the run
+        failed: then the mapping is released too, e.g. Windows cannot truncate the
+        file on resume while it is still mapped.
+        """
+        self.flags.close()
+        self.data.close()
+        if failed:
+            self.scores.release()
+            self.view.release()
+            if self.map is not None:
+                self.map.close()
+
+
+class _Tiles:
+    """
+    Scores tiles of the all-vs-all triangle, held once per worker.
+    """
+
+    def __init__(
+        self,
+        bm: BLOSUM,
+        sequences: List[bytes],
+        options: Dict[str, Any],
+        size: int,
+        typecode: str,
+    ):
+        self.aligner = Aligner(bm, **options)
+        self.sequences = sequences
+        self.size = size
+        self.typecode = typecode
+
+    def score(self, tile: Tile) -> Tuple[Tile, "array[Any]"]:
+        a, b = tile
+        n = len(self.sequences)
+        scores = array(self.typecode)
+        for i in range(a, min(a + self.size, n)):
+            first, last = max(b, i + 1), min(b + self.size, n)
+            if first < last:
+                scores.extend(
+                    self.aligner.scoreBatch(self.sequences[i], self.sequences[first:last])
+                )
+        return tile, scores
+
+
+_tiles: Optional[_Tiles] = None
+
+
+def _initWorker(
+    name: str, sequences: List[bytes], options: Dict[str, Any], size: int, typecode: str
+) -> None:
+    global _tiles
+    _tiles = _Tiles(attachMatrix(name), sequences, options, size, typecode)
+
+
+def _scoreTile(tile: Tile) -> Tuple[Tile, "array[Any]"]:
+    assert _tiles is not None
+    return _tiles.score(tile)
+
+
+def _run(
+    bm: BLOSUM,
+    sequences: List[bytes],
+    options: Dict[str, Any],
+    size: int,
+    typecode: str,
+    tiles: List[Tile],
+    workers: Optional[int],
+) -> Iterator[Tuple[Tile, "array[Any]"]]:
+    """
+    Yields the scored tiles in order of completion.
+    """
+    if workers == 0:
+        yield from map(_Tiles(bm, sequences, options, size, typecode).score, tiles)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    shm = shareMatrix(bm)
+    try:
+        with ProcessPoolExecutor(
+            workers,
+            initializer=_initWorker,
+            initargs=(shm.name, sequences, options, size, typecode),
+        ) as pool:
+            yield from _bounded(pool, _scoreTile, tiles, 4 * workers)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _bounded(
+    pool: Executor, fn: Callable[[Any], Any], items: Iterable[Any], limit: int
+) -> Iterator[Any]:
+    """
+    Submits fn(item) for all items with at most limit of them pending, so finished
+    results are consumed while the remaining ones are computed. Items are only read
+    from the iterable as tasks finish. Yields the results in order of completion.
+    """
+    pending: Set[Future] = set()  # type: ignore[type-arg]
+    for item in items:
+        pending.add(pool.submit(fn, item))
+        if len(pending) >= limit:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
@@ -7,17 +7,186 @@ Or:  https://pypi.org/project/blosum/
 License: GPL-3.0
 """
 
-from warnings import warn
-from ._data import default_blosum
-from collections import defaultdict
-from typing import Dict, Union, DefaultDict
+from . import _scoring
+from ._matrix import ScoreMatrix, readMatrix
+from ._scoring import Sequence
+from collections import OrderedDict, defaultdict
+from functools import lru_cache, partial
+from math import isfinite
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+    DefaultDict,
+)
 
+_BUILTIN = (45, 50, 62, 80, 90)
 
-class BLOSUM(defaultdict):  # type: ignore
-    def __init__(self, n: Union[int, str], default: float = float("-inf")):
+# Shared built-in instances kept, least recently used ones are dropped first
+INSTANCE_CACHE_SIZE = 32
+
+
+class _ReadOnly:
+    """
+    Mixin that rejects every mutating dict method.
+    """
+
+    __slots__ = ()
+
+    def _readOnly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"'{type(self).__name__}' object is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readOnly
+    clear = pop = popitem = setdefault = update = _readOnly
+
+
+class _Row(_ReadOnly, dict):  # type: ignore
+    """
+    Read-only row of a BLOSUM matrix.
+    Unknown keys return the default value without being inserted.
+    """
+
+    __slots__ = ("default",)
+
+    def __init__(self, default: float, *args: Any):
+        self.default = default
+        dict.__init__(self, *args)
+
+    def __missing__(self, key: str) -> float:
+        return self.default
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_Row, (self.default, dict(self)))
+
+
+class _BufferRow(_Row):
+    """
+    Read-only row that reads every score from the dense storage on lookup and
+    holds none itself, used by attached matrices.
+    """
+
+    __slots__ = ("_scores", "_start", "_index", "_cast")
+
+    def __init__(
+        self,
+        default: float,
+        scores: Any,
+        start: int,
+        index: Dict[str, int],
+        cast: Callable[[Any], Any],
+    ):
+        _Row.__init__(self, default)
+        self._scores = scores
+        self._start = start
+        self._index = index
+        self._cast = cast
+
+    def __missing__(self, key: str) -> float:
+        i = self._index.get(key)
+        if i is None:
+            return self.default
+        return self._cast(self._scores[self._start + i])  # type: ignore[no-any-return]
+
+    def _items(self) -> Dict[str, Any]:
+        return {label: self[label] for label in self._index}
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _BufferRow):
+            other = other._items()
+        return self._items() == other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self._index else default
+
+    def keys(self) -> Any:
+        return self._items().keys()
+
+    def values(self) -> Any:
+        return self._items().values()
+
+    def items(self) -> Any:
+        return self._items().items()
+
+    def copy(self) -> Dict[str, Any]:  # type: ignore[override]
+        return self._items()
+
+    def __repr__(self) -> str:
+        return repr(self._items())
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_Row, (self.default, self._items()))
+
+
+class _Constant:
+    """
+    Picklable replacement for lambda: value, used as default_factory.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __call__(self) -> Any:
+        return self.value
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_Constant, (self.value,))
+
+
+@lru_cache(maxsize=None)
+def _builtinMatrix(n: int) -> ScoreMatrix:
+    """
+    Returns the dense matrix of a built-in BLOSUM, shared by all instances.
+    The data module is only imported on first use.
+    """
+    from ._data import unpack
+
+    return ScoreMatrix(*unpack(n))
+
+
+class BLOSUM(_ReadOnly, defaultdict):  # type: ignore
+    # Shared instances of the built-in matrices, keyed by (n, default, integer)
+    _instances: "OrderedDict[Tuple[Any, ...], BLOSUM]" = OrderedDict()
+
+    def __new__(
+        cls, n: Union[int, str], default: float = float("-inf"), integer: bool = False
+    ) -> "BLOSUM":
+        if isinstance(n, int) and n in _BUILTIN:
+            key = (n, type(default), default, integer)
+            cached = cls._instances.get(key)
+            if cached is not None:
+                cls._instances.move_to_end(key)
+                return cached
+        return super().__new__(cls)
+
+    def __init__(self, n: Union[int, str], default: float = float("-inf"), integer: bool = False):
         """
         Object to easily access a blosum matrix.
         This reader supports asymetric data.
+        Objects are read-only. The built-in matrices are created once per process
+        and shared by all callers asking for the same n and default, the most
+        recently used INSTANCE_CACHE_SIZE of them are kept.
 
         Parameters
         ----------
@@ -28,13 +197,21 @@ class BLOSUM(defaultdict):  # type: ignore
             default: float
                 The default value for missing entries in the matrix.
                 Defaults to -inf.
+            integer: bool
+                Integer mode. Scores are stored and returned as int.
+                A non-finite default is replaced by the smallest score of the matrix.
+                Raises ValueError if the matrix or the default is not integral.
 
         Attributes
         ----------
             n: int or str
                 The BLOSUM matrix identifier (version number or filepath).
-            default: float
+            default: float or int
                 The default value for missing entries.
+            integer: bool
+                True if the object runs in integer mode.
+            matrix: ScoreMatrix
+                The dense, array-backed scores the dict interface is built from.
 
         Examples
         --------
@@ -42,19 +219,22 @@ class BLOSUM(defaultdict):  # type: ignore
             >>> score = blosum62['W']['Y']  # Get the score for substituting W with Y
         """
 
-        self.n = n
-        self.default = default
+        # Shared instance returned by __new__ is already initialised
+        if "_matrix" in vars(self):
+            return
 
         # Using default matrix
-        if isinstance(n, int) and n in [45, 50, 62, 80, 90]:
-            matrix = {}
-            for k, v in default_blosum[n].items():
-                matrix[k] = defaultdict(lambda: default, v)
-            super().__init__(lambda: defaultdict(lambda: default), matrix)
+        if isinstance(n, int) and n in _BUILTIN:
+            self._setup(n, default, _builtinMatrix(n), integer)
+            # NaN never compares equal, it would add an instance on every call
+            if default == default:
+                self._instances[(n, type(default), default, integer)] = self
+                if len(self._instances) > INSTANCE_CACHE_SIZE:
+                    self._instances.popitem(last=False)
 
         # load custom matrix
         elif isinstance(n, str):
-            super().__init__(lambda: defaultdict(lambda: default), loadMatrix(n))
+            self._setup(n, default, readMatrix(n), integer)
         else:
             raise (
                 BaseException(
@@ -62,11 +242,262 @@ class BLOSUM(defaultdict):  # type: ignore
                 )
             )
 
+    def _setup(
+        self,
+        n: Union[int, str],
+        default: float,
+        matrix: ScoreMatrix,
+        integer: bool = False,
+        cache: bool = True,
+    ) -> None:
+        """
+        Builds the dict interface on top of a dense matrix.
+        Without cache, rows and pairs are read from the dense matrix on every lookup
+        and never stored in the dict, e.g. for a matrix in shared memory.
+        """
+        # As passed to the constructor, for pickling
+        self._requestedDefault = default
+        cast: Callable[[Any], Any] = float
+        if integer:
+            matrix = matrix.asInteger()
+            if not isfinite(default):
+                default = min(matrix.scores, default=0)
+            elif not default == int(default):
+                raise ValueError(f"Default {default} is not an integer.")
+            default = int(default)
+            cast = int
+
+        self._n = n
+        self._default = default
+        self._integer = integer
+        self._matrix = matrix
+
+        # Rows are built from the dense matrix on first access, see __missing__
+        defaultdict.__init__(self, partial(_Row, default))
+        self._cast = cast
+        self._cache = cache
+
+        # Returned for every unknown row, lookups never allocate or insert
+        self._empty = _Row(default)
+
+        # Direct access to the dense storage, e.g. a shared memory buffer, never copied.
+        # Scores are converted by _cast when they are read.
+        self._scores = matrix.scores
+        self._offsets = self.matrix.offsets
+        self._index = self.matrix.index
+
+        self._byteTable: Optional[Tuple[Tuple[Any, ...], ...]] = None
+
+        # Derived lookup tables, e.g. for NumPy, built on first use
+        self._tables: Dict[str, Any] = {}
+
+    def __reduce_ex__(self, protocol: Any) -> Tuple[Any, ...]:
+        """
+        Built-in matrices pickle as (n, default) and unpickle into the shared instance.
+        The default is the one given to the constructor, not its integer mode
+        replacement, so the instance is found under the same key.
+        Custom matrices pickle their packed ScoreMatrix, not the dict rows.
+        """
+        if isinstance(self.n, int):
+            return (BLOSUM, (self.n, self._requestedDefault, self.integer))
+        return (_unpickle, (self.n, self._requestedDefault, self.matrix, self.integer))
+
+    # Read-only, the built-in instances are shared by all callers
+    @property
+    def n(self) -> Union[int, str]:
+        return self._n
+
+    @property
+    def default(self) -> float:
+        return self._default
+
+    @property
+    def integer(self) -> bool:
+        return self._integer
+
+    @property
+    def matrix(self) -> ScoreMatrix:
+        return self._matrix
+
+    def __missing__(self, key: Union[str, Tuple[str, str]]) -> Union[_Row, float]:
+        """
+        Builds the row of a label, or the score of a pair (a, b), from the dense matrix
+        on its first lookup and keeps it, so later lookups are plain dict hits.
+        Unknown rows are not inserted, all of them share one empty read-only row,
+        and pairs with an unknown label return the default without being inserted.
+        Hence lookups with arbitrary (e.g. user supplied) keys never grow the matrix.
+        Without cache nothing is kept, rows are views that read the dense matrix.
+        """
+        if type(key) is tuple and len(key) == 2:
+            a, b = key
+            offset, index = self._offsets.get(a), self._index.get(b)
+            if offset is None or index is None:
+                return self.default
+            score = self._cast(self._scores[offset + index])
+            if self._cache:
+                dict.__setitem__(self, key, score)
+            return score  # type: ignore[no-any-return]
+        if key in self._index:
+            if not self._cache:
+                offset = self._offsets[key]  # type: ignore[index]
+                return _BufferRow(self.default, self._scores, offset, self._index, self._cast)
+            row = _Row(self.default, self.matrix.row(key, self._cast))  # type: ignore[arg-type]
+            dict.__setitem__(self, key, row)
+            return row
+        return self._empty
+
+    def _rows(self) -> Dict[str, _Row]:
+        """
+        Returns all rows as plain dict, building the missing ones.
+        """
+        return {label: self[label] for label in self.matrix.labels}
+
+    # The dict interface covers all labels, whether their rows are built yet or not
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.matrix.labels)
+
+    def __len__(self) -> int:
+        return self.matrix.size
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, BLOSUM):
+            other = other._rows()
+        return self._rows() == other
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self._index else default
+
+    def keys(self) -> Any:
+        return self._rows().keys()
+
+    def values(self) -> Any:
+        return self._rows().values()
+
+    def items(self) -> Any:
+        return self._rows().items()
+
+    def copy(self) -> Dict[str, _Row]:  # type: ignore[override]
+        return self._rows()
+
+    def score(self, a: str, b: str) -> float:
+        """
+        Returns the score of substituting a with b, the same as bm[a, b].
+        The pair is read from the dense matrix once and then served from the dict,
+        attached matrices (see attachMatrix) read the shared buffer on every call.
+
+        Parameters
+        ----------
+            a: str
+                Row label.
+            b: str
+                Column label.
+
+        Returns
+        -------
+            score: float
+                The score, or the default if a label is unknown. An int in integer mode.
+        """
+        return self[a, b]  # type: ignore[no-any-return]
+
+    def scoreSequences(self, seq1: Sequence, seq2: Sequence) -> float:
+        """
+        Scores two equal-length sequences without gaps, i.e. sums the
+        substitution scores of all aligned residue pairs.
+        Lowercase residues score like uppercase ones, unknown ones score the default.
+        Long sequences are scored with NumPy if it is installed.
+
+        Parameters
+        ----------
+            seq1: str, bytes, bytearray or memoryview
+                First (e.g. query) sequence.
+            seq2: str, bytes, bytearray or memoryview
+                Second sequence of the same length.
+
+        Returns
+        -------
+            score: float
+                The summed score. An int in integer mode.
+
+        Examples
+        --------
+            >>> BLOSUM(62).scoreSequences("HEAGAWGHEE", "PAWHEAEHEA")
+            -2.0
+        """
+        return _scoring.scoreSequences(self, seq1, seq2)  # type: ignore[no-any-return]
+
+    def scoreBatch(
+        self, pairs: Iterable[Tuple[Sequence, Sequence]], chunkSize: int = 65536
+    ) -> Iterator[float]:
+        """
+        Lazily scores many pairs of equal-length sequences, see scoreSequences.
+        At most chunkSize pairs are held in memory at once. With NumPy every chunk is
+        grouped by sequence length and each group is scored in one vectorized call.
+
+        Parameters
+        ----------
+            pairs: iterable of (sequence, sequence) tuples
+                The pairs to score. May be a generator far larger than memory.
+            chunkSize: int
+                Number of pairs read and scored at once.
+
+        Returns
+        -------
+            scores: iterator of float
+                The scores in input order. Ints in integer mode.
+
+        Examples
+        --------
+            >>> pairs = (line.split() for line in open("pairs.txt"))
+            >>> for score in BLOSUM(62).scoreBatch(pairs):
+            ...     print(score)
+        """
+        return _scoring.scoreBatch(self, pairs, chunkSize)
+
+    def byteTable(self) -> Tuple[Tuple[Any, ...], ...]:
+        """
+        Returns a 256x256 table of scores indexed by byte values.
+        Lowercase letters score like their uppercase labels, all other
+        unknown bytes score the default. The table is built once per object.
+
+        Returns
+        -------
+            table: tuple of tuples
+                table[x][y] is the score of substituting byte x with byte y.
+
+        Examples
+        --------
+            >>> table = BLOSUM(62).byteTable()
+            >>> a, b = b"HEAGAWGHEE", b"PAWHEAEHEA"
+            >>> score = sum(table[x][y] for x, y in zip(a, b))
+        """
+        if self._byteTable is None:
+            matrix = self.matrix
+            codes = matrix.codes()
+            size = matrix.size
+            scores = list(map(self._cast, self._scores))
+            default = self.default
+
+            # One row per label plus the all-default row, shared by equal byte codes
+            rows = [
+                tuple(scores[i * size + j] if i < size and j < size else default for j in codes)
+                for i in range(size + 1)
+            ]
+            self._byteTable = tuple(rows[i] for i in codes)
+        return self._byteTable
+
     def __str__(self) -> str:
         """
         Magic method to allow BLOSUM object printing.
         """
-        return f"BLOSUM({self.n}, default={self.default}, {dict(self)}"
+        return f"BLOSUM({self.n}, default={self.default}, {self._rows()}"
 
     def __repr__(self) -> str:
         """
@@ -79,14 +510,25 @@ class BLOSUM(defaultdict):  # type: ignore
         else:
             d = str(self.default)
 
-        if self.n in [45, 50, 62, 80, 90]:
+        if self.n in _BUILTIN:
             n = self.n
         else:
             n = f'"{self.n}"'
 
+        if self.integer:
+            return f"BLOSUM({n}, default={d}, integer=True)"
         return f"BLOSUM({n}, default={d})"
 
 
+def _unpickle(n: str, default: float, matrix: ScoreMatrix, integer: bool = False) -> BLOSUM:
+    """
+    Rebuilds a pickled custom BLOSUM without reading the file again.
+    """
+    bm = BLOSUM.__new__(BLOSUM, n, default)
+    bm._setup(n, default, matrix, integer)
+    return bm
+
+
 def loadMatrix(
     path: str,
     default: float = float("-inf"),
@@ -108,43 +550,17 @@ def loadMatrix(
             The blosum dict.
     """
 
-    with open(path, "r") as f:
-        content = f.readlines()
+    return _toDict(readMatrix(path), default)
 
+
+def _toDict(matrix: ScoreMatrix, default: float) -> DefaultDict[str, DefaultDict[str, float]]:
+    """
+    Expands a dense matrix into the nested defaultdict layout.
+    """
+    factory = _Constant(default)
     blosumDict: DefaultDict[str, DefaultDict[str, float]] = defaultdict(
-        lambda: defaultdict(lambda: default)
+        partial(defaultdict, factory)
     )
-
-    header = True
-    for line in content:
-        line = line.strip()
-
-        # Skip comments starting with #
-        if line.startswith("#"):
-            continue
-
-        linelist = line.split()
-
-        # Extract labels only once
-        if header:
-            labelslist = linelist
-            header = False
-
-            # Check if all AA are covered
-            if not len(labelslist) == 25:
-                warn(UserWarning("Blosum matrix may not cover all amino-acids"))
-            continue
-
-        if not len(linelist) == len(labelslist) + 1:
-            # Check if line has as may entries as labels
-            raise EOFError("Blosum file is missing values.")
-
-        # Add Line/Label combination to dict
-        for index, lab in enumerate(labelslist, start=1):
-            blosumDict[linelist[0]][lab] = float(linelist[index])
-
-    # Check quadratic
-    if not len(blosumDict) == len(labelslist):
-        raise EOFError("Blosum file is not quadratic.")
-
+    for label, row in matrix.rows():
+        blosumDict[label] = defaultdict(factory, row)
     return blosumDict
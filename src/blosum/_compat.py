@@ -0,0 +1,30 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+Optional dependencies. blosum itself has none, NumPy is used if installed.
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+from typing import Any
+
+# False until the first import attempt, None if NumPy is not installed
+_numpy: Any = False
+
+
+def numpy() -> Any:
+    """
+    Returns the numpy module or None if it is not installed.
+    The import is deferred to the first call to keep "import blosum" fast.
+    """
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            numpy = None  # type: ignore
+        _numpy = numpy
+    return _numpy
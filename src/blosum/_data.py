@@ -1,3393 +1,197 @@
 """
 BLOSUM data dictionary.
 Gathered from https://www.ncbi.nlm.nih.gov/IEB/ToolBox/C_DOC/lxr/source/data/.
+
+Every matrix is stored packed: a label string plus a row-major int8 score table,
+written as one hex encoded row per line. The nested dicts of default_blosum are
+only built on first access of default_blosum[n].
 """
 
+from array import array
+from typing import Dict, Iterator, Mapping, Tuple
+
+Matrix = Dict[str, Dict[str, float]]
 
-default_blosum = {
-    45: {
-        "A": {
-            "A": 5.0,
-            "R": -2.0,
-            "N": -1.0,
-            "D": -2.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": 0.0,
-            "H": -2.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -2.0,
-            "P": -1.0,
-            "S": 1.0,
-            "T": 0.0,
-            "W": -2.0,
-            "Y": -2.0,
-            "V": 0.0,
-            "B": -1.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "R": {
-            "A": -2.0,
-            "R": 7.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -3.0,
-            "Q": 1.0,
-            "E": 0.0,
-            "G": -2.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": 3.0,
-            "M": -1.0,
-            "F": -2.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -1.0,
-            "V": -2.0,
-            "B": -1.0,
-            "J": -3.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "N": {
-            "A": -1.0,
-            "R": 0.0,
-            "N": 6.0,
-            "D": 2.0,
-            "C": -2.0,
-            "Q": 0.0,
-            "E": 0.0,
-            "G": 0.0,
-            "H": 1.0,
-            "I": -2.0,
-            "L": -3.0,
-            "K": 0.0,
-            "M": -2.0,
-            "F": -2.0,
-            "P": -2.0,
-            "S": 1.0,
-            "T": 0.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 5.0,
-            "J": -3.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "D": {
-            "A": -2.0,
-            "R": -1.0,
-            "N": 2.0,
-            "D": 7.0,
-            "C": -3.0,
-            "Q": 0.0,
-            "E": 2.0,
-            "G": -1.0,
-            "H": 0.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": 0.0,
-            "M": -3.0,
-            "F": -4.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 6.0,
-            "J": -3.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "C": {
-            "A": -1.0,
-            "R": -3.0,
-            "N": -2.0,
-            "D": -3.0,
-            "C": 12.0,
-            "Q": -3.0,
-            "E": -3.0,
-            "G": -3.0,
-            "H": -3.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": -3.0,
-            "M": -2.0,
-            "F": -2.0,
-            "P": -4.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -5.0,
-            "Y": -3.0,
-            "V": -1.0,
-            "B": -2.0,
-            "J": -2.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "Q": {
-            "A": -1.0,
-            "R": 1.0,
-            "N": 0.0,
-            "D": 0.0,
-            "C": -3.0,
-            "Q": 6.0,
-            "E": 2.0,
-            "G": -2.0,
-            "H": 1.0,
-            "I": -2.0,
-            "L": -2.0,
-            "K": 1.0,
-            "M": 0.0,
-            "F": -4.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -1.0,
-            "V": -3.0,
-            "B": 0.0,
-            "J": -2.0,
-            "Z": 4.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "E": {
-            "A": -1.0,
-            "R": 0.0,
-            "N": 0.0,
-            "D": 2.0,
-            "C": -3.0,
-            "Q": 2.0,
-            "E": 6.0,
-            "G": -2.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": 1.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": 0.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 1.0,
-            "J": -3.0,
-            "Z": 5.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "G": {
-            "A": 0.0,
-            "R": -2.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -3.0,
-            "Q": -2.0,
-            "E": -2.0,
-            "G": 7.0,
-            "H": -2.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": -2.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -2.0,
-            "S": 0.0,
-            "T": -2.0,
-            "W": -2.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": -1.0,
-            "J": -4.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "H": {
-            "A": -2.0,
-            "R": 0.0,
-            "N": 1.0,
-            "D": 0.0,
-            "C": -3.0,
-            "Q": 1.0,
-            "E": 0.0,
-            "G": -2.0,
-            "H": 10.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": -1.0,
-            "M": 0.0,
-            "F": -2.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -2.0,
-            "W": -3.0,
-            "Y": 2.0,
-            "V": -3.0,
-            "B": 0.0,
-            "J": -2.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "I": {
-            "A": -1.0,
-            "R": -3.0,
-            "N": -2.0,
-            "D": -4.0,
-            "C": -3.0,
-            "Q": -2.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -3.0,
-            "I": 5.0,
-            "L": 2.0,
-            "K": -3.0,
-            "M": 2.0,
-            "F": 0.0,
-            "P": -2.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": 0.0,
-            "V": 3.0,
-            "B": -3.0,
-            "J": 4.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "L": {
-            "A": -1.0,
-            "R": -2.0,
-            "N": -3.0,
-            "D": -3.0,
-            "C": -2.0,
-            "Q": -2.0,
-            "E": -2.0,
-            "G": -3.0,
-            "H": -2.0,
-            "I": 2.0,
-            "L": 5.0,
-            "K": -3.0,
-            "M": 2.0,
-            "F": 1.0,
-            "P": -3.0,
-            "S": -3.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": 0.0,
-            "V": 1.0,
-            "B": -3.0,
-            "J": 4.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "K": {
-            "A": -1.0,
-            "R": 3.0,
-            "N": 0.0,
-            "D": 0.0,
-            "C": -3.0,
-            "Q": 1.0,
-            "E": 1.0,
-            "G": -2.0,
-            "H": -1.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 5.0,
-            "M": -1.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -1.0,
-            "V": -2.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "M": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": -2.0,
-            "D": -3.0,
-            "C": -2.0,
-            "Q": 0.0,
-            "E": -2.0,
-            "G": -2.0,
-            "H": 0.0,
-            "I": 2.0,
-            "L": 2.0,
-            "K": -1.0,
-            "M": 6.0,
-            "F": 0.0,
-            "P": -2.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": 0.0,
-            "V": 1.0,
-            "B": -2.0,
-            "J": 2.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "F": {
-            "A": -2.0,
-            "R": -2.0,
-            "N": -2.0,
-            "D": -4.0,
-            "C": -2.0,
-            "Q": -4.0,
-            "E": -3.0,
-            "G": -3.0,
-            "H": -2.0,
-            "I": 0.0,
-            "L": 1.0,
-            "K": -3.0,
-            "M": 0.0,
-            "F": 8.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": 1.0,
-            "Y": 3.0,
-            "V": 0.0,
-            "B": -3.0,
-            "J": 1.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "P": {
-            "A": -1.0,
-            "R": -2.0,
-            "N": -2.0,
-            "D": -1.0,
-            "C": -4.0,
-            "Q": -1.0,
-            "E": 0.0,
-            "G": -2.0,
-            "H": -2.0,
-            "I": -2.0,
-            "L": -3.0,
-            "K": -1.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": 9.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": -2.0,
-            "J": -3.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "S": {
-            "A": 1.0,
-            "R": -1.0,
-            "N": 1.0,
-            "D": 0.0,
-            "C": -1.0,
-            "Q": 0.0,
-            "E": 0.0,
-            "G": 0.0,
-            "H": -1.0,
-            "I": -2.0,
-            "L": -3.0,
-            "K": -1.0,
-            "M": -2.0,
-            "F": -2.0,
-            "P": -1.0,
-            "S": 4.0,
-            "T": 2.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": -1.0,
-            "B": 0.0,
-            "J": -2.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "T": {
-            "A": 0.0,
-            "R": -1.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -2.0,
-            "H": -2.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -1.0,
-            "P": -1.0,
-            "S": 2.0,
-            "T": 5.0,
-            "W": -3.0,
-            "Y": -1.0,
-            "V": 0.0,
-            "B": 0.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "W": {
-            "A": -2.0,
-            "R": -2.0,
-            "N": -4.0,
-            "D": -4.0,
-            "C": -5.0,
-            "Q": -2.0,
-            "E": -3.0,
-            "G": -2.0,
-            "H": -3.0,
-            "I": -2.0,
-            "L": -2.0,
-            "K": -2.0,
-            "M": -2.0,
-            "F": 1.0,
-            "P": -3.0,
-            "S": -4.0,
-            "T": -3.0,
-            "W": 15.0,
-            "Y": 3.0,
-            "V": -3.0,
-            "B": -4.0,
-            "J": -2.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "Y": {
-            "A": -2.0,
-            "R": -1.0,
-            "N": -2.0,
-            "D": -2.0,
-            "C": -3.0,
-            "Q": -1.0,
-            "E": -2.0,
-            "G": -3.0,
-            "H": 2.0,
-            "I": 0.0,
-            "L": 0.0,
-            "K": -1.0,
-            "M": 0.0,
-            "F": 3.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": 3.0,
-            "Y": 8.0,
-            "V": -1.0,
-            "B": -2.0,
-            "J": 0.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "V": {
-            "A": 0.0,
-            "R": -2.0,
-            "N": -3.0,
-            "D": -3.0,
-            "C": -1.0,
-            "Q": -3.0,
-            "E": -3.0,
-            "G": -3.0,
-            "H": -3.0,
-            "I": 3.0,
-            "L": 1.0,
-            "K": -2.0,
-            "M": 1.0,
-            "F": 0.0,
-            "P": -3.0,
-            "S": -1.0,
-            "T": 0.0,
-            "W": -3.0,
-            "Y": -1.0,
-            "V": 5.0,
-            "B": -3.0,
-            "J": 2.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "B": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": 5.0,
-            "D": 6.0,
-            "C": -2.0,
-            "Q": 0.0,
-            "E": 1.0,
-            "G": -1.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 0.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -2.0,
-            "S": 0.0,
-            "T": 0.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 5.0,
-            "J": -3.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "J": {
-            "A": -1.0,
-            "R": -3.0,
-            "N": -3.0,
-            "D": -3.0,
-            "C": -2.0,
-            "Q": -2.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -2.0,
-            "I": 4.0,
-            "L": 4.0,
-            "K": -3.0,
-            "M": 2.0,
-            "F": 1.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": 0.0,
-            "V": 2.0,
-            "B": -3.0,
-            "J": 4.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "Z": {
-            "A": -1.0,
-            "R": 1.0,
-            "N": 0.0,
-            "D": 1.0,
-            "C": -3.0,
-            "Q": 4.0,
-            "E": 5.0,
-            "G": -2.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": 1.0,
-            "M": -1.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 1.0,
-            "J": -2.0,
-            "Z": 5.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "X": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": -1.0,
-            "D": -1.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -1.0,
-            "H": -1.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -1.0,
-            "P": -1.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -1.0,
-            "Y": -1.0,
-            "V": -1.0,
-            "B": -1.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "*": {
-            "A": -5.0,
-            "R": -5.0,
-            "N": -5.0,
-            "D": -5.0,
-            "C": -5.0,
-            "Q": -5.0,
-            "E": -5.0,
-            "G": -5.0,
-            "H": -5.0,
-            "I": -5.0,
-            "L": -5.0,
-            "K": -5.0,
-            "M": -5.0,
-            "F": -5.0,
-            "P": -5.0,
-            "S": -5.0,
-            "T": -5.0,
-            "W": -5.0,
-            "Y": -5.0,
-            "V": -5.0,
-            "B": -5.0,
-            "J": -5.0,
-            "Z": -5.0,
-            "X": -5.0,
-            "*": 1.0,
-        },
-    },
-    50: {
-        "A": {
-            "A": 5.0,
-            "R": -2.0,
-            "N": -1.0,
-            "D": -2.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": 0.0,
-            "H": -2.0,
-            "I": -1.0,
-            "L": -2.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 1.0,
-            "T": 0.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": 0.0,
-            "B": -2.0,
-            "J": -2.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "R": {
-            "A": -2.0,
-            "R": 7.0,
-            "N": -1.0,
-            "D": -2.0,
-            "C": -4.0,
-            "Q": 1.0,
-            "E": 0.0,
-            "G": -3.0,
-            "H": 0.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": 3.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -3.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -1.0,
-            "V": -3.0,
-            "B": -1.0,
-            "J": -3.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "N": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": 7.0,
-            "D": 2.0,
-            "C": -2.0,
-            "Q": 0.0,
-            "E": 0.0,
-            "G": 0.0,
-            "H": 1.0,
-            "I": -3.0,
-            "L": -4.0,
-            "K": 0.0,
-            "M": -2.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": 1.0,
-            "T": 0.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 5.0,
-            "J": -4.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "D": {
-            "A": -2.0,
-            "R": -2.0,
-            "N": 2.0,
-            "D": 8.0,
-            "C": -4.0,
-            "Q": 0.0,
-            "E": 2.0,
-            "G": -1.0,
-            "H": -1.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": -1.0,
-            "M": -4.0,
-            "F": -5.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -5.0,
-            "Y": -3.0,
-            "V": -4.0,
-            "B": 6.0,
-            "J": -4.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "C": {
-            "A": -1.0,
-            "R": -4.0,
-            "N": -2.0,
-            "D": -4.0,
-            "C": 13.0,
-            "Q": -3.0,
-            "E": -3.0,
-            "G": -3.0,
-            "H": -3.0,
-            "I": -2.0,
-            "L": -2.0,
-            "K": -3.0,
-            "M": -2.0,
-            "F": -2.0,
-            "P": -4.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -5.0,
-            "Y": -3.0,
-            "V": -1.0,
-            "B": -3.0,
-            "J": -2.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "Q": {
-            "A": -1.0,
-            "R": 1.0,
-            "N": 0.0,
-            "D": 0.0,
-            "C": -3.0,
-            "Q": 7.0,
-            "E": 2.0,
-            "G": -2.0,
-            "H": 1.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": 2.0,
-            "M": 0.0,
-            "F": -4.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -1.0,
-            "Y": -1.0,
-            "V": -3.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 4.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "E": {
-            "A": -1.0,
-            "R": 0.0,
-            "N": 0.0,
-            "D": 2.0,
-            "C": -3.0,
-            "Q": 2.0,
-            "E": 6.0,
-            "G": -3.0,
-            "H": 0.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": 1.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 1.0,
-            "J": -3.0,
-            "Z": 5.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "G": {
-            "A": 0.0,
-            "R": -3.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -3.0,
-            "Q": -2.0,
-            "E": -3.0,
-            "G": 8.0,
-            "H": -2.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": -2.0,
-            "M": -3.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": 0.0,
-            "T": -2.0,
-            "W": -3.0,
-            "Y": -3.0,
-            "V": -4.0,
-            "B": -1.0,
-            "J": -4.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "H": {
-            "A": -2.0,
-            "R": 0.0,
-            "N": 1.0,
-            "D": -1.0,
-            "C": -3.0,
-            "Q": 1.0,
-            "E": 0.0,
-            "G": -2.0,
-            "H": 10.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": 0.0,
-            "M": -1.0,
-            "F": -1.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -2.0,
-            "W": -3.0,
-            "Y": 2.0,
-            "V": -4.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "I": {
-            "A": -1.0,
-            "R": -4.0,
-            "N": -3.0,
-            "D": -4.0,
-            "C": -2.0,
-            "Q": -3.0,
-            "E": -4.0,
-            "G": -4.0,
-            "H": -4.0,
-            "I": 5.0,
-            "L": 2.0,
-            "K": -3.0,
-            "M": 2.0,
-            "F": 0.0,
-            "P": -3.0,
-            "S": -3.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -1.0,
-            "V": 4.0,
-            "B": -4.0,
-            "J": 4.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "L": {
-            "A": -2.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -4.0,
-            "C": -2.0,
-            "Q": -2.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -3.0,
-            "I": 2.0,
-            "L": 5.0,
-            "K": -3.0,
-            "M": 3.0,
-            "F": 1.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -1.0,
-            "V": 1.0,
-            "B": -4.0,
-            "J": 4.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "K": {
-            "A": -1.0,
-            "R": 3.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -3.0,
-            "Q": 2.0,
-            "E": 1.0,
-            "G": -2.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 6.0,
-            "M": -2.0,
-            "F": -4.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "M": {
-            "A": -1.0,
-            "R": -2.0,
-            "N": -2.0,
-            "D": -4.0,
-            "C": -2.0,
-            "Q": 0.0,
-            "E": -2.0,
-            "G": -3.0,
-            "H": -1.0,
-            "I": 2.0,
-            "L": 3.0,
-            "K": -2.0,
-            "M": 7.0,
-            "F": 0.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -1.0,
-            "Y": 0.0,
-            "V": 1.0,
-            "B": -3.0,
-            "J": 2.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "F": {
-            "A": -3.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -5.0,
-            "C": -2.0,
-            "Q": -4.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -1.0,
-            "I": 0.0,
-            "L": 1.0,
-            "K": -4.0,
-            "M": 0.0,
-            "F": 8.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -2.0,
-            "W": 1.0,
-            "Y": 4.0,
-            "V": -1.0,
-            "B": -4.0,
-            "J": 1.0,
-            "Z": -4.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "P": {
-            "A": -1.0,
-            "R": -3.0,
-            "N": -2.0,
-            "D": -1.0,
-            "C": -4.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -2.0,
-            "H": -2.0,
-            "I": -3.0,
-            "L": -4.0,
-            "K": -1.0,
-            "M": -3.0,
-            "F": -4.0,
-            "P": 10.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": -2.0,
-            "J": -3.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "S": {
-            "A": 1.0,
-            "R": -1.0,
-            "N": 1.0,
-            "D": 0.0,
-            "C": -1.0,
-            "Q": 0.0,
-            "E": -1.0,
-            "G": 0.0,
-            "H": -1.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 0.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 5.0,
-            "T": 2.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": -2.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "T": {
-            "A": 0.0,
-            "R": -1.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -2.0,
-            "H": -2.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -2.0,
-            "P": -1.0,
-            "S": 2.0,
-            "T": 5.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": 0.0,
-            "B": 0.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "W": {
-            "A": -3.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -5.0,
-            "C": -5.0,
-            "Q": -1.0,
-            "E": -3.0,
-            "G": -3.0,
-            "H": -3.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": -3.0,
-            "M": -1.0,
-            "F": 1.0,
-            "P": -4.0,
-            "S": -4.0,
-            "T": -3.0,
-            "W": 15.0,
-            "Y": 2.0,
-            "V": -3.0,
-            "B": -5.0,
-            "J": -2.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "Y": {
-            "A": -2.0,
-            "R": -1.0,
-            "N": -2.0,
-            "D": -3.0,
-            "C": -3.0,
-            "Q": -1.0,
-            "E": -2.0,
-            "G": -3.0,
-            "H": 2.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -2.0,
-            "M": 0.0,
-            "F": 4.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -2.0,
-            "W": 2.0,
-            "Y": 8.0,
-            "V": -1.0,
-            "B": -3.0,
-            "J": -1.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "V": {
-            "A": 0.0,
-            "R": -3.0,
-            "N": -3.0,
-            "D": -4.0,
-            "C": -1.0,
-            "Q": -3.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -4.0,
-            "I": 4.0,
-            "L": 1.0,
-            "K": -3.0,
-            "M": 1.0,
-            "F": -1.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": 0.0,
-            "W": -3.0,
-            "Y": -1.0,
-            "V": 5.0,
-            "B": -3.0,
-            "J": 2.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "B": {
-            "A": -2.0,
-            "R": -1.0,
-            "N": 5.0,
-            "D": 6.0,
-            "C": -3.0,
-            "Q": 0.0,
-            "E": 1.0,
-            "G": -1.0,
-            "H": 0.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": 0.0,
-            "M": -3.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": 0.0,
-            "T": 0.0,
-            "W": -5.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": 6.0,
-            "J": -4.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "J": {
-            "A": -2.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -4.0,
-            "C": -2.0,
-            "Q": -3.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -3.0,
-            "I": 4.0,
-            "L": 4.0,
-            "K": -3.0,
-            "M": 2.0,
-            "F": 1.0,
-            "P": -3.0,
-            "S": -3.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -1.0,
-            "V": 2.0,
-            "B": -4.0,
-            "J": 4.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "Z": {
-            "A": -1.0,
-            "R": 0.0,
-            "N": 0.0,
-            "D": 1.0,
-            "C": -3.0,
-            "Q": 4.0,
-            "E": 5.0,
-            "G": -2.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 1.0,
-            "M": -1.0,
-            "F": -4.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 1.0,
-            "J": -3.0,
-            "Z": 5.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "X": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": -1.0,
-            "D": -1.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -1.0,
-            "H": -1.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -1.0,
-            "P": -1.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -1.0,
-            "Y": -1.0,
-            "V": -1.0,
-            "B": -1.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -5.0,
-        },
-        "*": {
-            "A": -5.0,
-            "R": -5.0,
-            "N": -5.0,
-            "D": -5.0,
-            "C": -5.0,
-            "Q": -5.0,
-            "E": -5.0,
-            "G": -5.0,
-            "H": -5.0,
-            "I": -5.0,
-            "L": -5.0,
-            "K": -5.0,
-            "M": -5.0,
-            "F": -5.0,
-            "P": -5.0,
-            "S": -5.0,
-            "T": -5.0,
-            "W": -5.0,
-            "Y": -5.0,
-            "V": -5.0,
-            "B": -5.0,
-            "J": -5.0,
-            "Z": -5.0,
-            "X": -5.0,
-            "*": 1.0,
-        },
-    },
-    62: {
-        "A": {
-            "A": 4.0,
-            "R": -1.0,
-            "N": -2.0,
-            "D": -2.0,
-            "C": 0.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": 0.0,
-            "H": -2.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -2.0,
-            "P": -1.0,
-            "S": 1.0,
-            "T": 0.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": 0.0,
-            "B": -2.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "R": {
-            "A": -1.0,
-            "R": 5.0,
-            "N": 0.0,
-            "D": -2.0,
-            "C": -3.0,
-            "Q": 1.0,
-            "E": 0.0,
-            "G": -2.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": 2.0,
-            "M": -1.0,
-            "F": -3.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": -1.0,
-            "J": -2.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "N": {
-            "A": -2.0,
-            "R": 0.0,
-            "N": 6.0,
-            "D": 1.0,
-            "C": -3.0,
-            "Q": 0.0,
-            "E": 0.0,
-            "G": 0.0,
-            "H": 1.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 0.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -2.0,
-            "S": 1.0,
-            "T": 0.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 4.0,
-            "J": -3.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "D": {
-            "A": -2.0,
-            "R": -2.0,
-            "N": 1.0,
-            "D": 6.0,
-            "C": -3.0,
-            "Q": 0.0,
-            "E": 2.0,
-            "G": -1.0,
-            "H": -1.0,
-            "I": -3.0,
-            "L": -4.0,
-            "K": -1.0,
-            "M": -3.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": 4.0,
-            "J": -3.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "C": {
-            "A": 0.0,
-            "R": -3.0,
-            "N": -3.0,
-            "D": -3.0,
-            "C": 9.0,
-            "Q": -3.0,
-            "E": -4.0,
-            "G": -3.0,
-            "H": -3.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -3.0,
-            "M": -1.0,
-            "F": -2.0,
-            "P": -3.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -2.0,
-            "V": -1.0,
-            "B": -3.0,
-            "J": -1.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "Q": {
-            "A": -1.0,
-            "R": 1.0,
-            "N": 0.0,
-            "D": 0.0,
-            "C": -3.0,
-            "Q": 5.0,
-            "E": 2.0,
-            "G": -2.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": 1.0,
-            "M": 0.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -1.0,
-            "V": -2.0,
-            "B": 0.0,
-            "J": -2.0,
-            "Z": 4.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "E": {
-            "A": -1.0,
-            "R": 0.0,
-            "N": 0.0,
-            "D": 2.0,
-            "C": -4.0,
-            "Q": 2.0,
-            "E": 5.0,
-            "G": -2.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 1.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": -2.0,
-            "B": 1.0,
-            "J": -3.0,
-            "Z": 4.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "G": {
-            "A": 0.0,
-            "R": -2.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -3.0,
-            "Q": -2.0,
-            "E": -2.0,
-            "G": 6.0,
-            "H": -2.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": -2.0,
-            "M": -3.0,
-            "F": -3.0,
-            "P": -2.0,
-            "S": 0.0,
-            "T": -2.0,
-            "W": -2.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": -1.0,
-            "J": -4.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "H": {
-            "A": -2.0,
-            "R": 0.0,
-            "N": 1.0,
-            "D": -1.0,
-            "C": -3.0,
-            "Q": 0.0,
-            "E": 0.0,
-            "G": -2.0,
-            "H": 8.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": -1.0,
-            "M": -2.0,
-            "F": -1.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -2.0,
-            "W": -2.0,
-            "Y": 2.0,
-            "V": -3.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "I": {
-            "A": -1.0,
-            "R": -3.0,
-            "N": -3.0,
-            "D": -3.0,
-            "C": -1.0,
-            "Q": -3.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -3.0,
-            "I": 4.0,
-            "L": 2.0,
-            "K": -3.0,
-            "M": 1.0,
-            "F": 0.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -1.0,
-            "V": 3.0,
-            "B": -3.0,
-            "J": 3.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "L": {
-            "A": -1.0,
-            "R": -2.0,
-            "N": -3.0,
-            "D": -4.0,
-            "C": -1.0,
-            "Q": -2.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -3.0,
-            "I": 2.0,
-            "L": 4.0,
-            "K": -2.0,
-            "M": 2.0,
-            "F": 0.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -1.0,
-            "V": 1.0,
-            "B": -4.0,
-            "J": 3.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "K": {
-            "A": -1.0,
-            "R": 2.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -3.0,
-            "Q": 1.0,
-            "E": 1.0,
-            "G": -2.0,
-            "H": -1.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": 5.0,
-            "M": -1.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": -2.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "M": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": -2.0,
-            "D": -3.0,
-            "C": -1.0,
-            "Q": 0.0,
-            "E": -2.0,
-            "G": -3.0,
-            "H": -2.0,
-            "I": 1.0,
-            "L": 2.0,
-            "K": -1.0,
-            "M": 5.0,
-            "F": 0.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -1.0,
-            "Y": -1.0,
-            "V": 1.0,
-            "B": -3.0,
-            "J": 2.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "F": {
-            "A": -2.0,
-            "R": -3.0,
-            "N": -3.0,
-            "D": -3.0,
-            "C": -2.0,
-            "Q": -3.0,
-            "E": -3.0,
-            "G": -3.0,
-            "H": -1.0,
-            "I": 0.0,
-            "L": 0.0,
-            "K": -3.0,
-            "M": 0.0,
-            "F": 6.0,
-            "P": -4.0,
-            "S": -2.0,
-            "T": -2.0,
-            "W": 1.0,
-            "Y": 3.0,
-            "V": -1.0,
-            "B": -3.0,
-            "J": 0.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "P": {
-            "A": -1.0,
-            "R": -2.0,
-            "N": -2.0,
-            "D": -1.0,
-            "C": -3.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -2.0,
-            "H": -2.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": -1.0,
-            "M": -2.0,
-            "F": -4.0,
-            "P": 7.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -2.0,
-            "B": -2.0,
-            "J": -3.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "S": {
-            "A": 1.0,
-            "R": -1.0,
-            "N": 1.0,
-            "D": 0.0,
-            "C": -1.0,
-            "Q": 0.0,
-            "E": 0.0,
-            "G": 0.0,
-            "H": -1.0,
-            "I": -2.0,
-            "L": -2.0,
-            "K": 0.0,
-            "M": -1.0,
-            "F": -2.0,
-            "P": -1.0,
-            "S": 4.0,
-            "T": 1.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": -2.0,
-            "B": 0.0,
-            "J": -2.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "T": {
-            "A": 0.0,
-            "R": -1.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -2.0,
-            "H": -2.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -2.0,
-            "P": -1.0,
-            "S": 1.0,
-            "T": 5.0,
-            "W": -2.0,
-            "Y": -2.0,
-            "V": 0.0,
-            "B": -1.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "W": {
-            "A": -3.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -4.0,
-            "C": -2.0,
-            "Q": -2.0,
-            "E": -3.0,
-            "G": -2.0,
-            "H": -2.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": -3.0,
-            "M": -1.0,
-            "F": 1.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -2.0,
-            "W": 11.0,
-            "Y": 2.0,
-            "V": -3.0,
-            "B": -4.0,
-            "J": -2.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "Y": {
-            "A": -2.0,
-            "R": -2.0,
-            "N": -2.0,
-            "D": -3.0,
-            "C": -2.0,
-            "Q": -1.0,
-            "E": -2.0,
-            "G": -3.0,
-            "H": 2.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -2.0,
-            "M": -1.0,
-            "F": 3.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -2.0,
-            "W": 2.0,
-            "Y": 7.0,
-            "V": -1.0,
-            "B": -3.0,
-            "J": -1.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "V": {
-            "A": 0.0,
-            "R": -3.0,
-            "N": -3.0,
-            "D": -3.0,
-            "C": -1.0,
-            "Q": -2.0,
-            "E": -2.0,
-            "G": -3.0,
-            "H": -3.0,
-            "I": 3.0,
-            "L": 1.0,
-            "K": -2.0,
-            "M": 1.0,
-            "F": -1.0,
-            "P": -2.0,
-            "S": -2.0,
-            "T": 0.0,
-            "W": -3.0,
-            "Y": -1.0,
-            "V": 4.0,
-            "B": -3.0,
-            "J": 2.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "B": {
-            "A": -2.0,
-            "R": -1.0,
-            "N": 4.0,
-            "D": 4.0,
-            "C": -3.0,
-            "Q": 0.0,
-            "E": 1.0,
-            "G": -1.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -4.0,
-            "K": 0.0,
-            "M": -3.0,
-            "F": -3.0,
-            "P": -2.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": 4.0,
-            "J": -3.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "J": {
-            "A": -1.0,
-            "R": -2.0,
-            "N": -3.0,
-            "D": -3.0,
-            "C": -1.0,
-            "Q": -2.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -3.0,
-            "I": 3.0,
-            "L": 3.0,
-            "K": -3.0,
-            "M": 2.0,
-            "F": 0.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -1.0,
-            "V": 2.0,
-            "B": -3.0,
-            "J": 3.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "Z": {
-            "A": -1.0,
-            "R": 0.0,
-            "N": 0.0,
-            "D": 1.0,
-            "C": -3.0,
-            "Q": 4.0,
-            "E": 4.0,
-            "G": -2.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 1.0,
-            "M": -1.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -2.0,
-            "V": -2.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 4.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "X": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": -1.0,
-            "D": -1.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -1.0,
-            "H": -1.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -1.0,
-            "P": -1.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -1.0,
-            "Y": -1.0,
-            "V": -1.0,
-            "B": -1.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -4.0,
-        },
-        "*": {
-            "A": -4.0,
-            "R": -4.0,
-            "N": -4.0,
-            "D": -4.0,
-            "C": -4.0,
-            "Q": -4.0,
-            "E": -4.0,
-            "G": -4.0,
-            "H": -4.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": -4.0,
-            "M": -4.0,
-            "F": -4.0,
-            "P": -4.0,
-            "S": -4.0,
-            "T": -4.0,
-            "W": -4.0,
-            "Y": -4.0,
-            "V": -4.0,
-            "B": -4.0,
-            "J": -4.0,
-            "Z": -4.0,
-            "X": -4.0,
-            "*": 1.0,
-        },
-    },
-    80: {
-        "A": {
-            "A": 5.0,
-            "R": -2.0,
-            "N": -2.0,
-            "D": -2.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": 0.0,
-            "H": -2.0,
-            "I": -2.0,
-            "L": -2.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 1.0,
-            "T": 0.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": 0.0,
-            "B": -2.0,
-            "J": -2.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "R": {
-            "A": -2.0,
-            "R": 6.0,
-            "N": -1.0,
-            "D": -2.0,
-            "C": -4.0,
-            "Q": 1.0,
-            "E": -1.0,
-            "G": -3.0,
-            "H": 0.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 2.0,
-            "M": -2.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": -1.0,
-            "J": -3.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "N": {
-            "A": -2.0,
-            "R": -1.0,
-            "N": 6.0,
-            "D": 1.0,
-            "C": -3.0,
-            "Q": 0.0,
-            "E": -1.0,
-            "G": -1.0,
-            "H": 0.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": 0.0,
-            "M": -3.0,
-            "F": -4.0,
-            "P": -3.0,
-            "S": 0.0,
-            "T": 0.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -4.0,
-            "B": 5.0,
-            "J": -4.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "D": {
-            "A": -2.0,
-            "R": -2.0,
-            "N": 1.0,
-            "D": 6.0,
-            "C": -4.0,
-            "Q": -1.0,
-            "E": 1.0,
-            "G": -2.0,
-            "H": -2.0,
-            "I": -4.0,
-            "L": -5.0,
-            "K": -1.0,
-            "M": -4.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -6.0,
-            "Y": -4.0,
-            "V": -4.0,
-            "B": 5.0,
-            "J": -5.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "C": {
-            "A": -1.0,
-            "R": -4.0,
-            "N": -3.0,
-            "D": -4.0,
-            "C": 9.0,
-            "Q": -4.0,
-            "E": -5.0,
-            "G": -4.0,
-            "H": -4.0,
-            "I": -2.0,
-            "L": -2.0,
-            "K": -4.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -4.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -3.0,
-            "V": -1.0,
-            "B": -4.0,
-            "J": -2.0,
-            "Z": -4.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "Q": {
-            "A": -1.0,
-            "R": 1.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -4.0,
-            "Q": 6.0,
-            "E": 2.0,
-            "G": -2.0,
-            "H": 1.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 1.0,
-            "M": 0.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": -3.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 4.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "E": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": -1.0,
-            "D": 1.0,
-            "C": -5.0,
-            "Q": 2.0,
-            "E": 6.0,
-            "G": -3.0,
-            "H": 0.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": 1.0,
-            "M": -2.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": 1.0,
-            "J": -4.0,
-            "Z": 5.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "G": {
-            "A": 0.0,
-            "R": -3.0,
-            "N": -1.0,
-            "D": -2.0,
-            "C": -4.0,
-            "Q": -2.0,
-            "E": -3.0,
-            "G": 6.0,
-            "H": -3.0,
-            "I": -5.0,
-            "L": -4.0,
-            "K": -2.0,
-            "M": -4.0,
-            "F": -4.0,
-            "P": -3.0,
-            "S": -1.0,
-            "T": -2.0,
-            "W": -4.0,
-            "Y": -4.0,
-            "V": -4.0,
-            "B": -1.0,
-            "J": -5.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "H": {
-            "A": -2.0,
-            "R": 0.0,
-            "N": 0.0,
-            "D": -2.0,
-            "C": -4.0,
-            "Q": 1.0,
-            "E": 0.0,
-            "G": -3.0,
-            "H": 8.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": -1.0,
-            "M": -2.0,
-            "F": -2.0,
-            "P": -3.0,
-            "S": -1.0,
-            "T": -2.0,
-            "W": -3.0,
-            "Y": 2.0,
-            "V": -4.0,
-            "B": -1.0,
-            "J": -4.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "I": {
-            "A": -2.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -4.0,
-            "C": -2.0,
-            "Q": -3.0,
-            "E": -4.0,
-            "G": -5.0,
-            "H": -4.0,
-            "I": 5.0,
-            "L": 1.0,
-            "K": -3.0,
-            "M": 1.0,
-            "F": -1.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": 3.0,
-            "B": -4.0,
-            "J": 3.0,
-            "Z": -4.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "L": {
-            "A": -2.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -5.0,
-            "C": -2.0,
-            "Q": -3.0,
-            "E": -4.0,
-            "G": -4.0,
-            "H": -3.0,
-            "I": 1.0,
-            "L": 4.0,
-            "K": -3.0,
-            "M": 2.0,
-            "F": 0.0,
-            "P": -3.0,
-            "S": -3.0,
-            "T": -2.0,
-            "W": -2.0,
-            "Y": -2.0,
-            "V": 1.0,
-            "B": -4.0,
-            "J": 3.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "K": {
-            "A": -1.0,
-            "R": 2.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -4.0,
-            "Q": 1.0,
-            "E": 1.0,
-            "G": -2.0,
-            "H": -1.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": 5.0,
-            "M": -2.0,
-            "F": -4.0,
-            "P": -1.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": -1.0,
-            "J": -3.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "M": {
-            "A": -1.0,
-            "R": -2.0,
-            "N": -3.0,
-            "D": -4.0,
-            "C": -2.0,
-            "Q": 0.0,
-            "E": -2.0,
-            "G": -4.0,
-            "H": -2.0,
-            "I": 1.0,
-            "L": 2.0,
-            "K": -2.0,
-            "M": 6.0,
-            "F": 0.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -2.0,
-            "V": 1.0,
-            "B": -3.0,
-            "J": 2.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "F": {
-            "A": -3.0,
-            "R": -4.0,
-            "N": -4.0,
-            "D": -4.0,
-            "C": -3.0,
-            "Q": -4.0,
-            "E": -4.0,
-            "G": -4.0,
-            "H": -2.0,
-            "I": -1.0,
-            "L": 0.0,
-            "K": -4.0,
-            "M": 0.0,
-            "F": 6.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -2.0,
-            "W": 0.0,
-            "Y": 3.0,
-            "V": -1.0,
-            "B": -4.0,
-            "J": 0.0,
-            "Z": -4.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "P": {
-            "A": -1.0,
-            "R": -2.0,
-            "N": -3.0,
-            "D": -2.0,
-            "C": -4.0,
-            "Q": -2.0,
-            "E": -2.0,
-            "G": -3.0,
-            "H": -3.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": -1.0,
-            "M": -3.0,
-            "F": -4.0,
-            "P": 8.0,
-            "S": -1.0,
-            "T": -2.0,
-            "W": -5.0,
-            "Y": -4.0,
-            "V": -3.0,
-            "B": -2.0,
-            "J": -4.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "S": {
-            "A": 1.0,
-            "R": -1.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -2.0,
-            "Q": 0.0,
-            "E": 0.0,
-            "G": -1.0,
-            "H": -1.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": -1.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 5.0,
-            "T": 1.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": -2.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "T": {
-            "A": 0.0,
-            "R": -1.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -2.0,
-            "H": -2.0,
-            "I": -1.0,
-            "L": -2.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -2.0,
-            "P": -2.0,
-            "S": 1.0,
-            "T": 5.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": 0.0,
-            "B": -1.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "W": {
-            "A": -3.0,
-            "R": -4.0,
-            "N": -4.0,
-            "D": -6.0,
-            "C": -3.0,
-            "Q": -3.0,
-            "E": -4.0,
-            "G": -4.0,
-            "H": -3.0,
-            "I": -3.0,
-            "L": -2.0,
-            "K": -4.0,
-            "M": -2.0,
-            "F": 0.0,
-            "P": -5.0,
-            "S": -4.0,
-            "T": -4.0,
-            "W": 11.0,
-            "Y": 2.0,
-            "V": -3.0,
-            "B": -5.0,
-            "J": -3.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "Y": {
-            "A": -2.0,
-            "R": -3.0,
-            "N": -3.0,
-            "D": -4.0,
-            "C": -3.0,
-            "Q": -2.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": 2.0,
-            "I": -2.0,
-            "L": -2.0,
-            "K": -3.0,
-            "M": -2.0,
-            "F": 3.0,
-            "P": -4.0,
-            "S": -2.0,
-            "T": -2.0,
-            "W": 2.0,
-            "Y": 7.0,
-            "V": -2.0,
-            "B": -3.0,
-            "J": -2.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "V": {
-            "A": 0.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -4.0,
-            "C": -1.0,
-            "Q": -3.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -4.0,
-            "I": 3.0,
-            "L": 1.0,
-            "K": -3.0,
-            "M": 1.0,
-            "F": -1.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": 0.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": 4.0,
-            "B": -4.0,
-            "J": 2.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "B": {
-            "A": -2.0,
-            "R": -1.0,
-            "N": 5.0,
-            "D": 5.0,
-            "C": -4.0,
-            "Q": 0.0,
-            "E": 1.0,
-            "G": -1.0,
-            "H": -1.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": -1.0,
-            "M": -3.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -5.0,
-            "Y": -3.0,
-            "V": -4.0,
-            "B": 5.0,
-            "J": -4.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "J": {
-            "A": -2.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -5.0,
-            "C": -2.0,
-            "Q": -3.0,
-            "E": -4.0,
-            "G": -5.0,
-            "H": -4.0,
-            "I": 3.0,
-            "L": 3.0,
-            "K": -3.0,
-            "M": 2.0,
-            "F": 0.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": 2.0,
-            "B": -4.0,
-            "J": 3.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "Z": {
-            "A": -1.0,
-            "R": 0.0,
-            "N": 0.0,
-            "D": 1.0,
-            "C": -4.0,
-            "Q": 4.0,
-            "E": 5.0,
-            "G": -3.0,
-            "H": 0.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": 1.0,
-            "M": -1.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": 5.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "X": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": -1.0,
-            "D": -1.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -1.0,
-            "H": -1.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -1.0,
-            "P": -1.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -1.0,
-            "Y": -1.0,
-            "V": -1.0,
-            "B": -1.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "*": {
-            "A": -6.0,
-            "R": -6.0,
-            "N": -6.0,
-            "D": -6.0,
-            "C": -6.0,
-            "Q": -6.0,
-            "E": -6.0,
-            "G": -6.0,
-            "H": -6.0,
-            "I": -6.0,
-            "L": -6.0,
-            "K": -6.0,
-            "M": -6.0,
-            "F": -6.0,
-            "P": -6.0,
-            "S": -6.0,
-            "T": -6.0,
-            "W": -6.0,
-            "Y": -6.0,
-            "V": -6.0,
-            "B": -6.0,
-            "J": -6.0,
-            "Z": -6.0,
-            "X": -6.0,
-            "*": 1.0,
-        },
-    },
-    90: {
-        "A": {
-            "A": 5.0,
-            "R": -2.0,
-            "N": -2.0,
-            "D": -3.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": 0.0,
-            "H": -2.0,
-            "I": -2.0,
-            "L": -2.0,
-            "K": -1.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -1.0,
-            "S": 1.0,
-            "T": 0.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -1.0,
-            "B": -2.0,
-            "J": -2.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "R": {
-            "A": -2.0,
-            "R": 6.0,
-            "N": -1.0,
-            "D": -3.0,
-            "C": -5.0,
-            "Q": 1.0,
-            "E": -1.0,
-            "G": -3.0,
-            "H": 0.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": 2.0,
-            "M": -2.0,
-            "F": -4.0,
-            "P": -3.0,
-            "S": -1.0,
-            "T": -2.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": -2.0,
-            "J": -3.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "N": {
-            "A": -2.0,
-            "R": -1.0,
-            "N": 7.0,
-            "D": 1.0,
-            "C": -4.0,
-            "Q": 0.0,
-            "E": -1.0,
-            "G": -1.0,
-            "H": 0.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": 0.0,
-            "M": -3.0,
-            "F": -4.0,
-            "P": -3.0,
-            "S": 0.0,
-            "T": 0.0,
-            "W": -5.0,
-            "Y": -3.0,
-            "V": -4.0,
-            "B": 5.0,
-            "J": -4.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "D": {
-            "A": -3.0,
-            "R": -3.0,
-            "N": 1.0,
-            "D": 7.0,
-            "C": -5.0,
-            "Q": -1.0,
-            "E": 1.0,
-            "G": -2.0,
-            "H": -2.0,
-            "I": -5.0,
-            "L": -5.0,
-            "K": -1.0,
-            "M": -4.0,
-            "F": -5.0,
-            "P": -3.0,
-            "S": -1.0,
-            "T": -2.0,
-            "W": -6.0,
-            "Y": -4.0,
-            "V": -5.0,
-            "B": 5.0,
-            "J": -5.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "C": {
-            "A": -1.0,
-            "R": -5.0,
-            "N": -4.0,
-            "D": -5.0,
-            "C": 9.0,
-            "Q": -4.0,
-            "E": -6.0,
-            "G": -4.0,
-            "H": -5.0,
-            "I": -2.0,
-            "L": -2.0,
-            "K": -4.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -4.0,
-            "S": -2.0,
-            "T": -2.0,
-            "W": -4.0,
-            "Y": -4.0,
-            "V": -2.0,
-            "B": -4.0,
-            "J": -2.0,
-            "Z": -5.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "Q": {
-            "A": -1.0,
-            "R": 1.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -4.0,
-            "Q": 7.0,
-            "E": 2.0,
-            "G": -3.0,
-            "H": 1.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": 1.0,
-            "M": 0.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": -1.0,
-            "J": -3.0,
-            "Z": 5.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "E": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": -1.0,
-            "D": 1.0,
-            "C": -6.0,
-            "Q": 2.0,
-            "E": 6.0,
-            "G": -3.0,
-            "H": -1.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": 0.0,
-            "M": -3.0,
-            "F": -5.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -5.0,
-            "Y": -4.0,
-            "V": -3.0,
-            "B": 1.0,
-            "J": -4.0,
-            "Z": 5.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "G": {
-            "A": 0.0,
-            "R": -3.0,
-            "N": -1.0,
-            "D": -2.0,
-            "C": -4.0,
-            "Q": -3.0,
-            "E": -3.0,
-            "G": 6.0,
-            "H": -3.0,
-            "I": -5.0,
-            "L": -5.0,
-            "K": -2.0,
-            "M": -4.0,
-            "F": -5.0,
-            "P": -3.0,
-            "S": -1.0,
-            "T": -3.0,
-            "W": -4.0,
-            "Y": -5.0,
-            "V": -5.0,
-            "B": -2.0,
-            "J": -5.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "H": {
-            "A": -2.0,
-            "R": 0.0,
-            "N": 0.0,
-            "D": -2.0,
-            "C": -5.0,
-            "Q": 1.0,
-            "E": -1.0,
-            "G": -3.0,
-            "H": 8.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": -1.0,
-            "M": -3.0,
-            "F": -2.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -2.0,
-            "W": -3.0,
-            "Y": 1.0,
-            "V": -4.0,
-            "B": -1.0,
-            "J": -4.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "I": {
-            "A": -2.0,
-            "R": -4.0,
-            "N": -4.0,
-            "D": -5.0,
-            "C": -2.0,
-            "Q": -4.0,
-            "E": -4.0,
-            "G": -5.0,
-            "H": -4.0,
-            "I": 5.0,
-            "L": 1.0,
-            "K": -4.0,
-            "M": 1.0,
-            "F": -1.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -1.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": 3.0,
-            "B": -5.0,
-            "J": 3.0,
-            "Z": -4.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "L": {
-            "A": -2.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -5.0,
-            "C": -2.0,
-            "Q": -3.0,
-            "E": -4.0,
-            "G": -5.0,
-            "H": -4.0,
-            "I": 1.0,
-            "L": 5.0,
-            "K": -3.0,
-            "M": 2.0,
-            "F": 0.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -2.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": 0.0,
-            "B": -5.0,
-            "J": 4.0,
-            "Z": -4.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "K": {
-            "A": -1.0,
-            "R": 2.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -4.0,
-            "Q": 1.0,
-            "E": 0.0,
-            "G": -2.0,
-            "H": -1.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": 6.0,
-            "M": -2.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -5.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": -1.0,
-            "J": -3.0,
-            "Z": 1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "M": {
-            "A": -2.0,
-            "R": -2.0,
-            "N": -3.0,
-            "D": -4.0,
-            "C": -2.0,
-            "Q": 0.0,
-            "E": -3.0,
-            "G": -4.0,
-            "H": -3.0,
-            "I": 1.0,
-            "L": 2.0,
-            "K": -2.0,
-            "M": 7.0,
-            "F": -1.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -2.0,
-            "Y": -2.0,
-            "V": 0.0,
-            "B": -4.0,
-            "J": 2.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "F": {
-            "A": -3.0,
-            "R": -4.0,
-            "N": -4.0,
-            "D": -5.0,
-            "C": -3.0,
-            "Q": -4.0,
-            "E": -5.0,
-            "G": -5.0,
-            "H": -2.0,
-            "I": -1.0,
-            "L": 0.0,
-            "K": -4.0,
-            "M": -1.0,
-            "F": 7.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -3.0,
-            "W": 0.0,
-            "Y": 3.0,
-            "V": -2.0,
-            "B": -4.0,
-            "J": 0.0,
-            "Z": -4.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "P": {
-            "A": -1.0,
-            "R": -3.0,
-            "N": -3.0,
-            "D": -3.0,
-            "C": -4.0,
-            "Q": -2.0,
-            "E": -2.0,
-            "G": -3.0,
-            "H": -3.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": -2.0,
-            "M": -3.0,
-            "F": -4.0,
-            "P": 8.0,
-            "S": -2.0,
-            "T": -2.0,
-            "W": -5.0,
-            "Y": -4.0,
-            "V": -3.0,
-            "B": -3.0,
-            "J": -4.0,
-            "Z": -2.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "S": {
-            "A": 1.0,
-            "R": -1.0,
-            "N": 0.0,
-            "D": -1.0,
-            "C": -2.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -1.0,
-            "H": -2.0,
-            "I": -3.0,
-            "L": -3.0,
-            "K": -1.0,
-            "M": -2.0,
-            "F": -3.0,
-            "P": -2.0,
-            "S": 5.0,
-            "T": 1.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -2.0,
-            "B": 0.0,
-            "J": -3.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "T": {
-            "A": 0.0,
-            "R": -2.0,
-            "N": 0.0,
-            "D": -2.0,
-            "C": -2.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -3.0,
-            "H": -2.0,
-            "I": -1.0,
-            "L": -2.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -3.0,
-            "P": -2.0,
-            "S": 1.0,
-            "T": 6.0,
-            "W": -4.0,
-            "Y": -2.0,
-            "V": -1.0,
-            "B": -1.0,
-            "J": -2.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "W": {
-            "A": -4.0,
-            "R": -4.0,
-            "N": -5.0,
-            "D": -6.0,
-            "C": -4.0,
-            "Q": -3.0,
-            "E": -5.0,
-            "G": -4.0,
-            "H": -3.0,
-            "I": -4.0,
-            "L": -3.0,
-            "K": -5.0,
-            "M": -2.0,
-            "F": 0.0,
-            "P": -5.0,
-            "S": -4.0,
-            "T": -4.0,
-            "W": 11.0,
-            "Y": 2.0,
-            "V": -3.0,
-            "B": -6.0,
-            "J": -3.0,
-            "Z": -4.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "Y": {
-            "A": -3.0,
-            "R": -3.0,
-            "N": -3.0,
-            "D": -4.0,
-            "C": -4.0,
-            "Q": -3.0,
-            "E": -4.0,
-            "G": -5.0,
-            "H": 1.0,
-            "I": -2.0,
-            "L": -2.0,
-            "K": -3.0,
-            "M": -2.0,
-            "F": 3.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -2.0,
-            "W": 2.0,
-            "Y": 8.0,
-            "V": -3.0,
-            "B": -4.0,
-            "J": -2.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "V": {
-            "A": -1.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -5.0,
-            "C": -2.0,
-            "Q": -3.0,
-            "E": -3.0,
-            "G": -5.0,
-            "H": -4.0,
-            "I": 3.0,
-            "L": 0.0,
-            "K": -3.0,
-            "M": 0.0,
-            "F": -2.0,
-            "P": -3.0,
-            "S": -2.0,
-            "T": -1.0,
-            "W": -3.0,
-            "Y": -3.0,
-            "V": 5.0,
-            "B": -4.0,
-            "J": 1.0,
-            "Z": -3.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "B": {
-            "A": -2.0,
-            "R": -2.0,
-            "N": 5.0,
-            "D": 5.0,
-            "C": -4.0,
-            "Q": -1.0,
-            "E": 1.0,
-            "G": -2.0,
-            "H": -1.0,
-            "I": -5.0,
-            "L": -5.0,
-            "K": -1.0,
-            "M": -4.0,
-            "F": -4.0,
-            "P": -3.0,
-            "S": 0.0,
-            "T": -1.0,
-            "W": -6.0,
-            "Y": -4.0,
-            "V": -4.0,
-            "B": 5.0,
-            "J": -5.0,
-            "Z": 0.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "J": {
-            "A": -2.0,
-            "R": -3.0,
-            "N": -4.0,
-            "D": -5.0,
-            "C": -2.0,
-            "Q": -3.0,
-            "E": -4.0,
-            "G": -5.0,
-            "H": -4.0,
-            "I": 3.0,
-            "L": 4.0,
-            "K": -3.0,
-            "M": 2.0,
-            "F": 0.0,
-            "P": -4.0,
-            "S": -3.0,
-            "T": -2.0,
-            "W": -3.0,
-            "Y": -2.0,
-            "V": 1.0,
-            "B": -5.0,
-            "J": 4.0,
-            "Z": -4.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "Z": {
-            "A": -1.0,
-            "R": 0.0,
-            "N": -1.0,
-            "D": 1.0,
-            "C": -5.0,
-            "Q": 5.0,
-            "E": 5.0,
-            "G": -3.0,
-            "H": 0.0,
-            "I": -4.0,
-            "L": -4.0,
-            "K": 1.0,
-            "M": -2.0,
-            "F": -4.0,
-            "P": -2.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -4.0,
-            "Y": -3.0,
-            "V": -3.0,
-            "B": 0.0,
-            "J": -4.0,
-            "Z": 5.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "X": {
-            "A": -1.0,
-            "R": -1.0,
-            "N": -1.0,
-            "D": -1.0,
-            "C": -1.0,
-            "Q": -1.0,
-            "E": -1.0,
-            "G": -1.0,
-            "H": -1.0,
-            "I": -1.0,
-            "L": -1.0,
-            "K": -1.0,
-            "M": -1.0,
-            "F": -1.0,
-            "P": -1.0,
-            "S": -1.0,
-            "T": -1.0,
-            "W": -1.0,
-            "Y": -1.0,
-            "V": -1.0,
-            "B": -1.0,
-            "J": -1.0,
-            "Z": -1.0,
-            "X": -1.0,
-            "*": -6.0,
-        },
-        "*": {
-            "A": -6.0,
-            "R": -6.0,
-            "N": -6.0,
-            "D": -6.0,
-            "C": -6.0,
-            "Q": -6.0,
-            "E": -6.0,
-            "G": -6.0,
-            "H": -6.0,
-            "I": -6.0,
-            "L": -6.0,
-            "K": -6.0,
-            "M": -6.0,
-            "F": -6.0,
-            "P": -6.0,
-            "S": -6.0,
-            "T": -6.0,
-            "W": -6.0,
-            "Y": -6.0,
-            "V": -6.0,
-            "B": -6.0,
-            "J": -6.0,
-            "Z": -6.0,
-            "X": -6.0,
-            "*": 1.0,
-        },
-    },
+LABELS = "ARNDCQEGHILKMFPSTWYVBJZX*"
+
+# fmt: off
+PACKED: Dict[int, Tuple[str, str]] = {
+    45: (
+        LABELS,
+        "05fefffeffffff00fefffffffffeff0100fefe00fffffffffb"  # A
+        "fe0700fffd0100fe00fdfe03fffefefffffefffefffd01fffb"  # R
+        "ff000602fe00000001fefd00fefefe0100fcfefd05fd00fffb"  # N
+        "feff0207fd0002ff00fcfd00fdfcff00fffcfefd06fd01fffb"  # D
+        "fffdfefd0cfdfdfdfdfdfefdfefefcfffffbfdfffefefdfffb"  # C
+        "ff010000fd0602fe01fefe0100fcff00fffefffd00fe04fffb"  # Q
+        "ff000002fd0206fe00fdfe01fefd0000fffdfefd01fd05fffb"  # E
+        "00fe00fffdfefe07fefcfdfefefdfe00fefefdfdfffcfefffb"  # G
+        "fe000100fd0100fe0afdfeff00fefefffefd02fd00fe00fffb"  # H
+        "fffdfefcfdfefdfcfd0502fd0200fefefffe0003fd04fdfffb"  # I
+        "fffefdfdfefefefdfe0205fd0201fdfdfffe0001fd04fefffb"  # L
+        "ff030000fd0101fefffdfd05fffdfffffffefffe00fd01fffb"  # K
+        "fffffefdfe00fefe000202ff0600fefefffe0001fe02fffffb"  # M
+        "fefefefcfefcfdfdfe0001fd0008fdfeff010300fd01fdfffb"  # F
+        "fffefefffcff00fefefefdfffefd09fffffdfdfdfefdfffffb"  # P
+        "01ff0100ff000000fffefdfffefeff0402fcfeff00fe00fffb"  # S
+        "00ff00fffffffffefeffffffffffff0205fdff0000fffffffb"  # T
+        "fefefcfcfbfefdfefdfefefefe01fdfcfd0f03fdfcfefefffb"  # W
+        "fefffefefdfffefd020000ff0003fdfeff0308fffe00fefffb"  # Y
+        "00fefdfdfffdfdfdfd0301fe0100fdff00fdff05fd02fdfffb"  # V
+        "ffff0506fe0001ff00fdfd00fefdfe0000fcfefd05fd01fffb"  # B
+        "fffdfdfdfefefdfcfe0404fd0201fdfefffe0002fd04fefffb"  # J
+        "ff010001fd0405fe00fdfe01fffdff00fffefefd01fe05fffb"  # Z
+        "fffffffffffffffffffffffffffffffffffffffffffffffffb"  # X
+        "fbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfb01"  # *
+    ),
+    50: (
+        LABELS,
+        "05fefffeffffff00fefffefffffdff0100fdfe00fefefffffb"  # A
+        "fe07fffefc0100fd00fcfd03fefdfdfffffdfffdfffd00fffb"  # R
+        "ffff0702fe00000001fdfc00fefcfe0100fcfefd05fc00fffb"  # N
+        "fefe0208fc0002fffffcfcfffcfbff00fffbfdfc06fc01fffb"  # D
+        "fffcfefc0dfdfdfdfdfefefdfefefcfffffbfdfffdfefdfffb"  # C
+        "ff010000fd0702fe01fdfe0200fcff00fffffffd00fd04fffb"  # Q
+        "ff000002fd0206fd00fcfd01fefdfffffffdfefd01fd05fffb"  # E
+        "00fd00fffdfefd08fefcfcfefdfcfe00fefdfdfcfffcfefffb"  # G
+        "fe0001fffd0100fe0afcfd00fffffefffefd02fc00fd00fffb"  # H
+        "fffcfdfcfefdfcfcfc0502fd0200fdfdfffdff04fc04fdfffb"  # I
+        "fefdfcfcfefefdfcfd0205fd0301fcfdfffeff01fc04fdfffb"  # L
+        "ff0300fffd0201fe00fdfd06fefcff00fffdfefd00fd01fffb"  # K
+        "fffefefcfe00fefdff0203fe0700fdfeffff0001fd02fffffb"  # M
+        "fdfdfcfbfefcfdfcff0001fc0008fcfdfe0104fffc01fcfffb"  # F
+        "fffdfefffcfffffefefdfcfffdfc0afffffcfdfdfefdfffffb"  # P
+        "01ff0100ff00ff00fffdfd00fefdff0502fcfefe00fd00fffb"  # S
+        "00ff00fffffffffefefffffffffeff0205fdfe0000fffffffb"  # T
+        "fdfdfcfbfbfffdfdfdfdfefdff01fcfcfd0f02fdfbfefefffb"  # W
+        "fefffefdfdfffefd02fffffe0004fdfefe0208fffdfffefffb"  # Y
+        "00fdfdfcfffdfdfcfc0401fd01fffdfe00fdff05fd02fdfffb"  # V
+        "feff0506fd0001ff00fcfc00fdfcfe0000fbfdfd06fc01fffb"  # B
+        "fefdfcfcfefdfdfcfd0404fd0201fdfdfffeff02fc04fdfffb"  # J
+        "ff000001fd0405fe00fdfd01fffcff00fffefefd01fd05fffb"  # Z
+        "fffffffffffffffffffffffffffffffffffffffffffffffffb"  # X
+        "fbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfbfb01"  # *
+    ),
+    62: (
+        LABELS,
+        "04fffefe00ffff00fefffffffffeff0100fdfe00fefffffffc"  # A
+        "ff0500fefd0100fe00fdfe02fffdfefffffdfefdfffe00fffc"  # R
+        "fe000601fd00000001fdfd00fefdfe0100fcfefd04fd00fffc"  # N
+        "fefe0106fd0002fffffdfcfffdfdff00fffcfdfd04fd01fffc"  # D
+        "00fdfdfd09fdfcfdfdfffffdfffefdfffffefefffdfffdfffc"  # C
+        "ff010000fd0502fe00fdfe0100fdff00fffefffe00fe04fffc"  # Q
+        "ff000002fc0205fe00fdfd01fefdff00fffdfefe01fd04fffc"  # E
+        "00fe00fffdfefe06fefcfcfefdfdfe00fefefdfdfffcfefffc"  # G
+        "fe0001fffd0000fe08fdfdfffefffefffefe02fd00fd00fffc"  # H
+        "fffdfdfdfffdfdfcfd0402fd0100fdfefffdff03fd03fdfffc"  # I
+        "fffefdfcfffefdfcfd0204fe0200fdfefffeff01fc03fdfffc"  # L
+        "ff0200fffd0101fefffdfe05fffdff00fffdfefe00fd01fffc"  # K
+        "fffffefdff00fefdfe0102ff0500feffffffff01fd02fffffc"  # M
+        "fefdfdfdfefdfdfdff0000fd0006fcfefe0103fffd00fdfffc"  # F
+        "fffefefffdfffffefefdfdfffefc07fffffcfdfefefdfffffc"  # P
+        "01ff0100ff000000fffefe00fffeff0401fdfefe00fe00fffc"  # S
+        "00ff00fffffffffefefffffffffeff0105fefe00fffffffffc"  # T
+        "fdfdfcfcfefefdfefefdfefdff01fcfdfe0b02fdfcfefefffc"  # W
+        "fefefefdfefffefd02fffffeff03fdfefe0207fffdfffefffc"  # Y
+        "00fdfdfdfffefefdfd0301fe01fffefe00fdff04fd02fefffc"  # V
+        "feff0404fd0001ff00fdfc00fdfdfe00fffcfdfd04fd00fffc"  # B
+        "fffefdfdfffefdfcfd0303fd0200fdfefffeff02fd03fdfffc"  # J
+        "ff000001fd0404fe00fdfd01fffdff00fffefefe00fd04fffc"  # Z
+        "fffffffffffffffffffffffffffffffffffffffffffffffffc"  # X
+        "fcfcfcfcfcfcfcfcfcfcfcfcfcfcfcfcfcfcfcfcfcfcfcfc01"  # *
+    ),
+    80: (
+        LABELS,
+        "05fefefeffffff00fefefefffffdff0100fdfe00fefefffffa"  # A
+        "fe06fffefc01fffd00fdfd02fefcfefffffcfdfdfffd00fffa"  # R
+        "feff0601fd00ffff00fcfc00fdfcfd0000fcfdfc05fc00fffa"  # N
+        "fefe0106fcff01fefefcfbfffcfcfefffffafcfc05fb01fffa"  # D
+        "fffcfdfc09fcfbfcfcfefefcfefdfcfefffdfdfffcfefcfffa"  # C
+        "ff0100fffc0602fe01fdfd0100fcfe00fffdfefd00fd04fffa"  # Q
+        "ffffff01fb0206fd00fcfc01fefcfe00fffcfdfd01fc05fffa"  # E
+        "00fdfffefcfefd06fdfbfcfefcfcfdfffefcfcfcfffbfdfffa"  # G
+        "fe0000fefc0100fd08fcfdfffefefdfffefd02fcfffc00fffa"  # H
+        "fefdfcfcfefdfcfbfc0501fd01fffcfdfffdfe03fc03fcfffa"  # I
+        "fefdfcfbfefdfcfcfd0104fd0200fdfdfefefe01fc03fdfffa"  # L
+        "ff0200fffc0101fefffdfd05fefcfffffffcfdfdfffd01fffa"  # K
+        "fffefdfcfe00fefcfe0102fe0600fdfefffefe01fd02fffffa"  # M
+        "fdfcfcfcfdfcfcfcfeff00fc0006fcfdfe0003fffc00fcfffa"  # F
+        "fffefdfefcfefefdfdfcfdfffdfc08fffefbfcfdfefcfefffa"  # P
+        "01ff00fffe0000fffffdfdfffefdff0501fcfefe00fd00fffa"  # S
+        "00ff00fffffffffefefffefffffefe0105fcfe00fffffffffa"  # T
+        "fdfcfcfafdfdfcfcfdfdfefcfe00fbfcfc0b02fdfbfdfdfffa"  # W
+        "fefdfdfcfdfefdfc02fefefdfe03fcfefe0207fefdfefdfffa"  # Y
+        "00fdfcfcfffdfdfcfc0301fd01fffdfe00fdfe04fc02fdfffa"  # V
+        "feff0505fc0001fffffcfcfffdfcfe00fffbfdfc05fc00fffa"  # B
+        "fefdfcfbfefdfcfbfc0303fd0200fcfdfffdfe02fc03fdfffa"  # J
+        "ff000001fc0405fd00fcfd01fffcfe00fffdfdfd00fd05fffa"  # Z
+        "fffffffffffffffffffffffffffffffffffffffffffffffffa"  # X
+        "fafafafafafafafafafafafafafafafafafafafafafafafa01"  # *
+    ),
+    90: (
+        LABELS,
+        "05fefefdffffff00fefefefffefdff0100fcfdfffefefffffa"  # A
+        "fe06fffdfb01fffd00fcfd02fefcfdfffefcfdfdfefd00fffa"  # R
+        "feff0701fc00ffff00fcfc00fdfcfd0000fbfdfc05fcfffffa"  # N
+        "fdfd0107fbff01fefefbfbfffcfbfdfffefafcfb05fb01fffa"  # D
+        "fffbfcfb09fcfafcfbfefefcfefdfcfefefcfcfefcfefbfffa"  # C
+        "ff0100fffc0702fd01fcfd0100fcfefffffdfdfdfffd05fffa"  # Q
+        "ffffff01fa0206fdfffcfc00fdfbfefffffbfcfd01fc05fffa"  # E
+        "00fdfffefcfdfd06fdfbfbfefcfbfdfffdfcfbfbfefbfdfffa"  # G
+        "fe0000fefb01fffd08fcfcfffdfefdfefefd01fcfffc00fffa"  # H
+        "fefcfcfbfefcfcfbfc0501fc01fffcfdfffcfe03fb03fcfffa"  # I
+        "fefdfcfbfefdfcfbfc0105fd0200fcfdfefdfe00fb04fcfffa"  # L
+        "ff0200fffc0100fefffcfd06fefcfefffffbfdfdfffd01fffa"  # K
+        "fefefdfcfe00fdfcfd0102fe07fffdfefffefe00fc02fefffa"  # M
+        "fdfcfcfbfdfcfbfbfeff00fcff07fcfdfd0003fefc00fcfffa"  # F
+        "fffdfdfdfcfefefdfdfcfcfefdfc08fefefbfcfdfdfcfefffa"  # P
+        "01ff00fffefffffffefdfdfffefdfe0501fcfdfe00fdfffffa"  # S
+        "00fe00fefefffffdfefffefffffdfe0106fcfefffffefffffa"  # T
+        "fcfcfbfafcfdfbfcfdfcfdfbfe00fbfcfc0b02fdfafdfcfffa"  # W
+        "fdfdfdfcfcfdfcfb01fefefdfe03fcfdfe0208fdfcfefdfffa"  # Y
+        "fffdfcfbfefdfdfbfc0300fd00fefdfefffdfd05fc01fdfffa"  # V
+        "fefe0505fcff01fefffbfbfffcfcfd00fffafcfc05fb00fffa"  # B
+        "fefdfcfbfefdfcfbfc0304fd0200fcfdfefdfe01fb04fcfffa"  # J
+        "ff00ff01fb0505fd00fcfc01fefcfefffffcfdfd00fc05fffa"  # Z
+        "fffffffffffffffffffffffffffffffffffffffffffffffffa"  # X
+        "fafafafafafafafafafafafafafafafafafafafafafafafa01"  # *
+    ),
 }
+# fmt: on
+
+
+def unpack(n: int) -> Tuple[str, "array[int]"]:
+    """
+    Decodes a packed matrix into its labels and row-major int8 scores.
+    """
+    labels, table = PACKED[n]
+    return labels, array("b", bytes.fromhex(table))
+
+
+class _Registry(Mapping[int, Matrix]):
+    """
+    Read-only mapping that decodes each matrix into nested dicts on first access.
+    """
+
+    def __init__(self) -> None:
+        self._loaded: Dict[int, Matrix] = {}
+
+    def __getitem__(self, n: int) -> Matrix:
+        matrix = self._loaded.get(n)
+        if matrix is None:
+            labels, scores = unpack(n)
+            size = len(labels)
+            matrix = self._loaded[n] = {
+                a: {b: float(scores[i * size + j]) for j, b in enumerate(labels)}
+                for i, a in enumerate(labels)
+            }
+        return matrix
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(PACKED)
+
+    def __len__(self) -> int:
+        return len(PACKED)
+
+
+default_blosum = _Registry()
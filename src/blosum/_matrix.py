@@ -0,0 +1,275 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+Dense, array-backed storage shared by BLOSUM and loadMatrix.
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+from array import array
+from math import isfinite
+from pickle import PickleBuffer
+from warnings import warn
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+Scores = Union["array[int]", "array[float]", memoryview]
+
+INTEGER_TYPECODES = "bhilq"
+
+
+def integerTypecode(values: Iterable[float]) -> str:
+    """
+    Returns the smallest signed array typecode that holds all values exactly.
+    Raises ValueError if a value is not integral.
+    """
+    low, high = 0, 0
+    for v in values:
+        if not (isfinite(v) and v == int(v)):
+            raise ValueError(f"Score {v} is not an integer.")
+        low, high = min(low, int(v)), max(high, int(v))
+
+    for typecode in "bhiq":
+        limit = 1 << (8 * array(typecode).itemsize - 1)
+        if -limit <= low and high < limit:
+            return typecode
+    raise OverflowError("Scores do not fit into 64 bit integers.")
+
+
+class ScoreMatrix:
+    """
+    Compact representation of a substitution matrix.
+    The scores are stored row-major in one contiguous array of size N*N,
+    the labels are mapped to their row / column index by a plain dict.
+
+    Parameters
+    ----------
+        labels: sequence of str
+            The residue labels, in row / column order.
+        scores: array or memoryview
+            Row-major N*N block of scores. Any numeric typecode is accepted,
+            the built-in matrices are stored as int8 ("b").
+            A typed memoryview, e.g. onto shared memory, is used without copying.
+
+    Attributes
+    ----------
+        labels: tuple of str
+            The residue labels.
+        index: dict
+            Maps every label to its row / column index.
+        offsets: dict
+            Maps every label to the start of its row in scores.
+        size: int
+            Number of labels (N).
+        scores: array or memoryview
+            Row-major N*N block of scores.
+        typecode: str
+            The array typecode of scores.
+    """
+
+    __slots__ = ("labels", "index", "offsets", "size", "scores", "typecode", "_views", "_codes")
+
+    def __init__(self, labels: Sequence[str], scores: Scores):
+        self.labels: Tuple[str, ...] = tuple(labels)
+        self.index: Dict[str, int] = {lab: i for i, lab in enumerate(self.labels)}
+        self.size = len(self.labels)
+        self.offsets: Dict[str, int] = {lab: i * self.size for lab, i in self.index.items()}
+        self.scores = scores
+        self.typecode: str = scores.format if isinstance(scores, memoryview) else scores.typecode
+        self._views: Dict[str, Scores] = {self.typecode: scores}
+        self._codes: Optional[bytes] = None
+
+        if not len(self.index) == self.size:
+            raise ValueError("Matrix labels are not unique.")
+        if not len(scores) == self.size * self.size:
+            raise ValueError(f"Expected {self.size * self.size} scores, got {len(scores)}.")
+
+    def __reduce_ex__(self, protocol: Any) -> Tuple[Any, ...]:
+        """
+        Pickles the labels and the packed score buffer only.
+        With protocol 5 the scores are passed as out-of-band buffer.
+        """
+        data: Any = PickleBuffer(self.scores) if protocol >= 5 else self.scores.tobytes()
+        return (_unpickle, (self.labels, self.typecode, data))
+
+    @classmethod
+    def fromDict(cls, matrix: Mapping[str, Mapping[str, float]]) -> "ScoreMatrix":
+        """
+        Builds a dense matrix from a nested mapping.
+
+        Parameters
+        ----------
+            matrix: mapping
+                matrix[a][b] is the score of substituting a with b.
+                Every row has to contain every label.
+
+        Returns
+        -------
+            ScoreMatrix
+        """
+        labels = list(matrix)
+        scores = array("d", (matrix[a][b] for a in labels for b in labels))
+        return cls(labels, scores)
+
+    @property
+    def isInteger(self) -> bool:
+        """
+        True if the scores are stored as integers.
+        """
+        return self.typecode in INTEGER_TYPECODES
+
+    def asInteger(self) -> "ScoreMatrix":
+        """
+        Returns the matrix with integer storage, converted to the smallest
+        typecode that fits. Raises ValueError if a score is not integral.
+        """
+        if self.isInteger:
+            return self
+        return ScoreMatrix(self.labels, self.astype(integerTypecode(self.scores)))
+
+    def astype(self, typecode: str) -> Scores:
+        """
+        Returns the scores converted to the given array typecode.
+        The conversion is done once and shared by all callers.
+        """
+        view = self._views.get(typecode)
+        if view is None:
+            if typecode in INTEGER_TYPECODES:
+                view = array(typecode, map(int, self.scores))
+            else:
+                view = array(typecode, self.scores)  # type: ignore
+            self._views[typecode] = view
+        return view
+
+    def codes(self) -> bytes:
+        """
+        Returns a 256 byte translation table from byte value to label index.
+        Lowercase letters are folded to uppercase labels, every byte that is not
+        a single character label maps to the sentinel index N.
+
+        Returns
+        -------
+            codes: bytes
+                Usable with bytes.translate.
+        """
+        if self._codes is None:
+            if self.size > 255:
+                raise ValueError("Byte codes need a matrix with at most 255 labels.")
+
+            table = bytearray([self.size]) * 256
+            for b in range(256):
+                c = chr(b)
+                i = self.index.get(c)
+                if i is None:
+                    i = self.index.get(c.upper(), self.size)
+                table[b] = i
+            self._codes = bytes(table)
+        return self._codes
+
+    def get(self, a: str, b: str, default: float) -> float:
+        """
+        Returns the score of substituting a with b, or default if a label is unknown.
+        """
+        i = self.index.get(a)
+        j = self.index.get(b)
+        if i is None or j is None:
+            return default
+        return float(self.scores[i * self.size + j])
+
+    def row(self, label: str, cast: Callable[[Any], Any] = float) -> Dict[str, Any]:
+        """
+        Returns the scores of a single row as plain dict, converted by cast.
+        """
+        start = self.index[label] * self.size
+        return dict(zip(self.labels, map(cast, self.scores[start : start + self.size])))
+
+    def rows(self, cast: Callable[[Any], Any] = float) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Iterates over (label, row dict) tuples in label order.
+        """
+        for label in self.labels:
+            yield label, self.row(label, cast)
+
+
+def _unpickle(labels: Sequence[str], typecode: str, data: Any) -> ScoreMatrix:
+    """
+    Rebuilds a pickled ScoreMatrix.
+    """
+    scores = array(typecode)  # type: ignore
+    scores.frombytes(memoryview(data).cast("B"))
+    return ScoreMatrix(labels, scores)
+
+
+def readMatrix(path: str) -> ScoreMatrix:
+    """
+    Reads a Blosum matrix from file into a dense ScoreMatrix.
+    File in a format like: https://www.ncbi.nlm.nih.gov/IEB/ToolBox/C_DOC/lxr/source/data/BLOSUM62
+
+    Parameters
+    ----------
+        path: str
+             Path to the file.
+
+    Returns
+    -------
+        matrix: ScoreMatrix
+            The dense matrix.
+    """
+
+    with open(path, "r") as f:
+        content = f.readlines()
+
+    labelslist: Sequence[str] = []
+    rows: Dict[str, Sequence[str]] = {}
+
+    header = True
+    for line in content:
+        line = line.strip()
+
+        # Skip comments starting with #
+        if line.startswith("#"):
+            continue
+
+        linelist = line.split()
+
+        # Extract labels only once
+        if header:
+            labelslist = linelist
+            header = False
+
+            # Check if all AA are covered
+            if not len(labelslist) == 25:
+                warn(UserWarning("Blosum matrix may not cover all amino-acids"))
+            continue
+
+        if not len(linelist) == len(labelslist) + 1:
+            # Check if line has as may entries as labels
+            raise EOFError("Blosum file is missing values.")
+
+        rows[linelist[0]] = linelist[1:]
+
+    # Check quadratic
+    if not (len(rows) == len(labelslist) and set(rows) == set(labelslist)):
+        raise EOFError("Blosum file is not quadratic.")
+
+    scores = array("d", (float(v) for lab in labelslist for v in rows[lab]))
+
+    # Integral matrices (e.g. all NCBI ones) are stored compactly as integers
+    try:
+        scores = array(integerTypecode(scores), map(int, scores))  # type: ignore
+    except (ValueError, OverflowError):
+        pass
+    return ScoreMatrix(labelslist, scores)
@@ -0,0 +1,207 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+Neighborhood words of query k-mers, as used for seeding (BLAST, Altschul 1997).
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ._blosum import BLOSUM
+from ._scoring import Sequence, asBytes
+
+# Neighborhoods kept per BLOSUM, least recently used ones are dropped first
+CACHE_SIZE = 1 << 16
+
+Neighbors = Tuple[Tuple[bytes, Any], ...]
+
+
+def neighborhood(
+    bm: BLOSUM,
+    word: Sequence,
+    threshold: float,
+    alphabet: Optional[Union[str, bytes]] = None,
+) -> Neighbors:
+    """
+    Returns every word of the same length whose score against word is at least
+    threshold. The residues of every position are tried by decreasing score and a
+    branch is cut as soon as even the best residues of the remaining positions
+    cannot reach the threshold, so only a small part of all words is visited.
+    Results are cached per BLOSUM, repeated words are not enumerated again.
+
+    Parameters
+    ----------
+        bm: BLOSUM
+            The substitution scores.
+        word: str, bytes, bytearray or memoryview
+            The query word, e.g. a k-mer of the query.
+        threshold: float
+            Minimum score of a neighbor (T).
+        alphabet: str or bytes, optional
+            Residues the neighbors are built from, defaults to all single
+            character labels of the matrix.
+
+    Returns
+    -------
+        neighbors: tuple of (bytes, score) tuples
+            The words and their scores, int in integer mode.
+
+    Examples
+    --------
+        >>> neighborhood(BLOSUM(62, integer=True), "WHE", 20)
+        ((b'WHE', 24), (b'WHZ', 23), (b'WHQ', 21), (b'WHD', 21), (b'WHK', 20), (b'WHB', 20))
+    """
+    residues = _alphabet(bm, alphabet)
+    key = (bytes(asBytes(word)), threshold, residues)
+    cache = bm._tables.get("neighborhoods")
+    if cache is None:
+        cache = bm._tables["neighborhoods"] = OrderedDict()
+
+    neighbors = cache.get(key)
+    if neighbors is None:
+        neighbors = cache[key] = _enumerate(bm, key[0], threshold, residues)
+        if len(cache) > CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return neighbors  # type: ignore[no-any-return]
+
+
+def _alphabet(bm: BLOSUM, alphabet: Optional[Union[str, bytes]]) -> bytes:
+    if alphabet is None:
+        residues = bm._tables.get("alphabet")
+        if residues is None:
+            labels = [label for label in bm.matrix.labels if len(label) == 1]
+            residues = bm._tables["alphabet"] = bytes(asBytes("".join(labels)))
+        return residues  # type: ignore[no-any-return]
+    return bytes(asBytes(alphabet))
+
+
+def _enumerate(bm: BLOSUM, word: bytes, threshold: float, alphabet: bytes) -> Neighbors:
+    """
+    Branch and bound over the positions of word, one level at a time.
+    """
+    # Per position the (score, residue) pairs by decreasing score
+    orders = [_order(bm, q, alphabet) for q in word]
+    # bounds[i] is the best score of positions i.. over the alphabet
+    bounds: List[Any] = [0] * (len(word) + 1)
+    for i in range(len(word) - 1, -1, -1):
+        bounds[i] = bounds[i + 1] + (orders[i][0][0] if orders[i] else float("-inf"))
+
+    partial: List[Tuple[bytes, Any]] = [(b"", 0)]
+    for i, order in enumerate(orders):
+        # Partial words still need this much from position i on
+        bound = bounds[i + 1]
+        extended = []
+        for prefix, score in partial:
+            for value, residue in order:
+                if score + value + bound < threshold:
+                    break
+                extended.append((prefix + bytes((residue,)), score + value))
+        partial = extended
+
+    cast = int if bm.integer else float
+    return tuple((w, cast(score)) for w, score in partial if score >= threshold)
+
+
+def _order(bm: BLOSUM, q: int, alphabet: bytes) -> List[Tuple[Any, int]]:
+    """
+    Returns the (score, residue) pairs of row q over alphabet by decreasing score,
+    sorted once per BLOSUM and alphabet.
+    """
+    orders = bm._tables.setdefault("neighborhoodOrders", {}).setdefault(alphabet, {})
+    order = orders.get(q)
+    if order is None:
+        row = bm.byteTable()[q]
+        order = orders[q] = sorted(((row[r], r) for r in set(alphabet)), reverse=True)
+    return order  # type: ignore[no-any-return]
+
+
+class WordIndex:
+    def __init__(
+        self,
+        bm: BLOSUM,
+        query: Sequence,
+        k: int = 3,
+        threshold: float = 11,
+        alphabet: Optional[Union[str, bytes]] = None,
+    ):
+        """
+        Maps every neighborhood word of the query k-mers to the query positions it
+        seeds, see neighborhood. A target is scanned once for words in the index.
+
+        Parameters
+        ----------
+            bm: BLOSUM
+                The substitution scores.
+            query: str, bytes, bytearray, memoryview or QueryProfile
+                The query sequence.
+            k: int
+                Word length.
+            threshold: float
+                Minimum score of a neighbor against its query k-mer (T).
+            alphabet: str or bytes, optional
+                Residues of the neighbors, see neighborhood.
+
+        Attributes
+        ----------
+            query: bytes
+                The query sequence.
+            words: dict
+                Maps every neighborhood word (bytes) to the list of its query positions.
+
+        Examples
+        --------
+            >>> index = WordIndex(BLOSUM(62), "HEAGAWGHEE", k=3, threshold=11)
+            >>> index[b"AWG"]
+            [4]
+            >>> list(index.hits("PAWHEAE"))
+        """
+        if k < 1:
+            raise ValueError("k has to be positive.")
+        self.bm = bm
+        self.query = bytes(asBytes(query))
+        self.k = k
+        self.threshold = threshold
+
+        self.words: Dict[bytes, List[int]] = {}
+        for i in range(len(self.query) - k + 1):
+            for word, _ in neighborhood(bm, self.query[i : i + k], threshold, alphabet):
+                self.words.setdefault(word, []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: bytes) -> bool:
+        return word in self.words
+
+    def __getitem__(self, word: bytes) -> List[int]:
+        return self.words[word]
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self.words)
+
+    def __repr__(self) -> str:
+        return (
+            f"WordIndex({self.bm!r}, {self.query.decode('latin-1')!r}, "
+            f"k={self.k}, threshold={self.threshold!r})"
+        )
+
+    def hits(self, target: Sequence) -> Iterator[Tuple[int, int]]:
+        """
+        Yields (query position, target position) for every k-mer of target that is
+        in the index, by target position. Lowercase residues match like uppercase.
+        """
+        data = bytes(asBytes(target)).upper()
+        words = self.words
+        k = self.k
+        for j in range(len(data) - k + 1):
+            positions = words.get(data[j : j + k])
+            if positions is not None:
+                for i in positions:
+                    yield i, j
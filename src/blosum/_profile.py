@@ -0,0 +1,147 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+Query profiles: the scores of one query against the whole alphabet, built once.
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from . import _compat, _scoring
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._blosum import BLOSUM
+
+
+class QueryProfile:
+    def __init__(
+        self,
+        bm: "BLOSUM",
+        query: Union[str, bytes, bytearray, memoryview],
+        lanes: Optional[int] = None,
+    ):
+        """
+        Substitution scores of one query against every residue, computed once and
+        reused for every target. Accepted in place of a sequence by
+        BLOSUM.scoreSequences, BLOSUM.scoreBatch and Aligner; the per-target cost is
+        then indexing into the profile instead of looking up matrix rows.
+
+        Parameters
+        ----------
+            bm: BLOSUM
+                The substitution scores.
+            query: str, bytes, bytearray or memoryview
+                The query sequence.
+            lanes: int, optional
+                Also build the striped layout (Farrar, 2007) for this many lanes.
+
+        Attributes
+        ----------
+            query: bytes
+                The query sequence.
+            scores:
+                Length x alphabet table, scores[i][r] is the score of substituting
+                query[i] with residue r. With NumPy an array indexed by label codes
+                (see BLOSUM.matrix.codes), without the same as rows.
+            rows: list
+                The rows of BLOSUM.byteTable for every query residue, indexed by bytes.
+            transposed:
+                With NumPy the scores as contiguous alphabet x length array, i.e.
+                transposed[r][i] is scores[i][r]. Used by Aligner.scoreBatch.
+            striped:
+                Alphabet x segments x lanes table or None, see stripe.
+
+        Examples
+        --------
+            >>> profile = QueryProfile(BLOSUM(62), "HEAGAWGHEE")
+            >>> BLOSUM(62).scoreSequences(profile, "PAWHEAEHEA")
+            -2.0
+            >>> Aligner(BLOSUM(62)).score("PAWHEAE", profile)
+        """
+        self.bm = bm
+        self.query = bytes(_scoring.asBytes(query))
+        self._columns: Dict[int, List[Any]] = {}
+
+        byteTable = bm.byteTable()
+        self.rows = [byteTable[b] for b in self.query]
+
+        np = _compat.numpy()
+        if np is None:
+            self.codes = None
+            self.scores: Any = self.rows
+        else:
+            table = _scoring.ndTable(bm)
+            self.codes = _scoring.encode(bm, self.query)
+            self.scores = table[self.codes]
+            self.scores.flags.writeable = False
+            self.transposed = np.ascontiguousarray(self.scores.T)
+            self.transposed.flags.writeable = False
+            # Transposed orientation for the aligner, where the query is seq2
+            self.columns = table.astype(np.float64)[:, self.codes]
+            self.columns.flags.writeable = False
+
+        self.striped = None if lanes is None else self.stripe(lanes)
+
+    def __len__(self) -> int:
+        return len(self.query)
+
+    def __repr__(self) -> str:
+        return f"QueryProfile({self.bm!r}, {self.query.decode('latin-1')!r})"
+
+    def column(self, residue: int) -> List[Any]:
+        """
+        Returns the scores of substituting the byte residue with every query residue.
+        Built on first use, for the pure Python aligner.
+        """
+        column = self._columns.get(residue)
+        if column is None:
+            row = self.bm.byteTable()[residue]
+            column = self._columns[residue] = [row[b] for b in self.query]
+        return column
+
+    def stripe(self, lanes: int) -> Any:
+        """
+        Returns the profile in striped layout for SIMD style kernels that process
+        lanes query positions at once. The query is cut into lanes segments of
+        length s = ceil(len(query) / lanes) and striped[r][k][l] is the score of
+        query[l * s + k] against residue r. Positions past the end score the default.
+
+        Parameters
+        ----------
+            lanes: int
+                Number of lanes, e.g. 16 for 16 int8 values in 128 bits.
+
+        Returns
+        -------
+            striped:
+                NumPy array indexed by label codes, or nested lists indexed by bytes.
+        """
+        if lanes < 1:
+            raise ValueError("lanes has to be positive.")
+        n = len(self.query)
+        segment = -(-n // lanes)
+
+        np = _compat.numpy()
+        if np is None:
+            default = self.bm.default
+            return [
+                [
+                    [
+                        self.rows[l * segment + k][r] if l * segment + k < n else default
+                        for l in range(lanes)
+                    ]
+                    for k in range(segment)
+                ]
+                for r in range(256)
+            ]
+
+        padded = np.full(
+            (segment * lanes, self.scores.shape[1]), self.bm.default, self.scores.dtype
+        )
+        padded[:n] = self.scores
+        # (lanes, segment, alphabet) -> (alphabet, segment, lanes)
+        return np.ascontiguousarray(padded.reshape(lanes, segment, -1).transpose(2, 1, 0))
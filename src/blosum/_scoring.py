@@ -0,0 +1,161 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+Scoring of whole sequences.
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+from itertools import islice
+from operator import getitem
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+from . import _compat
+from ._profile import QueryProfile
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ._blosum import BLOSUM
+
+Sequence = Union[str, bytes, bytearray, memoryview, QueryProfile]
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Below this length the pure Python loop beats the NumPy call overhead
+NUMPY_MIN_LENGTH = 128
+
+
+def asBytes(seq: Sequence) -> BytesLike:
+    """
+    Returns a sequence as bytes-like object, str is encoded as latin-1.
+    Characters outside of latin-1 become "?" and score the default.
+    A QueryProfile returns its query.
+    """
+    if isinstance(seq, QueryProfile):
+        return seq.query
+    if isinstance(seq, str):
+        return seq.encode("latin-1", "replace")
+    if isinstance(seq, memoryview) and not seq.format == "B":
+        return seq.cast("B")
+    return seq
+
+
+def encode(bm: "BLOSUM", seq: Sequence) -> Any:
+    """
+    Translates a sequence into a uint8 NumPy array of label indices.
+    Unknown residues map to the sentinel index N.
+    """
+    if isinstance(seq, QueryProfile) and seq.bm is bm and seq.codes is not None:
+        return seq.codes
+    np = _compat.numpy()
+    data = asBytes(seq)
+    codes = bm.matrix.codes()
+    if isinstance(data, bytes):
+        data = data.translate(codes)
+    else:
+        data = bytes(data).translate(codes)
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def ndTable(bm: "BLOSUM") -> Any:
+    """
+    Returns the (N+1)x(N+1) NumPy score table indexed by encoded residues.
+    The last row and column hold the default. Built once per BLOSUM.
+    """
+    table = bm._tables.get("numpy")
+    if table is None:
+        np = _compat.numpy()
+        matrix = bm.matrix
+        size = matrix.size
+        dtype = np.int64 if bm.integer else np.float64
+        table = np.full((size + 1, size + 1), bm.default, dtype=dtype)
+        table[:size, :size] = np.asarray(matrix.scores, dtype=dtype).reshape(size, size)
+        table.flags.writeable = False
+        bm._tables["numpy"] = table
+    return table
+
+
+def scoreSequences(bm: "BLOSUM", seq1: Sequence, seq2: Sequence) -> Any:
+    """
+    Sums the substitution scores of two equal-length sequences.
+    See BLOSUM.scoreSequences.
+    """
+    if not len(seq1) == len(seq2):
+        raise ValueError(f"Sequences differ in length ({len(seq1)} != {len(seq2)}).")
+
+    if isinstance(seq1, QueryProfile) and seq1.bm is bm:
+        return _scoreProfile(bm, seq1, seq2)
+
+    np = _compat.numpy()
+    if np is not None and len(seq1) >= NUMPY_MIN_LENGTH:
+        table = ndTable(bm)
+        total = table[encode(bm, seq1), encode(bm, seq2)].sum()
+        return int(total) if bm.integer else float(total)
+
+    table = bm.byteTable()
+    total = sum(map(getitem, map(table.__getitem__, asBytes(seq1)), asBytes(seq2)))
+    return total if bm.integer else float(total)
+
+
+def _scoreProfile(bm: "BLOSUM", profile: QueryProfile, target: Sequence) -> Any:
+    """
+    Ungapped score of a target against a query profile.
+    """
+    if profile.codes is not None and len(profile) >= NUMPY_MIN_LENGTH:
+        np = _compat.numpy()
+        codes = encode(bm, target)
+        total = profile.scores[np.arange(len(codes)), codes].sum()
+    else:
+        total = sum(map(getitem, profile.rows, asBytes(target)))
+    return int(total) if bm.integer else float(total)
+
+
+def scoreBatch(
+    bm: "BLOSUM", pairs: Iterable[Tuple[Sequence, Sequence]], chunkSize: int
+) -> Iterator[Any]:
+    """
+    Lazily scores an iterable of sequence pairs, chunk by chunk.
+    See BLOSUM.scoreBatch.
+    """
+    if chunkSize < 1:
+        raise ValueError("chunkSize has to be positive.")
+    return _scoreChunks(bm, iter(pairs), chunkSize)
+
+
+def _scoreChunks(
+    bm: "BLOSUM", pairs: Iterator[Tuple[Sequence, Sequence]], chunkSize: int
+) -> Iterator[Any]:
+    while True:
+        chunk = list(islice(pairs, chunkSize))
+        if not chunk:
+            return
+        yield from _scoreChunk(bm, chunk)
+
+
+def _scoreChunk(bm: "BLOSUM", chunk: List[Tuple[Sequence, Sequence]]) -> List[Any]:
+    """
+    Scores one chunk, vectorized per group of equal length.
+    """
+    np = _compat.numpy()
+    if np is None:
+        return [scoreSequences(bm, seq1, seq2) for seq1, seq2 in chunk]
+
+    groups: Dict[int, List[int]] = {}
+    for i, (seq1, seq2) in enumerate(chunk):
+        if not len(seq1) == len(seq2):
+            raise ValueError(f"Sequences differ in length ({len(seq1)} != {len(seq2)}).")
+        groups.setdefault(len(seq1), []).append(i)
+
+    table = ndTable(bm)
+    codes = bm.matrix.codes()
+    scores = np.empty(len(chunk), dtype=table.dtype)
+
+    for length, members in groups.items():
+        rows = []
+        for column in range(2):
+            data = b"".join([asBytes(chunk[i][column]) for i in members]).translate(codes)
+            rows.append(np.frombuffer(data, dtype=np.uint8).reshape(len(members), length))
+        scores[members] = table[rows[0], rows[1]].sum(axis=1)
+
+    return scores.tolist()  # type: ignore[no-any-return]
@@ -0,0 +1,335 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+Streaming search of a FASTA database.
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+import gzip
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from . import _compat
+from ._align import Aligner
+from ._allvsall import _bounded
+from ._blosum import BLOSUM
+from ._profile import QueryProfile
+from ._scoring import Sequence, asBytes, encode
+from ._shared import attachMatrix, shareMatrix
+
+MODES = ("ungapped", "local", "global")
+
+NEG = float("-inf")
+
+# (index of the first record, [(id, sequence)])
+Chunk = Tuple[int, List[Tuple[str, bytes]]]
+
+
+class Hit(NamedTuple):
+    """
+    One database record found by search.
+
+    Attributes
+    ----------
+        score: float
+            The score against the query. An int in integer mode.
+        id: str
+            The record identifier, the first word of the FASTA header.
+        record: int
+            Position of the record in the database.
+    """
+
+    score: float
+    id: str
+    record: int
+
+
+class SearchProgress(NamedTuple):
+    """
+    Passed to the progress callback of search after every finished chunk.
+
+    Attributes
+    ----------
+        records: int
+            Number of database records scored so far.
+        seconds: float
+            Time since the start.
+    """
+
+    records: int
+    seconds: float
+
+    @property
+    def recordsPerSecond(self) -> float:
+        return self.records / self.seconds if self.seconds else 0.0
+
+
+def readFasta(path: str) -> Iterator[Tuple[str, bytes]]:
+    """
+    Lazily reads a FASTA file, plain or gzip compressed (detected by its content).
+    Only one record is held in memory at a time.
+
+    Parameters
+    ----------
+        path: str
+            Path to the file.
+
+    Yields
+    ------
+        (id, sequence): tuple of str and bytes
+            The first word of the header and the sequence without whitespace.
+    """
+    with open(path, "rb") as raw:
+        compressed = raw.read(2) == b"\x1f\x8b"
+    f: Any = gzip.open(path, "rb") if compressed else open(path, "rb")
+    with f:
+        name: Optional[str] = None
+        parts: List[bytes] = []
+        for line in f:
+            if line.startswith(b">"):
+                if name is not None:
+                    yield name, b"".join(parts)
+                words = line[1:].split(maxsplit=1)
+                name = words[0].decode() if words else ""
+                parts = []
+            elif name is not None:
+                parts.append(b"".join(line.split()))
+        if name is not None:
+            yield name, b"".join(parts)
+
+
+def search(
+    bm: BLOSUM,
+    queries: Iterable[Sequence],
+    database: Union[str, Iterable[Tuple[str, Sequence]]],
+    mode: str = "local",
+    k: int = 10,
+    gapOpen: float = 11,
+    gapExtend: float = 1,
+    chunkSize: int = 1024,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[SearchProgress], Any]] = None,
+) -> List[List[Hit]]:
+    """
+    Scores every database record against every query and keeps the k best hits
+    per query in a bounded heap. The database is streamed in chunks of chunkSize
+    records, so memory depends on k, chunkSize and the number of workers only.
+
+    Parameters
+    ----------
+        bm: BLOSUM
+            The substitution scores.
+        queries: iterable of str, bytes, bytearray or memoryview
+            The queries, held in memory.
+        database: str or iterable of (id, sequence) tuples
+            Path to a FASTA file (plain or gzip) or the records themselves.
+        mode: str
+            "ungapped" (best local segment without gaps), "local" or "global".
+        k: int
+            Number of hits to keep per query.
+        gapOpen, gapExtend: float
+            Gap costs of the local and global mode, see Aligner.
+        chunkSize: int
+            Number of records per task.
+        workers: int, optional
+            Number of worker processes, defaults to the number of CPUs.
+            0 scores all chunks in the calling process.
+        progress: callable, optional
+            Called with a SearchProgress after every finished chunk.
+
+    Returns
+    -------
+        hits: list of list of Hit
+            For every query its best hits, by decreasing score. Ties are ordered
+            by their position in the database.
+
+    Examples
+    --------
+        >>> hits = search(BLOSUM(62), ["HEAGAWGHEE"], "uniprot.fasta.gz", k=5)
+        >>> hits[0][0].id
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode '{mode}'. Choose one of {MODES}.")
+    if k < 1 or chunkSize < 1:
+        raise ValueError("k and chunkSize have to be positive.")
+    options = {"gapOpen": gapOpen, "gapExtend": gapExtend, "mode": mode}
+    if not mode == "ungapped":
+        Aligner(bm, **options)  # type: ignore[arg-type]
+
+    seqs = [bytes(asBytes(q)) for q in queries]
+    records = readFasta(database) if isinstance(database, str) else database
+    chunks = _chunks(records, chunkSize)
+
+    # Min-heaps of (score, -index, id): the root is the worst hit kept
+    heaps: List[List[Tuple[Any, int, str]]] = [[] for _ in seqs]
+    start = perf_counter()
+    scored = 0
+    for count, chunkHits in _run(bm, seqs, options, k, chunks, workers):
+        for heap, hits in zip(heaps, chunkHits):
+            for hit in hits:
+                if len(heap) < k:
+                    heapq.heappush(heap, hit)
+                elif hit > heap[0]:
+                    heapq.heapreplace(heap, hit)
+        scored += count
+        if progress is not None:
+            progress(SearchProgress(scored, perf_counter() - start))
+
+    return [
+        [Hit(score, name, -neg) for score, neg, name in sorted(heap, reverse=True)]
+        for heap in heaps
+    ]
+
+
+def _chunks(records: Iterable[Tuple[str, Sequence]], size: int) -> Iterator[Chunk]:
+    it = iter(records)
+    index = 0
+    while True:
+        chunk = [(name, bytes(asBytes(seq))) for name, seq in islice(it, size)]
+        if not chunk:
+            return
+        yield index, chunk
+        index += len(chunk)
+
+
+class _Searcher:
+    """
+    Scores chunks of the database against all queries, held once per worker.
+    The query profiles, and in ungapped mode their padded score columns, are built
+    once and reused for every chunk.
+    """
+
+    def __init__(self, bm: BLOSUM, queries: List[bytes], options: Dict[str, Any], k: int):
+        self.bm = bm
+        self.profiles = [QueryProfile(bm, q) for q in queries]
+        self.mode = options["mode"]
+        self.aligner = None if self.mode == "ungapped" else Aligner(bm, **options)
+        self.columns = [_columns(p) if self.aligner is None else None for p in self.profiles]
+        self.k = k
+
+    def score(self, chunk: Chunk) -> Tuple[int, List[List[Tuple[Any, int, str]]]]:
+        first, records = chunk
+        targets = [seq for _, seq in records]
+        hits = []
+        for profile, columns in zip(self.profiles, self.columns):
+            if self.aligner is None:
+                scores = _ungapped(self.bm, profile, targets, columns)
+            else:
+                scores = self.aligner.scoreBatch(profile, targets)
+            best = heapq.nlargest(
+                self.k,
+                zip(scores, range(-first, -first - len(records), -1), (n for n, _ in records)),
+            )
+            hits.append(best)
+        return len(records), hits
+
+
+_searcher: Optional[_Searcher] = None
+
+
+def _initWorker(name: str, queries: List[bytes], options: Dict[str, Any], k: int) -> None:
+    global _searcher
+    _searcher = _Searcher(attachMatrix(name), queries, options, k)
+
+
+def _scoreChunk(chunk: Chunk) -> Tuple[int, List[List[Tuple[Any, int, str]]]]:
+    assert _searcher is not None
+    return _searcher.score(chunk)
+
+
+def _run(
+    bm: BLOSUM,
+    queries: List[bytes],
+    options: Dict[str, Any],
+    k: int,
+    chunks: Iterator[Chunk],
+    workers: Optional[int],
+) -> Iterator[Tuple[int, List[List[Tuple[Any, int, str]]]]]:
+    if workers == 0:
+        yield from map(_Searcher(bm, queries, options, k).score, chunks)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    shm = shareMatrix(bm)
+    try:
+        with ProcessPoolExecutor(
+            workers, initializer=_initWorker, initargs=(shm.name, queries, options, k)
+        ) as pool:
+            yield from _bounded(pool, _scoreChunk, chunks, 2 * workers)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _columns(profile: QueryProfile) -> Any:
+    """
+    Returns the scores of all query positions per residue code for _ungapped, plus
+    a row for the padding code that scores -inf. None without NumPy.
+    """
+    np = _compat.numpy()
+    if np is None or profile.codes is None:
+        return None
+    columns = np.full((len(profile.transposed) + 1, len(profile)), NEG)
+    columns[:-1] = profile.transposed
+    return columns
+
+
+def _ungapped(
+    bm: BLOSUM, profile: QueryProfile, targets: List[bytes], columns: Any = None
+) -> List[Any]:
+    """
+    Returns the best scores of ungapped local alignments against the query of profile,
+    the maximum sums of consecutive substitution scores over all diagonals.
+    With NumPy all targets run at once, one per row: H[t, i] is the best sum of the
+    diagonal segments ending in query position i and the current target position.
+    columns are the padded scores of the profile, see _columns, built if omitted.
+    """
+    np = _compat.numpy()
+    cast = int if bm.integer else float
+    n = len(profile)
+    if np is None or profile.codes is None:
+        rows = profile.rows
+        result = []
+        for target in targets:
+            best = 0
+            for diagonal in range(-n + 1, len(target)):
+                run = 0
+                for i in range(max(0, -diagonal), min(n, len(target) - diagonal)):
+                    run = max(run + rows[i][target[i + diagonal]], 0)
+                    best = max(best, run)
+            result.append(cast(best))
+        return result
+
+    if columns is None:
+        columns = _columns(profile)
+    # The last row of columns belongs to the padding code
+    L = max(map(len, targets), default=0)
+    T = np.full((len(targets), L), len(columns) - 1, dtype=np.intp)
+    for k, target in enumerate(targets):
+        T[k, : len(target)] = encode(bm, target)
+
+    H = np.zeros((len(targets), n + 1))
+    best = np.zeros(len(targets))
+    for j in range(L):
+        H[:, 1:] = np.maximum(H[:, :-1] + columns[T[:, j]], 0)
+        np.maximum(best, H.max(axis=1), out=best)
+    return [cast(score) for score in best.tolist()]
@@ -0,0 +1,466 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+K-mer index of a sequence database and seed-and-extend search (BLAST, Altschul 1997).
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+import heapq
+import mmap
+import struct
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from . import _compat
+from ._align import Aligner
+from ._blosum import BLOSUM
+from ._neighborhood import WordIndex
+from ._profile import QueryProfile
+from ._scoring import Sequence, asBytes
+from ._search import Hit, readFasta
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+# Marks bytes outside of the alphabet in the rank table
+INVALID = 255
+
+# Limits the word table to 512 MB
+MAX_WORDS = 1 << 26
+
+
+class DatabaseIndex:
+    # magic, word length, alphabet size, records, residues, id bytes, positions
+    HEADER = struct.Struct("<4sIIQQQQ")
+    MAGIC = b"BLDB"
+
+    def __init__(
+        self,
+        database: Union[str, Iterable[Tuple[str, Sequence]]],
+        k: int = 3,
+        alphabet: Union[str, bytes] = AMINO_ACIDS,
+    ):
+        """
+        K-mer index of a sequence database. For every word of length k over the
+        alphabet the positions of its occurrences are stored contiguously, so all
+        occurrences of a word are one slice. Words with residues outside of the
+        alphabet (e.g. X) are not indexed, lowercase residues count as uppercase.
+
+        Everything is held in flat arrays; save writes them to one file that load
+        maps into memory without reading it.
+
+        Parameters
+        ----------
+            database: str or iterable of (id, sequence) tuples
+                Path to a FASTA file (plain or gzip) or the records themselves.
+            k: int
+                Word length.
+            alphabet: str or bytes
+                Residues of the indexed words, the 20 amino acids by default.
+
+        Attributes
+        ----------
+            k: int
+                Word length.
+            alphabet: bytes
+                Residues of the indexed words.
+            offsets:
+                Start of every record in sequences, plus the total length.
+            sequences:
+                All records concatenated.
+            starts:
+                starts[w]..starts[w + 1] is the slice of positions of word code w.
+            positions:
+                Occurrences of all words in sequences, grouped by word.
+
+        Examples
+        --------
+            >>> index = DatabaseIndex("uniprot.fasta.gz", k=3)
+            >>> index.save("uniprot.idx")
+            >>> index = DatabaseIndex.load("uniprot.idx")
+        """
+        if k < 1:
+            raise ValueError("k has to be positive.")
+        self.k = k
+        self.alphabet = bytes(asBytes(alphabet))
+        self._setup()
+        # The file an index is mapped from, see load
+        self._map: Optional[mmap.mmap] = None
+
+        records = readFasta(database) if isinstance(database, str) else database
+        ids = bytearray()
+        sequences = bytearray()
+        self.offsets: Any = array("q", [0])
+        self.idOffsets: Any = array("q", [0])
+        for name, seq in records:
+            ids += name.encode()
+            sequences += asBytes(seq)
+            self.offsets.append(len(sequences))
+            self.idOffsets.append(len(ids))
+        self.ids: Any = bytes(ids)
+        self.sequences: Any = bytes(sequences)
+
+        self.starts, self.positions = self._build()
+
+    def _setup(self) -> None:
+        size = len(self.alphabet)
+        if not size == len(set(self.alphabet)):
+            raise ValueError("Alphabet residues are not unique.")
+        if size > INVALID:
+            raise ValueError(f"The alphabet holds at most {INVALID} residues.")
+        ranks = bytearray([INVALID]) * 256
+        for rank, residue in enumerate(self.alphabet):
+            ranks[residue] = rank
+            ranks[bytes((residue,)).lower()[0]] = rank
+        self.ranks = bytes(ranks)
+        self.words = size**self.k
+        if self.words > MAX_WORDS:
+            raise ValueError(f"{size}^{self.k} words are too many, use a smaller k.")
+
+    def _build(self) -> Tuple[Any, Any]:
+        """
+        Counting sort of all valid k-mers by their word code.
+        """
+        np = _compat.numpy()
+        k, size = self.k, len(self.alphabet)
+        ranks = self.sequences.translate(self.ranks)
+
+        if np is None:
+            buckets: Dict[int, List[int]] = {}
+            for r in range(len(self.offsets) - 1):
+                start, end = self.offsets[r], self.offsets[r + 1]
+                for j in range(start, end - k + 1):
+                    code = self._code(ranks[j : j + k])
+                    if code is not None:
+                        buckets.setdefault(code, []).append(j)
+            positions = array("q")
+            starts = array("q", [0]) * (self.words + 1)
+            for code in range(self.words):
+                positions.extend(buckets.get(code, ()))
+                starts[code + 1] = len(positions)
+            return starts, positions
+
+        codes = np.frombuffer(ranks, dtype=np.uint8).astype(np.int64)
+        count = max(len(codes) - k + 1, 0)
+        words = np.zeros(count, dtype=np.int64)
+        valid = np.ones(count, dtype=bool)
+        for p in range(k):
+            window = codes[p : p + count]
+            valid &= window < INVALID
+            words = words * size + window
+        # K-mers must not cross the end of their record
+        offsets = np.asarray(self.offsets, dtype=np.int64)
+        ends = np.repeat(offsets[1:], np.diff(offsets))[:count]
+        valid &= np.arange(count) + k <= ends
+
+        found = np.flatnonzero(valid)
+        order = np.argsort(words[found], kind="stable")
+        counts = np.bincount(words[found], minlength=self.words)
+        starts = array("q", [0])
+        starts.frombytes(np.cumsum(counts, dtype=np.int64).tobytes())
+        positions = array("q")
+        positions.frombytes(found[order].astype(np.int64).tobytes())
+        return starts, positions
+
+    def _code(self, ranks: bytes) -> Optional[int]:
+        """
+        Returns the code of a word of rank bytes, None if it is not in the alphabet.
+        """
+        code = 0
+        size = len(self.alphabet)
+        for rank in ranks:
+            if rank == INVALID:
+                return None
+            code = code * size + rank
+        return code
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __repr__(self) -> str:
+        return f"DatabaseIndex(<{len(self)} records>, k={self.k})"
+
+    def id(self, record: int) -> str:
+        """
+        Returns the id of a record.
+        """
+        return bytes(self.ids[self.idOffsets[record] : self.idOffsets[record + 1]]).decode()
+
+    def sequence(self, record: int) -> bytes:
+        """
+        Returns the sequence of a record.
+        """
+        return bytes(self.sequences[self.offsets[record] : self.offsets[record + 1]])
+
+    def record(self, position: int) -> int:
+        """
+        Returns the record of a position in sequences.
+        """
+        return bisect_right(self.offsets, position) - 1
+
+    def lookup(self, word: Sequence) -> Any:
+        """
+        Returns the positions in sequences where word occurs, empty if it is not
+        a word of the index.
+        """
+        data = bytes(asBytes(word))
+        code = self._code(data.translate(self.ranks)) if len(data) == self.k else None
+        if code is None:
+            return self.positions[0:0]
+        return self.positions[self.starts[code] : self.starts[code + 1]]
+
+    def save(self, path: str) -> None:
+        """
+        Writes the index to one file, every array aligned to 8 bytes. The arrays are
+        stored in native byte order.
+        """
+        header = self.HEADER.pack(
+            self.MAGIC,
+            self.k,
+            len(self.alphabet),
+            len(self),
+            len(self.sequences),
+            len(self.ids),
+            len(self.positions),
+        )
+        with open(path, "wb") as f:
+            for part in (
+                header,
+                self.alphabet,
+                self.offsets,
+                self.idOffsets,
+                self.starts,
+                self.positions,
+                self.ids,
+                self.sequences,
+            ):
+                data = memoryview(part).cast("B")
+                f.write(data)
+                f.write(bytes(-len(data) % 8))
+
+    @classmethod
+    def load(cls, path: str) -> "DatabaseIndex":
+        """
+        Maps an index written by save into memory. Pages are only read from disk
+        when they are used, so an index larger than memory can be searched.
+        """
+        with open(path, "rb") as f:
+            header = f.read(cls.HEADER.size)
+            if not len(header) == cls.HEADER.size or not header[:4] == cls.MAGIC:
+                raise ValueError(f"'{path}' is not a database index.")
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, k, size, records, residues, idBytes, positions = cls.HEADER.unpack(header)
+        index = cls.__new__(cls)
+        index.k = k
+        index._map = data
+        view = memoryview(data)
+
+        pos = cls.HEADER.size + -cls.HEADER.size % 8
+
+        def section(nbytes: int, typecode: str = "B") -> Any:
+            nonlocal pos
+            if pos + nbytes > len(data):
+                raise ValueError(f"'{path}' is truncated.")
+            part = view[pos : pos + nbytes]
+            pos += nbytes + -nbytes % 8
+            return part.cast(typecode)  # type: ignore[call-overload]
+
+        index.alphabet = bytes(section(size))
+        index._setup()
+        index.offsets = section(8 * (records + 1), "q")
+        index.idOffsets = section(8 * (records + 1), "q")
+        index.starts = section(8 * (index.words + 1), "q")
+        index.positions = section(8 * positions, "q")
+        index.ids = section(idBytes)
+        index.sequences = section(residues)
+        return index
+
+
+def seedSearch(
+    bm: BLOSUM,
+    queries: Iterable[Sequence],
+    index: DatabaseIndex,
+    threshold: float = 11,
+    window: int = 40,
+    xDrop: float = 16,
+    cutoff: float = 0,
+    gapped: bool = False,
+    gapOpen: float = 11,
+    gapExtend: float = 1,
+    k: int = 10,
+) -> List[List[Hit]]:
+    """
+    Heuristic search of an indexed database, far less work than scoring every
+    record (see search) at the cost of missing hits without a seed.
+
+    1. Seeding: every query k-mer is expanded into its neighborhood words
+       (see WordIndex) and these are looked up in the index.
+    2. Two-hit: a seed is only extended if another, non-overlapping seed lies on
+       the same diagonal less than window residues before it.
+    3. Ungapped extension: the seed is extended along its diagonal in both
+       directions until the score drops xDrop below the best score so far.
+    4. Gapped extension (optional): records with an ungapped segment of at least
+       cutoff are aligned locally with the query, see Aligner.
+
+    Parameters
+    ----------
+        bm: BLOSUM
+            The substitution scores.
+        queries: iterable of str, bytes, bytearray or memoryview
+            The queries.
+        index: DatabaseIndex
+            The database, its word length is used for the seeds.
+        threshold: float
+            Minimum score of a neighborhood word (T).
+        window: int
+            Maximum distance of two seeds on one diagonal (A). 0 extends every seed.
+        xDrop: float
+            Drop of the ungapped extension (X).
+        cutoff: float
+            Segments scoring below are discarded.
+        gapped: bool
+            Score the records with a segment by local alignment.
+        gapOpen, gapExtend: float
+            Gap costs of the gapped extension, see Aligner.
+        k: int
+            Number of hits to keep per query.
+
+    Returns
+    -------
+        hits: list of list of Hit
+            For every query its best hits, by decreasing score. Ties are ordered
+            by their position in the database. The best ungapped segment of every
+            record, or its local alignment score if gapped.
+
+    Examples
+    --------
+        >>> index = DatabaseIndex.load("uniprot.idx")
+        >>> hits = seedSearch(BLOSUM(62), ["HEAGAWGHEE"], index, gapped=True)
+    """
+    if k < 1:
+        raise ValueError("k has to be positive.")
+    if window < 0 or xDrop < 0:
+        raise ValueError("window and xDrop must not be negative.")
+    aligner = Aligner(bm, gapOpen, gapExtend) if gapped else None
+    cast = int if bm.integer else float
+
+    results = []
+    for query in queries:
+        data = bytes(asBytes(query))
+        best = _ungapped(bm, data, index, threshold, window, xDrop, cutoff)
+        records = sorted(best)
+        scores = [best[r] for r in records]
+        if aligner is not None and records:
+            targets = [index.sequence(r) for r in records]
+            scores = aligner.scoreBatch(QueryProfile(bm, data), targets)
+        top = heapq.nlargest(k, zip(scores, (-r for r in records)))
+        results.append([Hit(cast(score), index.id(-neg), -neg) for score, neg in top])
+    return results
+
+
+def _seeds(words: WordIndex, index: DatabaseIndex) -> Iterator[Tuple[int, int]]:
+    """
+    Yields (diagonal, position) of every seed, by diagonal and then position.
+    Diagonals are position in the database minus position in the query.
+    """
+    np = _compat.numpy()
+    if np is None:
+        seeds = [
+            (j - i, j) for word, ii in words.words.items() for j in index.lookup(word) for i in ii
+        ]
+        yield from sorted(seeds)
+        return
+
+    diagonals, positions = [], []
+    for word, ii in words.words.items():
+        found = np.asarray(index.lookup(word), dtype=np.int64)
+        if len(found):
+            for i in ii:
+                diagonals.append(found - i)
+                positions.append(found)
+    if not diagonals:
+        return
+    diagonal = np.concatenate(diagonals)
+    position = np.concatenate(positions)
+    order = np.lexsort((position, diagonal))
+    yield from zip(diagonal[order].tolist(), position[order].tolist())
+
+
+def _ungapped(
+    bm: BLOSUM,
+    query: bytes,
+    index: DatabaseIndex,
+    threshold: float,
+    window: int,
+    xDrop: float,
+    cutoff: float,
+) -> Dict[int, Any]:
+    """
+    Two-hit seeding and ungapped X-drop extension.
+    Returns the best segment score of every record that has one of at least cutoff.
+    """
+    k = index.k
+    words = WordIndex(bm, query, k, threshold, index.alphabet)
+    table = bm.byteTable()
+    seqs = index.sequences
+    n = len(query)
+
+    best: Dict[int, Any] = {}
+    diagonal = last = current = None
+    reached = -1
+    for d, j in _seeds(words, index):
+        record = index.record(j)
+        # Diagonals run across record boundaries, hits only pair within a record
+        if not (d == diagonal and record == current):
+            diagonal, current, last, reached = d, record, None, -1
+        if j < reached:
+            # Already covered by an extension on this diagonal
+            continue
+        if window:
+            if last is None or j - last >= window:
+                # First hit of a possible pair
+                last = j
+                continue
+            if j - last < k:
+                # Overlaps the previous hit
+                continue
+
+        start, end = index.offsets[record], index.offsets[record + 1]
+        i = j - d
+        score = sum(table[query[i + p]][seqs[j + p]] for p in range(k))
+
+        # Right of the seed
+        run = top = 0
+        p = k
+        right = k
+        while i + p < n and j + p < end:
+            run += table[query[i + p]][seqs[j + p]]
+            p += 1
+            if run > top:
+                top, right = run, p
+            elif top - run > xDrop:
+                break
+        score += top
+
+        # Left of the seed
+        run = top = 0
+        p = 1
+        while i - p >= 0 and j - p >= start:
+            run += table[query[i - p]][seqs[j - p]]
+            if run > top:
+                top = run
+            elif top - run > xDrop:
+                break
+            p += 1
+        score += top
+
+        reached = j + right
+        last = j
+        if score >= cutoff and score > best.get(record, float("-inf")):
+            best[record] = score
+    return best
@@ -0,0 +1,180 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+Publishing BLOSUM matrices to shared memory.
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+import atexit
+import struct
+import threading
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Optional, Tuple
+
+from ._blosum import BLOSUM
+from ._matrix import ScoreMatrix
+
+# magic, typecode, identifier is int, integer mode, label count, label bytes,
+# identifier bytes, default
+_HEADER = struct.Struct("<4ss??IIId")
+_MAGIC = b"BLSM"
+
+# Attached segments stay mapped for the lifetime of the process
+_attached: Dict[str, Tuple[BLOSUM, SharedMemory]] = {}
+
+# Serializes the patching of resource_tracker.register in _open
+_registerLock = threading.Lock()
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def shareMatrix(bm: BLOSUM, name: Optional[str] = None) -> SharedMemory:
+    """
+    Publishes a BLOSUM into a new shared memory block.
+    Other processes can attach to it by name using attachMatrix.
+
+    The caller owns the block: keep the returned object alive while others use it,
+    then call close() and unlink() on it.
+
+    Parameters
+    ----------
+        bm: BLOSUM
+            The matrix to publish.
+        name: str, optional
+            Name of the shared memory block. A random name is chosen if omitted.
+
+    Returns
+    -------
+        shm: SharedMemory
+            The shared memory block. Its name is available as shm.name.
+
+    Examples
+    --------
+        >>> shm = shareMatrix(BLOSUM(62))
+        >>> # in another process
+        >>> bm = attachMatrix(shm.name)
+    """
+    matrix = bm.matrix
+    labels = "\0".join(matrix.labels).encode()
+    ident = str(bm.n).encode()
+    scores = memoryview(matrix.scores).cast("B")
+
+    start = _align(_HEADER.size + len(labels) + len(ident))
+    shm = SharedMemory(name=name, create=True, size=start + scores.nbytes)
+    buf = shm.buf
+    assert buf is not None
+
+    _HEADER.pack_into(
+        buf,
+        0,
+        _MAGIC,
+        matrix.typecode.encode(),
+        isinstance(bm.n, int),
+        bm.integer,
+        matrix.size,
+        len(labels),
+        len(ident),
+        bm.default,
+    )
+    offset = _HEADER.size
+    buf[offset : offset + len(labels)] = labels
+    offset += len(labels)
+    buf[offset : offset + len(ident)] = ident
+    buf[start : start + scores.nbytes] = scores
+    return shm
+
+
+def attachMatrix(name: str) -> BLOSUM:
+    """
+    Attaches to a BLOSUM published with shareMatrix.
+    The scores are read directly from the shared buffer, nothing is copied or unpickled.
+    Lookups of rows and pairs read the buffer every time, they are not stored in
+    the attaching process.
+    Attaching twice to the same name within a process returns the same object.
+
+    Parameters
+    ----------
+        name: str
+            Name of the shared memory block.
+
+    Returns
+    -------
+        bm: BLOSUM
+            Read-only BLOSUM backed by the shared memory.
+    """
+    if name in _attached:
+        return _attached[name][0]
+
+    shm = _open(name)
+    buf = shm.buf
+    assert buf is not None
+
+    magic, typecode, isInt, integer, size, nLabels, nIdent, default = _HEADER.unpack_from(buf, 0)
+    if not magic == _MAGIC:
+        shm.close()
+        raise ValueError(f"Shared memory '{name}' does not contain a BLOSUM matrix.")
+
+    offset = _HEADER.size
+    labels = bytes(buf[offset : offset + nLabels]).decode().split("\0")
+    offset += nLabels
+    ident = bytes(buf[offset : offset + nIdent]).decode()
+    start = _align(offset + nIdent)
+
+    itemsize = struct.calcsize(typecode.decode())
+    scores = buf[start : start + size * size * itemsize].cast(typecode.decode())
+    matrix = ScoreMatrix(labels if size else [], scores)
+
+    n = int(ident) if isInt else ident
+    bm = BLOSUM.__new__(BLOSUM, ident, default)
+    bm._setup(n, default, matrix, integer, cache=False)
+    _attached[name] = (bm, shm)
+    return bm
+
+
+def _open(name: str) -> SharedMemory:
+    """
+    Opens an existing block without registering it for unlinking at exit.
+    Only the publisher owns the block.
+    """
+    try:
+        return SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    except TypeError:
+        pass
+
+    # Python < 3.13 always registers the block with the resource tracker,
+    # which would unlink it once this (attaching) process exits.
+    # The patch is process wide, other threads must neither see nor undo it.
+    def skip(name: Any, rtype: str) -> None:
+        pass
+
+    with _registerLock:
+        register = resource_tracker.register
+        resource_tracker.register = skip
+        try:
+            return SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+@atexit.register
+def _detachAll() -> None:
+    """
+    Releases all views onto attached blocks and unmaps them.
+    """
+    for bm, shm in _attached.values():
+        try:
+            scores = bm.matrix.scores
+            if isinstance(scores, memoryview):
+                scores.release()
+            shm.close()
+        except BufferError:
+            # Still exported elsewhere, e.g. by a numpy array
+            pass
+    _attached.clear()
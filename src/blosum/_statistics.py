@@ -0,0 +1,493 @@
+"""
+blosum: A simple BLOSUM toolbox
+See: https://github.com/not-a-feature/blosum
+Or:  https://pypi.org/project/blosum/
+
+Karlin-Altschul statistics: bit scores and E-values of local alignment scores.
+
+@author: Jules Kreuer / not_a_feature
+License: GPL-3.0
+"""
+
+from collections import OrderedDict
+from itertools import accumulate
+from math import ceil, exp, expm1, gcd, isfinite, log
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from . import _compat
+from ._blosum import _BUILTIN, BLOSUM
+
+# Score distributions kept per BLOSUM, least recently used ones are dropped first
+DISTRIBUTION_CACHE_SIZE = 64
+
+# Background amino acid frequencies of Robinson & Robinson (1991), as used by BLAST
+ROBINSON_FREQUENCIES = {
+    "A": 0.07805,
+    "C": 0.01925,
+    "D": 0.05364,
+    "E": 0.06295,
+    "F": 0.03856,
+    "G": 0.07377,
+    "H": 0.02199,
+    "I": 0.05142,
+    "K": 0.05744,
+    "L": 0.09019,
+    "M": 0.02243,
+    "N": 0.04487,
+    "P": 0.05203,
+    "Q": 0.04264,
+    "R": 0.05129,
+    "S": 0.07120,
+    "T": 0.05841,
+    "V": 0.06441,
+    "W": 0.01330,
+    "Y": 0.03216,
+}
+
+# Published gapped parameters of NCBI BLAST (blast_stat.c), estimated by simulation.
+# matrix -> (gapOpen, gapExtend) -> (lambda, K, H), a gap of length L costs open + L * extend
+GAPPED: Dict[int, Dict[Tuple[int, int], Tuple[float, float, float]]] = {
+    45: {
+        (13, 3): (0.207, 0.049, 0.14),
+        (12, 3): (0.199, 0.039, 0.11),
+        (11, 3): (0.190, 0.031, 0.095),
+        (10, 3): (0.179, 0.023, 0.075),
+        (16, 2): (0.210, 0.051, 0.14),
+        (15, 2): (0.203, 0.041, 0.12),
+        (14, 2): (0.195, 0.032, 0.10),
+        (13, 2): (0.185, 0.024, 0.084),
+        (12, 2): (0.171, 0.016, 0.061),
+        (19, 1): (0.205, 0.040, 0.11),
+        (18, 1): (0.198, 0.032, 0.10),
+        (17, 1): (0.189, 0.024, 0.079),
+        (16, 1): (0.176, 0.016, 0.063),
+    },
+    50: {
+        (13, 3): (0.212, 0.063, 0.19),
+        (12, 3): (0.206, 0.055, 0.17),
+        (11, 3): (0.197, 0.042, 0.14),
+        (10, 3): (0.186, 0.031, 0.11),
+        (9, 3): (0.172, 0.022, 0.082),
+        (16, 2): (0.215, 0.066, 0.20),
+        (15, 2): (0.210, 0.058, 0.17),
+        (14, 2): (0.202, 0.045, 0.14),
+        (13, 2): (0.193, 0.035, 0.12),
+        (12, 2): (0.181, 0.025, 0.095),
+        (19, 1): (0.212, 0.057, 0.18),
+        (18, 1): (0.207, 0.050, 0.15),
+        (17, 1): (0.198, 0.037, 0.12),
+        (16, 1): (0.186, 0.025, 0.10),
+        (15, 1): (0.171, 0.015, 0.063),
+    },
+    62: {
+        (11, 2): (0.297, 0.082, 0.27),
+        (10, 2): (0.291, 0.075, 0.23),
+        (9, 2): (0.279, 0.058, 0.19),
+        (8, 2): (0.264, 0.045, 0.15),
+        (7, 2): (0.239, 0.027, 0.10),
+        (6, 2): (0.201, 0.012, 0.061),
+        (13, 1): (0.292, 0.071, 0.23),
+        (12, 1): (0.283, 0.059, 0.19),
+        (11, 1): (0.267, 0.041, 0.14),
+        (10, 1): (0.243, 0.024, 0.10),
+        (9, 1): (0.206, 0.010, 0.052),
+    },
+    80: {
+        (25, 2): (0.342, 0.17, 0.66),
+        (13, 2): (0.336, 0.15, 0.57),
+        (9, 2): (0.319, 0.11, 0.42),
+        (8, 2): (0.308, 0.090, 0.35),
+        (7, 2): (0.293, 0.070, 0.27),
+        (6, 2): (0.268, 0.045, 0.19),
+        (11, 1): (0.314, 0.095, 0.35),
+        (10, 1): (0.299, 0.071, 0.27),
+        (9, 1): (0.279, 0.048, 0.20),
+    },
+    90: {
+        (9, 2): (0.310, 0.12, 0.46),
+        (8, 2): (0.300, 0.099, 0.39),
+        (7, 2): (0.283, 0.072, 0.30),
+        (6, 2): (0.259, 0.048, 0.22),
+        (11, 1): (0.302, 0.093, 0.39),
+        (10, 1): (0.290, 0.075, 0.28),
+        (9, 1): (0.265, 0.044, 0.20),
+    },
+}
+
+
+class KarlinAltschul(NamedTuple):
+    """
+    Karlin-Altschul parameters of a scoring system, see karlinAltschul.
+
+    Attributes
+    ----------
+        lam: float
+            The scale lambda, in nats per score unit.
+        K: float
+            The search space correction K.
+        H: float
+            The relative entropy H of aligned pairs, in nats.
+    """
+
+    lam: float
+    K: float
+    H: float
+
+    def bitScores(self, scores: Any) -> Any:
+        """
+        Converts raw scores to bit scores, (lambda * S - ln K) / ln 2.
+
+        Parameters
+        ----------
+            scores: float or sequence of float
+                One score or many, e.g. the result of Aligner.scoreBatch.
+
+        Returns
+        -------
+            bits: float, NumPy array or list
+                A float for a single score. With NumPy an array, without a list.
+        """
+        lam, logK = self.lam / log(2), log(self.K) / log(2)
+        np = _compat.numpy()
+        if isinstance(scores, (int, float)):
+            return lam * scores - logK
+        if np is None:
+            return [lam * score - logK for score in scores]
+        return lam * np.asarray(scores, dtype=np.float64) - logK
+
+    def eValues(self, scores: Any, m: Any, n: Any) -> Any:
+        """
+        Converts raw scores to E-values, K * m * n * exp(-lambda * S): the number of
+        alignments of at least this score expected by chance.
+
+        Parameters
+        ----------
+            scores: float or sequence of float
+                One score or many.
+            m, n: int or sequence of int
+                Length of the query and of the database (total residues), broadcast
+                against scores.
+
+        Returns
+        -------
+            evalues: float, NumPy array or list
+                A float for a single score. With NumPy an array, without a list.
+        """
+        np = _compat.numpy()
+        if all(isinstance(x, (int, float)) for x in (scores, m, n)):
+            return self.K * m * n * exp(-self.lam * scores)
+        if np is None:
+            count = max(len(x) for x in (scores, m, n) if not isinstance(x, (int, float)))
+            scores, m, n = (
+                [x] * count if isinstance(x, (int, float)) else list(x) for x in (scores, m, n)
+            )
+            if not len(scores) == len(m) == len(n):
+                raise ValueError("scores, m and n differ in length.")
+            return [self.K * a * b * exp(-self.lam * s) for s, a, b in zip(scores, m, n)]
+        space = np.asarray(m, dtype=np.float64) * np.asarray(n, dtype=np.float64)
+        return self.K * space * np.exp(-self.lam * np.asarray(scores, dtype=np.float64))
+
+
+class ScoreDistribution(NamedTuple):
+    """
+    Exact distribution of a score, see scoreDistribution.
+
+    Attributes
+    ----------
+        low: int
+            The smallest possible score.
+        probabilities:
+            probabilities[s - low] is the probability of score s. A read-only NumPy
+            array, without NumPy a tuple.
+    """
+
+    low: int
+    probabilities: Any
+
+    @property
+    def high(self) -> int:
+        """
+        The largest possible score.
+        """
+        return self.low + len(self.probabilities) - 1
+
+    def pValues(self, scores: Any) -> Any:
+        """
+        Returns the probabilities of scoring at least scores, P(S >= s). The tail
+        sums start at the largest score, so small p-values keep their precision.
+
+        Parameters
+        ----------
+            scores: int or sequence of int
+                One score or many.
+
+        Returns
+        -------
+            pvalues: float, NumPy array or list
+                A float for a single score. With NumPy an array, without a list.
+        """
+        np = _compat.numpy()
+        single = isinstance(scores, (int, float))
+        if np is None:
+            tail = list(accumulate(reversed(self.probabilities)))[::-1] + [0.0]
+            n = len(self.probabilities)
+            values = [
+                tail[min(max(ceil(s - self.low), 0), n)] for s in ([scores] if single else scores)
+            ]
+            return values[0] if single else values
+
+        tail = np.append(np.cumsum(self.probabilities[::-1])[::-1], 0.0)
+        index = np.ceil(np.asarray(scores, dtype=np.float64) - self.low)
+        values = tail[np.clip(index, 0, len(self.probabilities)).astype(np.intp)]
+        return float(values) if single else values
+
+
+def karlinAltschul(
+    bm: BLOSUM,
+    gapOpen: Optional[int] = None,
+    gapExtend: Optional[int] = None,
+    frequencies: Optional[Mapping[str, float]] = None,
+) -> KarlinAltschul:
+    """
+    Returns the Karlin-Altschul parameters of a BLOSUM.
+
+    Without gap costs lambda, K and H of ungapped alignments are computed from the
+    scores and the background frequencies (Karlin & Altschul, 1990): lambda is the
+    positive root of sum p_i p_j exp(lambda s_ij) = 1, K follows from the series over
+    the distributions of sums of scores. This is done once per BLOSUM and frequencies.
+    Gapped parameters cannot be computed, the published ones of the built-in
+    matrices are returned (see GAPPED).
+
+    Parameters
+    ----------
+        bm: BLOSUM
+            The substitution scores.
+        gapOpen, gapExtend: int, optional
+            Gap costs of gapped alignments, see Aligner.
+        frequencies: mapping, optional
+            Background probability of every residue, Robinson & Robinson by default.
+            Normalized to sum 1.
+
+    Returns
+    -------
+        KarlinAltschul
+
+    Examples
+    --------
+        >>> stats = karlinAltschul(BLOSUM(62))
+        >>> stats.lam, stats.K
+        (0.3176..., 0.1337...)
+        >>> karlinAltschul(BLOSUM(62), 11, 1).eValues(scores, len(query), 10**9)
+    """
+    if gapOpen is not None or gapExtend is not None:
+        if frequencies is not None:
+            raise ValueError("Gapped parameters are only published for the default frequencies.")
+        published = GAPPED.get(bm.n) if bm.n in _BUILTIN else None
+        params = None if published is None else published.get((gapOpen, gapExtend))  # type: ignore
+        if params is None:
+            raise ValueError(
+                f"No gapped parameters for {bm!r} with gap costs ({gapOpen}, {gapExtend})."
+            )
+        return KarlinAltschul(*params)
+
+    probabilities = _frequencies(bm, frequencies)
+    cache = bm._tables.setdefault("karlinAltschul", {})
+    key = tuple(sorted(probabilities.items()))
+    params = cache.get(key)
+    if params is None:
+        params = cache[key] = _ungapped(_scoreProbabilities(bm, probabilities))
+    return params  # type: ignore[no-any-return]
+
+
+def scoreDistribution(
+    bm: BLOSUM, length: int, frequencies: Optional[Mapping[str, float]] = None
+) -> ScoreDistribution:
+    """
+    Returns the exact distribution of the score of two random, ungapped segments of
+    the given length, the sum of length independent pair scores. The distribution of
+    one pair is convolved with itself by repeated doubling, log2(length) squarings
+    plus one product per set bit, all over the integer scores.
+    Results are cached per BLOSUM, frequencies and length.
+
+    Parameters
+    ----------
+        bm: BLOSUM
+            The substitution scores, integral.
+        length: int
+            Number of aligned pairs (L).
+        frequencies: mapping, optional
+            Background probability of every residue, Robinson & Robinson by default.
+            Normalized to sum 1.
+
+    Returns
+    -------
+        ScoreDistribution
+
+    Examples
+    --------
+        >>> distribution = scoreDistribution(BLOSUM(62), 9)
+        >>> distribution.pValues(40)
+    """
+    if length < 0:
+        raise ValueError("length must not be negative.")
+    probabilities = _frequencies(bm, frequencies)
+    cache = bm._tables.setdefault("scoreDistributions", OrderedDict())
+    key = (tuple(sorted(probabilities.items())), length)
+    distribution = cache.get(key)
+    if distribution is None:
+        distribution = cache[key] = _power(_scoreProbabilities(bm, probabilities), length)
+        if len(cache) > DISTRIBUTION_CACHE_SIZE:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return distribution  # type: ignore[no-any-return]
+
+
+def _frequencies(bm: BLOSUM, frequencies: Optional[Mapping[str, float]]) -> Dict[str, float]:
+    """
+    Returns the normalized frequencies, checked against the labels of bm.
+    """
+    frequencies = ROBINSON_FREQUENCIES if frequencies is None else frequencies
+    unknown = [label for label in frequencies if label not in bm.matrix.index]
+    if unknown:
+        raise ValueError(f"Residues {unknown} are not labels of the matrix.")
+    if any(not (isfinite(p) and p >= 0) for p in frequencies.values()):
+        raise ValueError("Frequencies have to be finite and not negative.")
+    total = sum(frequencies.values())
+    if not total > 0:
+        raise ValueError("Frequencies sum to zero.")
+    return {label: p / total for label, p in frequencies.items() if p > 0}
+
+
+def _scoreProbabilities(bm: BLOSUM, frequencies: Dict[str, float]) -> Dict[float, float]:
+    """
+    Returns the probability of every score of a random pair of residues.
+    """
+    probabilities: Dict[float, float] = {}
+    for a, p in frequencies.items():
+        for b, q in frequencies.items():
+            score = bm.matrix.get(a, b, bm.default)
+            probabilities[score] = probabilities.get(score, 0.0) + p * q
+    return probabilities
+
+
+def _ungapped(probabilities: Dict[float, float]) -> KarlinAltschul:
+    """
+    Solves for lambda by bisection and Newton steps, then computes H and K.
+    """
+    scores = list(probabilities)
+    if not all(isfinite(s) for s in scores):
+        raise ValueError("Scores of the frequent residues have to be finite.")
+    if not sum(s * p for s, p in probabilities.items()) < 0 or not max(scores) > 0:
+        raise ValueError("The expected score has to be negative and a positive score possible.")
+
+    def f(lam: float) -> float:
+        return sum(p * exp(lam * s) for s, p in probabilities.items()) - 1
+
+    # f(0) = 0 and f is convex, negative right of 0 up to lambda
+    low, high = 0.0, 0.5
+    while f(high) <= 0:
+        low, high = high, 2 * high
+    lam = high
+    for _ in range(100):
+        value = f(lam)
+        slope = sum(p * s * exp(lam * s) for s, p in probabilities.items())
+        step = lam - value / slope if slope > 0 else low
+        if value > 0:
+            high = lam
+        else:
+            low = lam
+        lam = step if low < step < high else (low + high) / 2
+        if high - low < 1e-12 or abs(value) < 1e-15:
+            break
+
+    H = lam * sum(p * s * exp(lam * s) for s, p in probabilities.items())
+    return KarlinAltschul(lam, _K(probabilities, lam, H), H)
+
+
+def _K(probabilities: Dict[float, float], lam: float, H: float) -> float:
+    """
+    K of integral scores with span d (Karlin & Altschul, 1990):
+    K = lambda d exp(-2 sigma) / (H (1 - exp(-lambda d))), where
+    sigma = sum_j 1/j (E[exp(lambda S_j); S_j < 0] + P(S_j >= 0)) and S_j is a sum of
+    j scores. Returns NaN if the scores are not integral.
+    """
+    if not all(s == int(s) for s in probabilities):
+        return float("nan")
+    span = 0
+    for s in probabilities:
+        span = gcd(span, int(s))
+    low = int(min(probabilities)) // span
+    step = [0.0] * (int(max(probabilities)) // span - low + 1)
+    for s, p in probabilities.items():
+        step[int(s) // span - low] += p
+    lam *= span
+
+    np = _compat.numpy()
+    sigma = previous = 0.0
+    distribution: Any = [1.0]
+    for j in range(1, 1000):
+        distribution = _convolve(distribution, step, np)
+        if np is not None:
+            distribution = distribution.tolist()
+        # Scores of the sums of j steps run from j * low
+        negative = -j * low
+        term = (
+            sum(p * exp(lam * (x - negative)) for x, p in enumerate(distribution[:negative]))
+            + sum(distribution[negative:])
+        ) / j
+        sigma += term
+        if term < 1e-8 * sigma:
+            # The terms decay geometrically, add the rest of the series
+            ratio = term / previous
+            if ratio < 1:
+                sigma += term * ratio / (1 - ratio)
+            break
+        previous = term
+    return lam * exp(-2 * sigma) / (H * -expm1(-lam))
+
+
+def _convolve(a: Any, b: Any, np: Any) -> Any:
+    """
+    Returns the convolution of a and b, a NumPy array if np is given, else a list.
+    """
+    if np is not None:
+        return np.convolve(a, b)
+    result = [0.0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def _power(probabilities: Dict[float, float], length: int) -> ScoreDistribution:
+    """
+    Distribution of the sum of length scores by binary exponentiation. FFT based
+    convolution is not used, its rounding errors are relative to the largest
+    probability and would swamp the small tail probabilities.
+    """
+    if not all(isfinite(s) and s == int(s) for s in probabilities):
+        raise ValueError("Score distributions need integral, finite scores.")
+    low = int(min(probabilities))
+    step: Any = [0.0] * (int(max(probabilities)) - low + 1)
+    for s, p in probabilities.items():
+        step[int(s) - low] += p
+
+    np = _compat.numpy()
+    if np is not None:
+        step = np.asarray(step)
+    result: Any = [1.0]
+    bit = length
+    while bit:
+        if bit & 1:
+            result = _convolve(result, step, np)
+        bit >>= 1
+        if bit:
+            step = _convolve(step, step, np)
+
+    if np is None:
+        return ScoreDistribution(low * length, tuple(result))
+    result = np.asarray(result, dtype=np.float64)
+    result.flags.writeable = False
+    return ScoreDistribution(low * length, result)
@@ -0,0 +1,39 @@
+# Shared fixtures and reference implementations of the tests
+import pytest
+
+from blosum import _compat
+
+AA = "ACDEFGHIKLMNPQRSTVWY"
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(_compat, "_numpy", None)
+    return request.param
+
+
+def randomSequence(rng, length, alphabet=AA):
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+def ungapped(bm, query, target, minLength=0):
+    """
+    Best score of an ungapped segment pair of at least minLength residues, on any
+    diagonal. None if there is no such segment, the empty segment scores 0.
+    """
+    best = 0 if minLength == 0 else None
+    for diagonal in range(-len(query) + 1, len(target)):
+        prefix = [0]
+        for i, a in enumerate(query):
+            if 0 <= i + diagonal < len(target):
+                prefix.append(prefix[-1] + bm[a][target[i + diagonal]])
+        low = None
+        for end in range(minLength, len(prefix)):
+            start = prefix[end - minLength]
+            low = start if low is None else min(low, start)
+            if best is None or prefix[end] - low > best:
+                best = prefix[end] - low
+    return best
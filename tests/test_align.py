@@ -0,0 +1,284 @@
+# Testing pairwise alignment
+import blosum as bl
+import pytest
+import random
+import warnings
+from os import path
+
+from blosum import _align
+
+from .conftest import AA, randomSequence
+
+NEG = float("-inf")
+
+
+def gotoh(bm, seq1, seq2, o, e, local):
+    """
+    Straightforward full matrix reference implementation.
+    """
+    n, m = len(seq1), len(seq2)
+    H = [[NEG] * (m + 1) for _ in range(n + 1)]
+    E = [[NEG] * (m + 1) for _ in range(n + 1)]
+    F = [[NEG] * (m + 1) for _ in range(n + 1)]
+    H[0][0] = 0
+    for i in range(1, n + 1):
+        H[i][0] = F[i][0] = 0 if local else -(o + e * i)
+    for j in range(1, m + 1):
+        H[0][j] = E[0][j] = 0 if local else -(o + e * j)
+    best = 0
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            E[i][j] = max(H[i][j - 1] - o - e, E[i][j - 1] - e)
+            F[i][j] = max(H[i - 1][j] - o - e, F[i - 1][j] - e)
+            H[i][j] = max(H[i - 1][j - 1] + bm[seq1[i - 1]][seq2[j - 1]], E[i][j], F[i][j])
+            if local:
+                H[i][j] = max(H[i][j], 0)
+                best = max(best, H[i][j])
+    return best if local else H[n][m]
+
+
+def rescore(bm, aln, o, e):
+    """
+    Scores an alignment column by column.
+    """
+    score = 0
+    gap1 = gap2 = False
+    for a, b in zip(aln.seq1, aln.seq2):
+        if a == "-":
+            score -= e if gap1 else o + e
+        elif b == "-":
+            score -= e if gap2 else o + e
+        else:
+            score += bm[a][b]
+        gap1, gap2 = a == "-", b == "-"
+    return score
+
+
+def random_pairs(count, seed=0, maxlen=30):
+    rng = random.Random(seed)
+    for _ in range(count):
+        seq1 = randomSequence(rng, rng.randint(0, maxlen))
+        seq2 = list(seq1) if rng.random() < 0.5 else [rng.choice(AA) for _ in range(maxlen)]
+        # Mutate to get related sequences with gaps
+        for _ in range(rng.randint(0, 8)):
+            k = rng.randint(0, len(seq2))
+            op = rng.random()
+            if op < 0.4 and seq2:
+                seq2[min(k, len(seq2) - 1)] = rng.choice(AA)
+            elif op < 0.7:
+                seq2.insert(k, rng.choice(AA))
+            elif seq2:
+                del seq2[min(k, len(seq2) - 1)]
+        yield seq1, "".join(seq2)
+
+
+@pytest.mark.parametrize("gaps", [(11, 1), (5, 2), (0, 4)])
+def test_local_score(backend, gaps):
+    bm = bl.BLOSUM(62)
+    aligner = bl.Aligner(bm, *gaps)
+    for seq1, seq2 in random_pairs(40):
+        assert aligner.score(seq1, seq2) == gotoh(bm, seq1, seq2, *gaps, True)
+
+
+@pytest.mark.parametrize("gaps", [(11, 1), (3, 1)])
+def test_local_align(backend, gaps):
+    bm = bl.BLOSUM(62)
+    aligner = bl.Aligner(bm, *gaps)
+    for seq1, seq2 in random_pairs(40, seed=1):
+        aln = aligner.align(seq1, seq2)
+        assert aln.score == aligner.score(seq1, seq2)
+        assert aln.score == rescore(bm, aln, *gaps)
+        assert aln.seq1.replace("-", "") == seq1[aln.start1 : aln.end1]
+        assert aln.seq2.replace("-", "") == seq2[aln.start2 : aln.end2]
+
+
+def test_local_known(backend):
+    aligner = bl.Aligner(bl.BLOSUM(62, integer=True), gapOpen=11, gapExtend=1)
+    aln = aligner.align(b"MKTAYIAKQRQISFVKSHFSRQ", "xxxxKTAYIAKQRQISFVKSHFSRQxxxx")
+    assert isinstance(aln.score, int)
+    assert aln.seq1 == aln.seq2 == "KTAYIAKQRQISFVKSHFSRQ"
+    assert (aln.start1, aln.end1, aln.start2, aln.end2) == (1, 22, 4, 25)
+    assert aligner.score("", "AAA") == 0
+
+
+def test_aligner_stats():
+    aligner = bl.Aligner(bl.BLOSUM(62))
+    assert aligner.cellsPerSecond == 0
+    aligner.score("A" * 20, "A" * 30)
+    aligner.align("A" * 20, "A" * 30)
+    assert aligner.cells == 2 * 20 * 30
+    assert aligner.cellsPerSecond > 0
+
+
+def test_aligner_invalid():
+    with pytest.raises(ValueError):
+        bl.Aligner(bl.BLOSUM(62), mode="semiglobal")
+    with pytest.raises(ValueError):
+        bl.Aligner(bl.BLOSUM(62), gapOpen=-1)
+
+
+def test_aligner_integer_gaps():
+    # Fractional gap costs would be truncated in integer mode
+    bm = bl.BLOSUM(62, integer=True)
+    for gaps in [(2.5, 1), (11, 0.5), (float("inf"), 1)]:
+        with pytest.raises(ValueError):
+            bl.Aligner(bm, *gaps)
+    aligner = bl.Aligner(bm, 11.0, 1.0)
+    assert aligner.score("HEAGAWGHEE", "PAWHEAE") == bl.Aligner(bm, 11, 1).score(
+        "HEAGAWGHEE", "PAWHEAE"
+    )
+    seqs = ("HEAGAWGHEEWWKKWW", "PAWHEAEWWWW")
+    assert bl.Aligner(bl.BLOSUM(62), 2.5, 1).score(*seqs) == 65.5
+
+
+@pytest.mark.parametrize("gaps", [(11, 1), (5, 2), (0, 4), (10, 0)])
+def test_global_score(backend, gaps):
+    bm = bl.BLOSUM(62)
+    aligner = bl.Aligner(bm, *gaps, mode="global")
+    for seq1, seq2 in random_pairs(40, seed=2):
+        assert aligner.score(seq1, seq2) == gotoh(bm, seq1, seq2, *gaps, False)
+
+
+@pytest.mark.parametrize("gaps", [(11, 1), (3, 1), (0, 2), (8, 0)])
+def test_global_align_linear_space(backend, gaps):
+    bm = bl.BLOSUM(45, integer=True)
+    aligner = bl.Aligner(bm, *gaps, mode="global")
+    for seq1, seq2 in random_pairs(60, seed=3, maxlen=40):
+        aln = aligner.align(seq1, seq2)
+        assert aln.score == gotoh(bm, seq1, seq2, *gaps, False)
+        assert aln.score == rescore(bm, aln, *gaps)
+        assert aln.seq1.replace("-", "") == seq1
+        assert aln.seq2.replace("-", "") == seq2
+        assert (aln.start1, aln.end1, aln.start2, aln.end2) == (0, len(seq1), 0, len(seq2))
+
+
+def test_global_edge_cases(backend):
+    aligner = bl.Aligner(bl.BLOSUM(62), gapOpen=11, gapExtend=1, mode="global")
+    assert aligner.score("", "") == 0
+    assert aligner.score("", "AAA") == -14
+    assert aligner.score("AAAA", "") == -15
+    aln = aligner.align(b"AAAA", b"")
+    assert (aln.seq1, aln.seq2, aln.score) == ("AAAA", "----", -15)
+    aln = aligner.align("W", "AAWAA")
+    assert (aln.seq1, aln.seq2) == ("--W--", "AAWAA")
+
+
+@pytest.mark.parametrize("band", [0, 2, 8])
+def test_banded(backend, band):
+    bm = bl.BLOSUM(62)
+    aligner = bl.Aligner(bm, 11, 1, mode="global", band=band)
+    for seq1, seq2 in random_pairs(40, seed=4):
+        full = gotoh(bm, seq1, seq2, 11, 1, False)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            score = aligner.score(seq1, seq2)
+            optimal = aligner.optimal
+            aln = aligner.align(seq1, seq2)
+        assert score <= full
+        assert aln.score == score == rescore(bm, aln, 11, 1)
+        assert aln.optimal == optimal
+        if optimal:
+            assert score == full
+        assert aln.seq1.replace("-", "") == seq1
+        assert aln.seq2.replace("-", "") == seq2
+
+
+def test_banded_adaptive(backend):
+    bm = bl.BLOSUM(62)
+    aligner = bl.Aligner(bm, 11, 1, mode="global", band=1, adaptive=True)
+    for seq1, seq2 in random_pairs(40, seed=5):
+        full = gotoh(bm, seq1, seq2, 11, 1, False)
+        assert aligner.score(seq1, seq2) == full
+        assert aligner.align(seq1, seq2).score == full
+        assert aligner.optimal
+
+
+def test_banded_narrow():
+    seq1 = "MKTAYIAKQRQISFVKSHFSRQ"
+    # The optimal alignment is shifted by 8 diagonals
+    aligner = bl.Aligner(bl.BLOSUM(62), 11, 1, mode="global", band=2)
+    with pytest.warns(UserWarning):
+        aln = aligner.align(seq1 + "HHHHHHHH", "HHHHHHHH" + seq1)
+    assert not aln.optimal and not aligner.optimal
+    assert aln.score < gotoh(aligner.bm, seq1 + "HHHHHHHH", "HHHHHHHH" + seq1, 11, 1, False)
+
+    # Identical sequences are optimal in the narrowest band, using few cells
+    aligner = bl.Aligner(bl.BLOSUM(62), 11, 1, mode="global", band=0)
+    assert aligner.align(seq1 * 10, seq1 * 10).optimal
+    assert aligner.cells == (len(seq1) * 10 + 1) * 1
+
+    with pytest.raises(ValueError):
+        bl.Aligner(bl.BLOSUM(62), band=4)
+    with pytest.raises(ValueError):
+        bl.Aligner(bl.BLOSUM(62), mode="global", band=-1)
+    with pytest.raises(ValueError):
+        bl.Aligner(bl.BLOSUM(62), mode="global", adaptive=True)
+
+
+@pytest.mark.parametrize("mode", ["local", "global"])
+@pytest.mark.parametrize("lanes", [1, 7, 256])
+def test_score_batch(backend, mode, lanes):
+    bm = bl.BLOSUM(50, integer=True)
+    aligner = bl.Aligner(bm, 10, 1, mode=mode)
+    rng = random.Random(6)
+    query = randomSequence(rng, 25)
+    targets = [randomSequence(rng, rng.randint(0, 35)) for _ in range(60)]
+    targets += [query, query[3:20].encode()]
+    scores = aligner.scoreBatch(query, iter(targets), lanes=lanes)
+    assert scores == [
+        gotoh(bm, query, t.decode() if isinstance(t, bytes) else t, 10, 1, mode == "local")
+        for t in targets
+    ]
+    assert all(isinstance(s, int) for s in scores)
+    assert aligner.scoreBatch(query, []) == []
+    assert aligner.scoreBatch(bl.QueryProfile(bm, query), targets, lanes=lanes) == scores
+    with pytest.raises(ValueError):
+        aligner.scoreBatch(query, targets, lanes=0)
+
+
+@pytest.mark.filterwarnings("ignore:Blosum")
+def test_score_batch_profile(monkeypatch):
+    pytest.importorskip("numpy")
+    # Asymmetric, the query has to be scored as seq1
+    bm = bl.BLOSUM(path.join(path.dirname(__file__), "test.blosum"), default=-4, integer=True)
+    aligner = bl.Aligner(bm, 3, 1)
+    rng = random.Random(8)
+    query = randomSequence(rng, 20, "ARND")
+    targets = [randomSequence(rng, rng.randint(0, 25), "ARND") for _ in range(20)]
+    expected = [gotoh(bm, query, t, 3, 1, True) for t in targets]
+    assert aligner.scoreBatch(query, targets) == expected
+
+    # The profile's precomputed table is reused
+    profile = bl.QueryProfile(bm, query)
+    monkeypatch.setattr(_align, "ndTable", None)
+    assert aligner.scoreBatch(profile, targets) == expected
+
+
+@pytest.mark.parametrize("mode", ["local", "global"])
+def test_score_batch_adaptive_precision(mode):
+    np = pytest.importorskip("numpy")
+    bm = bl.BLOSUM(62, integer=True)
+    aligner = bl.Aligner(bm, 11, 1, mode=mode)
+    rng = random.Random(7)
+    query = randomSequence(rng, 50)
+    # Self hits overflow int8, random targets mostly do not
+    targets = [query[: rng.randint(0, 50)] for _ in range(20)] + [query * 4]
+    targets += [randomSequence(rng, rng.randint(0, 60)) for _ in range(20)]
+    expected = [gotoh(bm, query, t, 11, 1, mode == "local") for t in targets]
+    assert max(expected) > 127
+    assert aligner.scoreBatch(query, targets, lanes=8) == expected
+    assert aligner.cells > len(query) * sum(map(len, targets))
+
+    profile = np.zeros((1, 5), dtype=np.int64)
+    assert aligner._widths(profile, 5) == [np.int8, np.int16, np.int32, np.int64]
+    assert bl.Aligner(bl.BLOSUM(62), 11, 1)._widths(profile, 5) == [np.float64]
+    if mode == "global":
+        assert aligner._widths(profile, 200)[0] == np.int16
+
+    # Defaults outside of int8 skip the narrow pass
+    bm = bl.BLOSUM(62, default=-1000, integer=True)
+    aligner = bl.Aligner(bm, 11, 1, mode=mode)
+    assert aligner.scoreBatch("AAAxWW", ["AAAAWW", "xx"]) == [
+        aligner.score("AAAxWW", "AAAAWW"),
+        aligner.score("AAAxWW", "xx"),
+    ]
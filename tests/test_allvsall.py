@@ -0,0 +1,131 @@
+# Testing all-vs-all scoring
+import blosum as bl
+import pytest
+import random
+from array import array
+from os import path
+
+from blosum import _allvsall
+
+from .conftest import randomSequence
+
+
+def sequences(count, seed=0):
+    rng = random.Random(seed)
+    return [randomSequence(rng, rng.randint(0, 25)) for _ in range(count)]
+
+
+def expected(bm, seqs, **options):
+    aligner = bl.Aligner(bm, **options)
+    return [aligner.score(a, b) for i, a in enumerate(seqs) for b in seqs[i + 1 :]]
+
+
+@pytest.mark.parametrize("mode", ["local", "global"])
+@pytest.mark.parametrize("tileSize", [1, 4, 100])
+def test_all_vs_all(backend, mode, tileSize):
+    bm = bl.BLOSUM(62)
+    seqs = sequences(13)
+    reports = []
+    scores = bl.allVsAll(bm, seqs, 5, 2, mode, tileSize, workers=0, progress=reports.append)
+    assert scores.typecode == "d"
+    assert list(scores) == expected(bm, seqs, gapOpen=5, gapExtend=2, mode=mode)
+    assert scores[bl.pairIndex(13, 2, 7)] == bl.Aligner(bm, 5, 2, mode).score(seqs[2], seqs[7])
+
+    assert reports[-1].pairs == reports[-1].total == 13 * 12 // 2
+    assert [r.pairs for r in reports] == sorted(r.pairs for r in reports)
+    assert reports[-1].pairsPerSecond > 0
+
+
+def test_all_vs_all_pool():
+    # Custom matrices reach the workers through shared memory
+    bm = bl.BLOSUM(path.join(path.dirname(__file__), "test.blosum"), integer=True)
+    seqs = sequences(9, seed=1)
+    scores = bl.allVsAll(bm, seqs, tileSize=2, workers=2)
+    assert scores.typecode == "i"
+    assert list(scores) == expected(bm, seqs)
+
+
+def test_all_vs_all_edge_cases():
+    bm = bl.BLOSUM(62)
+    assert len(bl.allVsAll(bm, [], workers=0)) == 0
+    assert len(bl.allVsAll(bm, ["AAA"], workers=0)) == 0
+    with pytest.raises(ValueError):
+        bl.allVsAll(bm, ["AAA", "AA"], tileSize=0)
+    with pytest.raises(ValueError):
+        bl.allVsAll(bm, ["AAA", "AA"], mode="semiglobal")
+
+
+class Interrupt(Exception):
+    pass
+
+
+def test_all_vs_all_file(backend, tmp_path, monkeypatch):
+    bm = bl.BLOSUM(62, integer=True)
+    seqs = sequences(20, seed=2)
+    full = bl.allVsAll(bm, seqs, tileSize=3, workers=0)
+    path = str(tmp_path / "scores.bin")
+
+    def interrupt(progress):
+        if progress.pairs > progress.total // 2:
+            raise Interrupt
+
+    checkpoints = []
+
+    class Checkpoint(_allvsall._Checkpoint):
+        def __init__(self, *args):
+            super().__init__(*args)
+            checkpoints.append(self)
+
+    with monkeypatch.context() as m:
+        m.setattr(_allvsall, "_Checkpoint", Checkpoint)
+        with pytest.raises(Interrupt):
+            bl.allVsAll(bm, seqs, tileSize=3, workers=0, path=path, progress=interrupt)
+    # A failed run unmaps the file, so it can be resized on every platform
+    assert checkpoints[0].map.closed and checkpoints[0].flags.closed
+
+    reports = []
+    scores = bl.allVsAll(bm, seqs, tileSize=3, workers=0, path=path, progress=reports.append)
+    assert isinstance(scores, memoryview)
+    assert list(scores) == list(full)
+    assert reports[0].resumed > full.buffer_info()[1] // 2
+    assert reports[-1].pairs == len(full)
+
+    # Nothing is left to do in a finished run
+    reports = []
+    scores = bl.allVsAll(bm, seqs, tileSize=3, workers=0, path=path, progress=reports.append)
+    assert list(scores) == list(full)
+    assert reports == []
+
+    with open(path, "rb") as f:
+        assert f.read() == full.tobytes()
+    with pytest.raises(ValueError):
+        bl.allVsAll(bm, seqs, tileSize=4, workers=0, path=path)
+    with pytest.raises(ValueError):
+        bl.allVsAll(bm, seqs, 5, tileSize=3, workers=0, path=path)
+    with pytest.raises(ValueError):
+        bl.allVsAll(bm, seqs[::-1], tileSize=3, workers=0, path=path)
+
+
+def test_all_vs_all_typecode(tmp_path):
+    seqs = sequences(6, seed=3)
+    bm = bl.BLOSUM(62, integer=True)
+    path = str(tmp_path / "scores.bin")
+    scores = bl.allVsAll(bm, seqs, workers=0, path=path, typecode="h")
+    assert scores.format == "h" and list(scores) == expected(bm, seqs)
+    assert list(bl.allVsAll(bl.BLOSUM(62), seqs, workers=0, typecode="f")) == expected(
+        bl.BLOSUM(62), seqs
+    )
+    with pytest.raises(ValueError):
+        bl.allVsAll(bl.BLOSUM(62), seqs, workers=0, typecode="i")
+    assert len(bl.allVsAll(bm, ["A"], workers=0, path=str(tmp_path / "empty.bin"))) == 0
+
+
+def test_score_batch_out(backend):
+    bm = bl.BLOSUM(62)
+    seqs = sequences(10, seed=4)
+    aligner = bl.Aligner(bm)
+    out = array("d", [0]) * 12
+    assert aligner.scoreBatch(seqs[0], seqs[1:], out=out) is out
+    assert list(out[:9]) == expected(bm, seqs)[:9]
+    with pytest.raises(ValueError):
+        aligner.scoreBatch(seqs[0], seqs, out=array("d"))
@@ -80,3 +80,200 @@ def test_magic_repr():
 
     fp = path.join(path.dirname(__file__), "test.blosum")
     assert repr(bl.BLOSUM(fp, default=0)) == f'BLOSUM("{fp}", default=0)'
+
+
+def test_blosum_shared_instance():
+    assert bl.BLOSUM(62) is bl.BLOSUM(62)
+    assert bl.BLOSUM(62, default=0) is bl.BLOSUM(62, default=0)
+    assert bl.BLOSUM(62, default=0) is not bl.BLOSUM(62)
+    assert bl.BLOSUM(62, default=0).matrix is bl.BLOSUM(62).matrix
+    assert bl.BLOSUM(45) is not bl.BLOSUM(62)
+
+
+def test_blosum_read_only():
+    bm = bl.BLOSUM(62)
+    with pytest.raises(TypeError):
+        bm["A"] = {}
+    with pytest.raises(TypeError):
+        bm["A"]["A"] = 0
+    with pytest.raises(TypeError):
+        bm.pop("A")
+    assert bm["A"]["A"] == 4
+
+
+def test_blosum_lookup_does_not_insert():
+    bm = bl.BLOSUM(62, default=-99)
+    size = len(bm)
+    for key in ["U", "non", "", "é", "a"]:
+        assert bm[key]["*"] == -99
+        assert bm["A"][key] == -99
+    assert bm["U"] is bm["non"]
+    assert len(bm) == size
+    assert all(len(row) == 25 for row in bm.values())
+    assert "U" not in bm and "U" not in bm["A"]
+
+
+def test_blosum_pair_lookup():
+    bm = bl.BLOSUM(62, default=-99)
+    for a in bm:
+        for b in bm:
+            assert bm.score(a, b) == bm[a, b] == bm[a][b]
+    assert isinstance(bm.score("W", "Y"), float)
+    assert bm.score("U", "A") == bm["A", "U"] == -99
+    assert ("A", "A") not in bm
+
+
+@pytest.mark.filterwarnings("ignore:Blosum")
+def test_blosum_pickle():
+    import pickle
+
+    bm = bl.BLOSUM(62, default=0)
+    assert pickle.loads(pickle.dumps(bm)) is bm
+
+    fp = path.join(path.dirname(__file__), "test.blosum")
+    custom = bl.BLOSUM(fp, default=-1)
+    for protocol in range(2, pickle.HIGHEST_PROTOCOL + 1):
+        restored = pickle.loads(pickle.dumps(custom, protocol=protocol))
+        assert restored == custom
+        assert restored.n == fp and restored.default == -1
+        assert restored["A"]["U"] == -1 and restored.score("A", "A") == 5
+
+    buffers = []
+    data = pickle.dumps(custom, protocol=5, buffer_callback=buffers.append)
+    assert len(buffers) == 1
+    assert pickle.loads(data, buffers=buffers) == custom
+
+    matrix = bl.loadMatrix(fp, default=-1)
+    restored = pickle.loads(pickle.dumps(matrix))
+    assert restored == matrix
+    assert restored["U"]["A"] == -1
+
+
+def _score(bm, a, b):
+    return bm[a][b]
+
+
+def test_blosum_process_pool():
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(_score, bl.BLOSUM(62), "W", "Y").result() == 2
+
+
+def test_blosum_byte_table():
+    bm = bl.BLOSUM(62, default=-99)
+    table = bm.byteTable()
+    assert table is bm.byteTable()
+    assert len(table) == 256 and all(len(row) == 256 for row in table)
+    for a in bm:
+        for b in bm:
+            assert table[ord(a)][ord(b)] == bm[a][b]
+    assert table[ord("w")][ord("y")] == table[ord("W")][ord("Y")] == 2
+    assert table[ord("U")][ord("A")] == table[0][255] == -99
+    seq1, seq2 = b"HEAGAWGHEE", bytearray(b"pawheaehea")
+    assert sum(table[x][y] for x, y in zip(memoryview(seq1), seq2)) == sum(
+        bm[a][b] for a, b in zip("HEAGAWGHEE", "PAWHEAEHEA")
+    )
+
+
+@pytest.mark.filterwarnings("ignore:Blosum")
+def test_blosum_integer():
+    bm = bl.BLOSUM(62, integer=True)
+    assert bm is bl.BLOSUM(62, integer=True)
+    assert bm is not bl.BLOSUM(62)
+    assert bm.default == -4
+    assert bm["W"]["Y"] == 2 and isinstance(bm["W"]["Y"], int)
+    assert isinstance(bm.score("W", "Y"), int) and isinstance(bm["U", "A"], int)
+    assert bm["U"]["A"] == -4
+    assert bm.matrix.scores.typecode == "b"
+    assert repr(bm) == "BLOSUM(62, default=-4, integer=True)"
+    assert bl.BLOSUM(62, default=-10, integer=True)["A"]["U"] == -10
+
+    with pytest.raises(ValueError):
+        bl.BLOSUM(62, default=0.5, integer=True)
+
+    fp = path.join(path.dirname(__file__), "test.blosum")
+    custom = bl.BLOSUM(fp, integer=True)
+    assert custom.matrix.typecode == "b"
+    assert custom.score("A", "A") == 5 and custom.default == -2
+    assert bl.BLOSUM(fp).score("A", "A") == 5.0
+
+
+def test_blosum_integer_float_matrix(tmp_path):
+    fp = tmp_path / "float.blosum"
+    fp.write_text("   A  B\nA  1.5 0\nB  0 1\n")
+    bm = bl.BLOSUM(str(fp))
+    assert bm.matrix.typecode == "d"
+    assert bm["A"]["A"] == 1.5
+    with pytest.raises(ValueError):
+        bl.BLOSUM(str(fp), integer=True)
+
+
+@pytest.mark.filterwarnings("ignore:Blosum")
+def test_blosum_lazy_rows():
+    fp = path.join(path.dirname(__file__), "test.blosum")
+    bm = bl.BLOSUM(fp)
+    # Rows are only built from the dense matrix when they are looked up
+    assert dict.__len__(bm) == 0
+    assert bm["A"]["R"] == bm.matrix.get("A", "R", 0)
+    assert bm["A"] is bm["A"] and dict.__len__(bm) == 1
+    assert len(bm) == 4 and list(bm) == ["A", "R", "N", "D"] and "N" in bm
+    assert bm.get("N") == bm["N"] and bm.get("U") is None
+    assert dict(bm) == bl.loadMatrix(fp) == bm.copy()
+    assert [label for label, _ in bm.items()] == list(bm.keys()) == list(bm)
+
+
+def test_blosum_pair_cache():
+    bm = bl.BLOSUM(62, integer=True)
+    assert bm["W", "Y"] == 2 and dict.__getitem__(bm, ("W", "Y")) == 2
+    # Pairs with unknown labels are answered but never stored
+    assert bm["U", "Y"] == -4 and ("U", "Y") not in dict.keys(bm)
+    assert list(bm) == list(bm.matrix.labels)
+
+
+def test_blosum_pickle_integer():
+    import pickle
+
+    bm = bl.BLOSUM(62, integer=True)
+    assert pickle.loads(pickle.dumps(bm)) is bm
+    assert pickle.loads(pickle.dumps(bl.BLOSUM(62, -10, True))) is bl.BLOSUM(62, -10, True)
+
+
+def test_import_is_lazy():
+    import subprocess
+    import sys
+
+    heavy = ["multiprocessing.shared_memory", "concurrent.futures.process", "mmap", "gzip"]
+    code = f"import sys, blosum; print([m for m in {heavy!r} if m in sys.modules])"
+    assert subprocess.check_output([sys.executable, "-c", code], text=True).strip() == "[]"
+    assert bl.seedSearch is bl._seeds.seedSearch
+    assert "attachMatrix" in dir(bl)
+    with pytest.raises(AttributeError):
+        bl.notAnAttribute
+
+
+def test_blosum_instance_cache(monkeypatch):
+    from blosum import _blosum
+
+    monkeypatch.setattr(_blosum, "INSTANCE_CACHE_SIZE", 4)
+    monkeypatch.setattr(bl.BLOSUM, "_instances", type(bl.BLOSUM._instances)())
+    first = bl.BLOSUM(62, default=0)
+    for default in range(1, 10):
+        bl.BLOSUM(62, default=default)
+    assert len(bl.BLOSUM._instances) == 4
+    assert bl.BLOSUM(62, default=0) is not first
+    assert bl.BLOSUM(62, default=9) is bl.BLOSUM(62, default=9)
+
+    nan = float("nan")
+    for _ in range(10):
+        bm = bl.BLOSUM(62, default=nan)
+    assert len(bl.BLOSUM._instances) == 4
+    assert bm["A"]["U"] != bm["A"]["U"]
+
+
+def test_blosum_read_only_attributes():
+    bm = bl.BLOSUM(62)
+    for name, value in [("n", 45), ("default", 5), ("integer", True), ("matrix", None)]:
+        with pytest.raises(AttributeError):
+            setattr(bm, name, value)
+    assert bl.BLOSUM(62).default == float("-inf") and bm["A"]["U"] == float("-inf")
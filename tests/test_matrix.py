@@ -0,0 +1,66 @@
+# Testing the dense ScoreMatrix
+import blosum as bl
+import pytest
+from array import array
+from os import path
+
+from blosum._matrix import ScoreMatrix, readMatrix
+
+
+def test_dense_matches_dict():
+    bm = bl.BLOSUM(62)
+    m = bm.matrix
+    assert m.size == 25
+    assert isinstance(m.scores, array)
+    for a in m.labels:
+        for b in m.labels:
+            assert m.get(a, b, 0) == bm[a][b]
+
+
+def test_dense_default():
+    m = bl.BLOSUM(62).matrix
+    assert m.get("U", "A", -99) == -99
+    assert m.get("A", "U", -99) == -99
+
+
+@pytest.mark.filterwarnings("ignore:Blosum")
+def test_read_matrix_order():
+    fp = path.join(path.dirname(__file__), "test.blosum")
+    m = readMatrix(fp)
+    assert m.labels == ("A", "R", "N", "D")
+    assert list(m.scores[:4]) == [5, 0, -1, -2]
+    assert m.row("R") == {"A": -2, "R": 7, "N": 0, "D": -1}
+
+
+def test_invalid_size():
+    with pytest.raises(ValueError):
+        ScoreMatrix("AB", array("d", [1, 2, 3]))
+
+
+def test_lazy_data():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, blosum;"
+        "assert 'blosum._data' not in sys.modules;"
+        "from blosum._data import default_blosum;"
+        "assert not default_blosum._loaded;"
+        "blosum.BLOSUM(62);"
+        "assert not default_blosum._loaded;"
+        "default_blosum[62];"
+        "assert list(default_blosum._loaded) == [62]"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_packed_data():
+    from blosum._data import default_blosum, unpack
+
+    labels, scores = unpack(62)
+    assert scores.typecode == "b"
+    assert bl.BLOSUM(62).matrix.scores.typecode == "b"
+    assert default_blosum[62]["W"]["Y"] == 2.0
+    assert sorted(default_blosum) == [45, 50, 62, 80, 90]
+    for n in default_blosum:
+        assert dict(bl.BLOSUM(n)) == default_blosum[n]
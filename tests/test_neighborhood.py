@@ -0,0 +1,97 @@
+# Testing neighborhood words
+import blosum as bl
+import pytest
+from itertools import product
+from os import path
+
+from blosum import _neighborhood
+
+AA = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def bruteForce(bm, word, threshold, alphabet):
+    result = {}
+    for letters in product(alphabet, repeat=len(word)):
+        score = sum(bm[a][b] for a, b in zip(word, letters))
+        if score >= threshold:
+            result["".join(letters).encode()] = score
+    return result
+
+
+@pytest.mark.parametrize("word", ["WHE", "AAA", "CW", "KLMN", "XAW", "hEa"])
+@pytest.mark.parametrize("threshold", [-5, 8, 11, 15])
+def test_neighborhood(word, threshold):
+    bm = bl.BLOSUM(62, integer=True)
+    neighbors = bl.neighborhood(bm, word, threshold, AA)
+    assert dict(neighbors) == bruteForce(bm, word.upper(), threshold, AA)
+    assert len(neighbors) == len(dict(neighbors))
+    assert all(type(score) is int for _, score in neighbors)
+
+
+def test_neighborhood_default_alphabet():
+    bm = bl.BLOSUM(path.join(path.dirname(__file__), "test.blosum"))
+    labels = "".join(label for label in bm.matrix.labels if len(label) == 1)
+    neighbors = bl.neighborhood(bm, "AC", 0)
+    assert dict(neighbors) == bruteForce(bm, "AC", 0, labels)
+    assert all(type(score) is float for _, score in neighbors)
+
+    assert bl.neighborhood(bm, "", 0) == ((b"", 0.0),)
+    assert bl.neighborhood(bm, "", 1) == ()
+    assert bl.neighborhood(bm, "AC", 0, "") == ()
+
+
+def test_neighborhood_cache(monkeypatch):
+    bm = bl.BLOSUM(62)
+    first = bl.neighborhood(bm, "WHE", 11)
+    assert bl.neighborhood(bm, b"WHE", 11) is first
+    assert bl.neighborhood(bm, "WHE", 12) is not first
+
+    monkeypatch.setattr(_neighborhood, "CACHE_SIZE", 2)
+    bm = bl.BLOSUM(45)
+    first = bl.neighborhood(bm, "AAA", 11)
+    bl.neighborhood(bm, "CCC", 11)
+    bl.neighborhood(bm, "AAA", 11)
+    bl.neighborhood(bm, "DDD", 11)
+    # The least recently used word is dropped
+    assert bl.neighborhood(bm, "AAA", 11) is first
+    assert len(bm._tables["neighborhoods"]) == 2
+
+
+def test_neighborhood_orders():
+    bm = bl.BLOSUM(62)
+    bl.neighborhood(bm, "WHW", 11, AA)
+    orders = bm._tables["neighborhoodOrders"][AA.encode()]
+    assert sorted(orders) == sorted(b"HW")
+    assert [r for _, r in orders[ord("W")]][0] == ord("W")
+    first = orders[ord("W")]
+    # Other words and thresholds reuse the sorted rows
+    bl.neighborhood(bm, "WAW", 5, AA)
+    assert orders[ord("W")] is first and sorted(orders) == sorted(b"AHW")
+
+
+def test_word_index():
+    bm = bl.BLOSUM(62, integer=True)
+    query = "HEAGAWGHEE"
+    index = bl.WordIndex(bm, query, k=3, threshold=11, alphabet=AA)
+
+    expected = {}
+    for i in range(len(query) - 2):
+        for word in bruteForce(bm, query[i : i + 3], 11, AA):
+            expected.setdefault(word, []).append(i)
+    assert dict(index.words) == expected
+    assert len(index) == len(expected)
+    assert index[b"AWG"] == [4]
+    assert b"AWG" in index
+    assert set(index) == set(expected)
+
+    target = "PAWHEAEhea"
+    assert list(index.hits(target)) == [
+        (i, j)
+        for j in range(len(target) - 2)
+        for i in expected.get(target[j : j + 3].upper().encode(), [])
+    ]
+    assert list(index.hits("PA")) == []
+
+    assert len(bl.WordIndex(bm, "HE", k=3)) == 0
+    with pytest.raises(ValueError):
+        bl.WordIndex(bm, query, k=0)
@@ -0,0 +1,81 @@
+# Testing query profiles
+import blosum as bl
+import pytest
+import random
+
+from blosum import _scoring
+
+from .conftest import AA, randomSequence
+
+
+@pytest.fixture
+def backend(backend, monkeypatch):
+    # NumPy is used for short sequences too
+    if backend == "numpy":
+        monkeypatch.setattr(_scoring, "NUMPY_MIN_LENGTH", 0)
+    return backend
+
+
+def sequences(count, length, seed=0):
+    rng = random.Random(seed)
+    return [randomSequence(rng, length) for _ in range(count)]
+
+
+def test_profile_scores(backend):
+    bm = bl.BLOSUM(62)
+    query = "HEAGAWGHEEx"
+    profile = bl.QueryProfile(bm, query)
+    assert len(profile) == len(query)
+    assert profile.query == query.encode()
+    for i, a in enumerate(query):
+        assert [profile.rows[i][ord(b)] for b in AA] == [bm[a.upper()][b] for b in AA]
+
+
+@pytest.mark.parametrize("integer", [False, True])
+def test_profile_ungapped(backend, integer):
+    bm = bl.BLOSUM(45, integer=integer)
+    query = sequences(1, 150, seed=1)[0]
+    profile = bl.QueryProfile(bm, query)
+    targets = sequences(20, 150, seed=2)
+    for target in targets:
+        score = bm.scoreSequences(profile, target)
+        assert score == bm.scoreSequences(query, target)
+        assert isinstance(score, int if integer else float)
+    assert list(bm.scoreBatch((profile, t) for t in targets)) == [
+        bm.scoreSequences(query, t) for t in targets
+    ]
+    with pytest.raises(ValueError):
+        bm.scoreSequences(profile, "A")
+
+
+@pytest.mark.parametrize("mode", ["local", "global"])
+def test_profile_align(backend, mode):
+    bm = bl.BLOSUM(62)
+    query = sequences(1, 40, seed=3)[0]
+    profile = bl.QueryProfile(bm, query)
+    aligner = bl.Aligner(bm, mode=mode)
+    for target in sequences(10, 30, seed=4):
+        assert aligner.score(target, profile) == aligner.score(target, query)
+        assert aligner.score(profile, target) == aligner.score(query, target)
+        assert aligner.align(target, profile) == aligner.align(target, query)
+        assert aligner.align(profile, target) == aligner.align(query, target)
+
+    # A profile of another matrix is used as plain sequence
+    other = bl.QueryProfile(bl.BLOSUM(45), query)
+    assert aligner.score(query, other) == aligner.score(query, query)
+
+
+def test_profile_striped(backend):
+    bm = bl.BLOSUM(62, integer=True)
+    query = "HEAGAWGHEE"
+    profile = bl.QueryProfile(bm, query, lanes=4)
+    striped = profile.striped
+    index = (lambda r: bm.matrix.index[r]) if backend == "numpy" else ord
+    for r in "AWH":
+        for k in range(3):
+            for lane in range(4):
+                pos = lane * 3 + k
+                expected = bm[query[pos]][r] if pos < len(query) else bm.default
+                assert striped[index(r)][k][lane] == expected
+    with pytest.raises(ValueError):
+        profile.stripe(0)
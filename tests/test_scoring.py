@@ -0,0 +1,84 @@
+# Testing whole sequence scoring
+import blosum as bl
+import pytest
+import random
+
+from blosum import _scoring
+
+from .conftest import randomSequence
+
+
+@pytest.fixture
+def backend(backend, monkeypatch):
+    # NumPy is used for short sequences too
+    if backend == "numpy":
+        monkeypatch.setattr(_scoring, "NUMPY_MIN_LENGTH", 0)
+    return backend
+
+
+def naive(bm, seq1, seq2):
+    return sum(bm[a][b] for a, b in zip(seq1, seq2))
+
+
+@pytest.mark.parametrize("length", [0, 1, 10, 300])
+def test_score_sequences(backend, length):
+    rng = random.Random(length)
+    seq1 = randomSequence(rng, length)
+    seq2 = randomSequence(rng, length)
+    for bm in [bl.BLOSUM(62), bl.BLOSUM(45, integer=True)]:
+        expected = naive(bm, seq1, seq2)
+        score = bm.scoreSequences(seq1, seq2)
+        assert score == expected
+        assert isinstance(score, int if bm.integer else float)
+        assert bm.scoreSequences(seq1.encode(), bytearray(seq2.encode())) == expected
+        assert bm.scoreSequences(memoryview(seq1.lower().encode()), seq2) == expected
+
+
+def test_score_sequences_default(backend):
+    bm = bl.BLOSUM(62, default=-50)
+    assert bm.scoreSequences("AUA", "AAA") == 4 - 50 + 4
+    assert bm.scoreSequences("Aé", "AA") == 4 - 50
+    assert bl.BLOSUM(62).scoreSequences("AU", "AA") == float("-inf")
+
+
+def test_score_sequences_length():
+    with pytest.raises(ValueError):
+        bl.BLOSUM(62).scoreSequences("AAA", "AA")
+
+
+def test_score_batch(backend):
+    rng = random.Random(0)
+    pairs = []
+    for _ in range(200):
+        length = rng.randint(0, 12)
+        pairs.append(
+            (
+                randomSequence(rng, length),
+                randomSequence(rng, length).encode(),
+            )
+        )
+    for bm in [bl.BLOSUM(62), bl.BLOSUM(80, integer=True)]:
+        expected = [naive(bm, a, b.decode()) for a, b in pairs]
+        for chunkSize in [1, 7, 1000]:
+            scores = list(bm.scoreBatch(iter(pairs), chunkSize=chunkSize))
+            assert scores == expected
+            assert all(isinstance(s, int if bm.integer else float) for s in scores)
+
+
+def test_score_batch_lazy():
+    bm = bl.BLOSUM(62)
+    consumed = []
+
+    def pairs():
+        for i in range(10):
+            consumed.append(i)
+            yield "AW", "AY"
+
+    scores = bm.scoreBatch(pairs(), chunkSize=3)
+    assert next(scores) == 4 + 2
+    assert consumed == [0, 1, 2]
+
+    with pytest.raises(ValueError):
+        list(bm.scoreBatch([("A", "AA")]))
+    with pytest.raises(ValueError):
+        bm.scoreBatch([], chunkSize=0)
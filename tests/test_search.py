@@ -0,0 +1,105 @@
+# Testing the streaming database search
+import blosum as bl
+import gzip
+import pytest
+import random
+from os import path
+
+from blosum import _search
+
+from .conftest import randomSequence, ungapped
+
+
+def records(count, seed=0):
+    rng = random.Random(seed)
+    return [(f"seq{i}", randomSequence(rng, rng.randint(0, 30))) for i in range(count)]
+
+
+def writeFasta(filename, recs, compress=False):
+    text = "".join(f">{name} description\n{seq[:10]}\n{seq[10:]}\n\n" for name, seq in recs)
+    opener = gzip.open if compress else open
+    with opener(filename, "wt") as f:
+        f.write(text)
+
+
+def expected(bm, query, recs, k, mode):
+    if mode == "ungapped":
+        scores = [ungapped(bm, query, seq) for _, seq in recs]
+    else:
+        scores = [bl.Aligner(bm, mode=mode).score(query, seq) for _, seq in recs]
+    order = sorted(range(len(recs)), key=lambda i: (-scores[i], i))[:k]
+    return [(scores[i], recs[i][0], i) for i in order]
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_read_fasta(tmp_path, compress):
+    recs = records(5) + [("last", "")]
+    filename = str(tmp_path / "db.fasta")
+    writeFasta(filename, recs, compress)
+    assert list(bl.readFasta(filename)) == [(name, seq.encode()) for name, seq in recs]
+
+
+@pytest.mark.parametrize("mode", ["ungapped", "local", "global"])
+@pytest.mark.parametrize("chunkSize", [1, 7, 100])
+def test_search(backend, tmp_path, mode, chunkSize):
+    bm = bl.BLOSUM(62)
+    recs = records(40)
+    # Duplicates give ties, ordered by their position in the database
+    recs += recs[:5]
+    filename = str(tmp_path / "db.fasta.gz")
+    writeFasta(filename, recs, compress=True)
+    queries = ["HEAGAWGHEE", recs[3][1], ""]
+
+    reports = []
+    hits = bl.search(
+        bm, queries, filename, mode, 5, chunkSize=chunkSize, workers=0, progress=reports.append
+    )
+    assert [[tuple(hit) for hit in h] for h in hits] == [
+        expected(bm, q, recs, 5, mode) for q in queries
+    ]
+    assert hits[1][0].id == "seq3"
+    assert reports[-1].records == len(recs)
+    assert reports[-1].recordsPerSecond > 0
+
+
+def test_search_columns(monkeypatch):
+    pytest.importorskip("numpy")
+    bm = bl.BLOSUM(62, integer=True)
+    recs = records(30, seed=2)
+    calls = []
+    columns = _search._columns
+    monkeypatch.setattr(
+        _search, "_columns", lambda profile: calls.append(profile) or columns(profile)
+    )
+    hits = bl.search(bm, ["HEAGAWGHEE", "WYWY"], recs, "ungapped", 3, chunkSize=4, workers=0)
+    # Built once per query, not per chunk
+    assert len(calls) == 2
+    assert [[tuple(hit) for hit in h] for h in hits] == [
+        expected(bm, q, recs, 3, "ungapped") for q in ["HEAGAWGHEE", "WYWY"]
+    ]
+
+
+def test_search_pool():
+    bm = bl.BLOSUM(path.join(path.dirname(__file__), "test.blosum"), integer=True)
+    recs = records(30, seed=1)
+    hits = bl.search(bm, ["ACDEF", "WYWY"], recs, k=3, chunkSize=4, workers=2)
+    assert [[tuple(hit) for hit in h] for h in hits] == [
+        expected(bm, q, recs, 3, "local") for q in ["ACDEF", "WYWY"]
+    ]
+    assert all(type(hit.score) is int for h in hits for hit in h)
+
+
+def test_search_edge_cases():
+    bm = bl.BLOSUM(62)
+    assert bl.search(bm, ["AAA"], [], workers=0) == [[]]
+    assert bl.search(bm, [], records(3), workers=0) == []
+    assert len(bl.search(bm, ["AAA"], records(3), k=10, workers=0)[0]) == 3
+
+    with pytest.raises(ValueError):
+        bl.search(bm, ["AAA"], [], mode="semiglobal")
+    with pytest.raises(ValueError):
+        bl.search(bm, ["AAA"], [], k=0)
+    with pytest.raises(ValueError):
+        bl.search(bm, ["AAA"], [], chunkSize=0)
+    with pytest.raises(ValueError):
+        bl.search(bm, ["AAA"], [], gapExtend=-1)
@@ -0,0 +1,153 @@
+# Testing the database index and seed-and-extend search
+import blosum as bl
+import pytest
+import random
+from os import path
+
+from blosum import _compat
+
+from .conftest import AA, randomSequence, ungapped
+
+
+def records(count, seed=0):
+    rng = random.Random(seed)
+    return [(f"seq{i}", randomSequence(rng, rng.randint(0, 60), AA + "Xa")) for i in range(count)]
+
+
+def bruteForce(recs, word):
+    found = []
+    offset = 0
+    for _, seq in recs:
+        seq = seq.upper()
+        found += [offset + j for j in range(len(seq) - len(word) + 1) if seq[j : j + 3] == word]
+        offset += len(seq)
+    return found
+
+
+def test_database_index(backend, tmp_path):
+    recs = records(50)
+    index = bl.DatabaseIndex(recs, k=3)
+    assert len(index) == 50
+    assert index.id(7) == "seq7"
+    assert index.sequence(7) == recs[7][1].encode()
+    assert index.record(index.offsets[9]) == 9
+
+    words = {seq[j : j + 3].upper() for _, seq in recs for j in range(len(seq) - 2)}
+    for word in sorted(words)[:200]:
+        expected = bruteForce(recs, word) if "X" not in word else []
+        assert list(index.lookup(word)) == expected
+        assert list(index.lookup(word.lower())) == expected
+    assert len(index.positions) == sum(len(bruteForce(recs, w)) for w in words if "X" not in w)
+    assert list(index.lookup("AAAA")) == []
+
+    filename = str(tmp_path / "db.idx")
+    index.save(filename)
+    loaded = bl.DatabaseIndex.load(filename)
+    assert (len(loaded), loaded.k, loaded.alphabet) == (50, 3, index.alphabet)
+    assert list(loaded.starts) == list(index.starts)
+    assert list(loaded.positions) == list(index.positions)
+    assert [loaded.id(r) for r in range(50)] == [name for name, _ in recs]
+    assert [loaded.sequence(r) for r in range(50)] == [seq.encode() for _, seq in recs]
+
+
+def test_database_index_backends(monkeypatch, tmp_path):
+    pytest.importorskip("numpy")
+    recs = records(80, seed=1)
+    index = bl.DatabaseIndex(recs, k=2, alphabet="ACDEFGHIKLMNPQRSTVWYX")
+    monkeypatch.setattr(_compat, "_numpy", None)
+    assert list(bl.DatabaseIndex(recs, k=2, alphabet="ACDEFGHIKLMNPQRSTVWYX").positions) == list(
+        index.positions
+    )
+
+
+def test_database_index_fasta(tmp_path):
+    recs = records(10)
+    filename = str(tmp_path / "db.fasta")
+    with open(filename, "w") as f:
+        f.writelines(f">{name}\n{seq}\n" for name, seq in recs)
+    index = bl.DatabaseIndex(filename)
+    assert [index.sequence(r) for r in range(10)] == [seq.encode() for _, seq in recs]
+
+
+def test_database_index_errors(tmp_path):
+    with pytest.raises(ValueError):
+        bl.DatabaseIndex([], k=0)
+    with pytest.raises(ValueError):
+        bl.DatabaseIndex([], k=8)
+    with pytest.raises(ValueError):
+        bl.DatabaseIndex([], alphabet="AAC")
+
+    filename = str(tmp_path / "db.idx")
+    bl.DatabaseIndex(records(5)).save(filename)
+    with open(filename, "r+b") as f:
+        f.truncate(200)
+    with pytest.raises(ValueError):
+        bl.DatabaseIndex.load(filename)
+    with open(filename, "wb") as f:
+        f.write(b"not an index")
+    with pytest.raises(ValueError):
+        bl.DatabaseIndex.load(filename)
+
+
+def test_seed_search(backend):
+    bm = bl.BLOSUM(62, integer=True)
+    rng = random.Random(2)
+    recs = records(40, seed=3)
+    # Plant mutated copies of the query
+    query = randomSequence(rng, 40)
+    for r, changes in [(5, 2), (17, 6), (30, 0)]:
+        copy = list(query)
+        for p in rng.sample(range(40), changes):
+            copy[p] = rng.choice(AA)
+        recs[r] = (recs[r][0], recs[r][1][:10] + "".join(copy) + recs[r][1][10:])
+    index = bl.DatabaseIndex(recs)
+
+    hits = bl.seedSearch(bm, [query], index, k=3)[0]
+    assert [hit.record for hit in hits] == [30, 5, 17]
+    assert hits[0].score == bm.scoreSequences(query, query)
+    assert [hit.id for hit in hits] == [recs[r][0] for r in (30, 5, 17)]
+
+    # Extensions stop at the record ends, no segment beats the best one of its record
+    exhaustive = bl.seedSearch(bm, [query], index, threshold=-100, window=0, xDrop=1e9, k=50)[0]
+    for hit in exhaustive:
+        assert hit.score <= ungapped(bm, query, recs[hit.record][1].upper(), 3)
+        assert type(hit.score) is int
+
+    gapped = bl.seedSearch(bm, [query, ""], index, gapped=True, gapOpen=5, gapExtend=2, k=3)
+    aligner = bl.Aligner(bm, gapOpen=5, gapExtend=2)
+    assert [tuple(hit) for hit in gapped[0]] == [
+        (aligner.score(query, recs[r][1]), recs[r][0], r) for r in (30, 5, 17)
+    ]
+    assert gapped[1] == []
+
+
+def test_seed_search_two_hit():
+    bm = bl.BLOSUM(62, integer=True)
+    index = bl.DatabaseIndex([("a", "WWW" + "P" * 17 + "CCC"), ("b", "WWWCCC")])
+    query = "WWW" + "A" * 17 + "CCC"
+    # With T = 25 the only seeds are WWW and CCC, 20 residues apart on one diagonal of a.
+    # Between them the score drops by 17.
+    hits = bl.seedSearch(bm, [query], index, threshold=25, xDrop=20)[0]
+    assert [tuple(h) for h in hits] == [(43, "a", 0)]
+    hits = bl.seedSearch(bm, [query], index, threshold=25, xDrop=16)[0]
+    assert [tuple(h) for h in hits] == [(27, "a", 0)]
+    assert bl.seedSearch(bm, [query], index, threshold=25, window=10, xDrop=20)[0] == []
+
+    hits = bl.seedSearch(bm, [query], index, threshold=25, window=0, xDrop=20)[0]
+    assert [tuple(h) for h in hits] == [(43, "a", 0), (33, "b", 1)]
+    hits = bl.seedSearch(bm, [query], index, threshold=25, window=0)[0]
+    assert [tuple(h) for h in hits] == [(33, "a", 0), (33, "b", 1)]
+    hits = bl.seedSearch(bm, [query], index, threshold=25, window=0, xDrop=20, cutoff=40)[0]
+    assert [h.record for h in hits] == [0]
+
+    # Hits at the end of one record and the start of the next do not pair up
+    split = bl.DatabaseIndex([("a", "PPWWW"), ("b", "CCCPP")])
+    assert bl.seedSearch(bm, ["WWWCCC"], split, threshold=25, window=40) == [[]]
+    joined = bl.DatabaseIndex([("a", "PPWWWCCCPP")])
+    hits = bl.seedSearch(bm, ["WWWCCC"], joined, threshold=25, window=40)[0]
+    assert [tuple(h) for h in hits] == [(bm.scoreSequences("WWWCCC", "WWWCCC"), "a", 0)]
+
+    with pytest.raises(ValueError):
+        bl.seedSearch(bm, [query], index, k=0)
+    with pytest.raises(ValueError):
+        bl.seedSearch(bm, [query], index, xDrop=-1)
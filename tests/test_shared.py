@@ -0,0 +1,68 @@
+# Testing shared memory matrices
+import blosum as bl
+import pytest
+from os import path
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _lookup(name, a, b):
+    bm = bl.attachMatrix(name)
+    return bm[a][b], bm.score(a, b), bm.n, bm.default
+
+
+@pytest.mark.filterwarnings("ignore:Blosum")
+def test_share_custom():
+    fp = path.join(path.dirname(__file__), "test.blosum")
+    bm = bl.BLOSUM(fp, default=-7, integer=True)
+    shm = bl.shareMatrix(bm)
+    try:
+        attached = bl.attachMatrix(shm.name)
+        assert attached is bl.attachMatrix(shm.name)
+        assert not dict.__len__(attached)
+        assert attached == bm
+        assert attached.n == fp and attached.default == -7 and attached.integer
+        assert attached.score("A", "U") == -7
+        assert isinstance(attached.matrix.scores, memoryview)
+        # Lookups read the buffer, nothing is copied into the dict
+        for a in attached.matrix.labels:
+            for b in attached.matrix.labels:
+                assert attached[a, b] == attached.score(a, b) == attached[a][b] == bm[a][b]
+        assert attached["A"] == bm["A"] and dict(attached["A"]) == dict(bm["A"])
+        assert attached["A"]["?"] == -7 and "?" not in attached["A"]
+        assert str(attached) == str(bm)
+        assert dict.__len__(attached) == 0
+        # Lookups read the shared buffer directly, rows are only built on demand
+        assert attached._scores is attached.matrix.scores
+
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(_lookup, shm.name, "N", "D").result() == (2, 2, fp, -7)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_share_builtin():
+    shm = bl.shareMatrix(bl.BLOSUM(62))
+    try:
+        attached = bl.attachMatrix(shm.name)
+        assert attached == bl.BLOSUM(62)
+        assert attached.n == 62
+        assert bl.BLOSUM(62) is not attached
+        assert attached.score("W", "Y") == 2
+        assert isinstance(attached.score("W", "Y"), float)
+        assert attached._scores is attached.matrix.scores
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_attach_invalid():
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            bl.attachMatrix(shm.name)
+    finally:
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,167 @@
+# Testing Karlin-Altschul statistics
+import blosum as bl
+import math
+import pytest
+from itertools import product
+
+from blosum import _statistics
+from blosum._statistics import ROBINSON_FREQUENCIES as ROBINSON
+
+# NCBI BLAST (blast_stat.c): ungapped lambda, K and H with Robinson & Robinson frequencies
+PUBLISHED = {
+    45: (0.2291, 0.0924, 0.2514),
+    50: (0.2318, 0.112, 0.3362),
+    62: (0.3176, 0.134, 0.4012),
+    80: (0.3430, 0.177, 0.6568),
+    90: (0.3346, 0.190, 0.7547),
+}
+
+
+@pytest.mark.parametrize("n", sorted(PUBLISHED))
+def test_ungapped(backend, n):
+    stats = bl.karlinAltschul(bl.BLOSUM(n))
+    lam, K, H = PUBLISHED[n]
+    assert stats.lam == pytest.approx(lam, abs=1e-4)
+    assert stats.K == pytest.approx(K, rel=5e-3)
+    assert stats.H == pytest.approx(H, abs=1e-4)
+    assert bl.karlinAltschul(bl.BLOSUM(n, integer=True)) == pytest.approx(stats)
+
+
+def test_ungapped_lambda():
+    bm = bl.BLOSUM(62)
+    freqs = {"A": 3, "R": 2, "N": 2, "D": 2, "G": 2, "W": 1}
+    stats = bl.karlinAltschul(bm, frequencies=freqs)
+    total = sum(freqs.values())
+    assert sum(
+        freqs[a] * freqs[b] / total**2 * math.exp(stats.lam * bm[a][b])
+        for a in freqs
+        for b in freqs
+    ) == pytest.approx(1)
+
+
+def test_cache():
+    bm = bl.BLOSUM(62)
+    stats = bl.karlinAltschul(bm)
+    assert bl.karlinAltschul(bm) is stats
+    freqs = {"A": 0.3, "R": 0.2, "N": 0.2, "D": 0.2, "W": 0.1}
+    other = bl.karlinAltschul(bm, frequencies=freqs)
+    assert other is not stats
+    assert bl.karlinAltschul(bm, frequencies=dict(freqs)) is other
+    scaled = {residue: 10 * p for residue, p in freqs.items()}
+    assert bl.karlinAltschul(bm, frequencies=scaled) == pytest.approx(other)
+
+
+def test_gapped():
+    assert bl.karlinAltschul(bl.BLOSUM(62), 11, 1) == (0.267, 0.041, 0.14)
+    assert bl.karlinAltschul(bl.BLOSUM(45), gapOpen=14, gapExtend=2).K == 0.032
+    with pytest.raises(ValueError):
+        bl.karlinAltschul(bl.BLOSUM(62), 3, 3)
+    with pytest.raises(ValueError):
+        bl.karlinAltschul(bl.BLOSUM(62), 11, 1, frequencies={"A": 1, "C": 1})
+
+
+def test_invalid_frequencies():
+    bm = bl.BLOSUM(62)
+    with pytest.raises(ValueError):
+        bl.karlinAltschul(bm, frequencies={"A": 1, "?": 1})
+    with pytest.raises(ValueError):
+        bl.karlinAltschul(bm, frequencies={"A": 1, "C": -1})
+    with pytest.raises(ValueError):
+        bl.karlinAltschul(bm, frequencies={"A": 0})
+    # Only positive scores
+    with pytest.raises(ValueError):
+        bl.karlinAltschul(bm, frequencies={"W": 1})
+
+
+def test_conversions(backend):
+    stats = bl.karlinAltschul(bl.BLOSUM(62), 11, 1)
+    bits = (0.267 * 50 - math.log(0.041)) / math.log(2)
+    assert stats.bitScores(50) == pytest.approx(bits)
+    assert list(stats.bitScores([50, 50.0, 0])) == pytest.approx(
+        [bits, bits, -math.log(0.041) / math.log(2)]
+    )
+
+    evalue = 0.041 * 100 * 10**6 * math.exp(-0.267 * 50)
+    assert stats.eValues(50, 100, 10**6) == pytest.approx(evalue)
+    assert list(stats.eValues([50, 60], 100, 10**6)) == pytest.approx(
+        [evalue, evalue * math.exp(-0.267 * 10)]
+    )
+    assert list(stats.eValues([50, 50], [100, 200], 10**6)) == pytest.approx([evalue, 2 * evalue])
+    assert list(stats.eValues(50, [100, 200], 10**6)) == pytest.approx([evalue, 2 * evalue])
+
+
+def enumerate_(bm, freqs, length):
+    total = sum(freqs.values())
+    pairs = [(bm[a][b], freqs[a] * freqs[b] / total**2) for a in freqs for b in freqs]
+    result = {}
+    for combination in product(pairs, repeat=length):
+        score = sum(s for s, _ in combination)
+        result[score] = result.get(score, 0) + math.prod(p for _, p in combination)
+    return result
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 3, 4])
+def test_score_distribution(backend, length):
+    bm = bl.BLOSUM(62, integer=True)
+    freqs = {"A": 1, "W": 2, "C": 3}
+    distribution = bl.scoreDistribution(bm, length, freqs)
+    expected = enumerate_(bm, freqs, length)
+    assert distribution.low == min(expected)
+    assert distribution.high == max(expected)
+    assert list(distribution.probabilities) == pytest.approx(
+        [expected.get(s, 0) for s in range(distribution.low, distribution.high + 1)]
+    )
+
+    tail = [sum(p for s, p in expected.items() if s >= t) for t in range(-50, 60)]
+    assert list(distribution.pValues(range(-50, 60))) == pytest.approx(tail)
+    assert distribution.pValues(9) == pytest.approx(tail[59])
+    assert distribution.pValues(distribution.high + 1) == 0
+
+
+def test_score_distribution_long(backend):
+    bm = bl.BLOSUM(62)
+    distribution = bl.scoreDistribution(bm, 300)
+    probabilities = list(distribution.probabilities)
+    scores = range(distribution.low, distribution.high + 1)
+    assert sum(probabilities) == pytest.approx(1)
+    assert min(probabilities) >= 0
+
+    freqs = {a: p / sum(ROBINSON.values()) for a, p in ROBINSON.items()}
+    pairs = [(bm[a][b], freqs[a] * freqs[b]) for a in freqs for b in freqs]
+    mean = sum(s * p for s, p in pairs)
+    variance = sum(s * s * p for s, p in pairs) - mean**2
+    assert sum(s * p for s, p in zip(scores, probabilities)) == pytest.approx(300 * mean)
+    assert sum((s - 300 * mean) ** 2 * p for s, p in zip(scores, probabilities)) == pytest.approx(
+        300 * variance
+    )
+    # Tail probabilities far below double precision of the peak
+    tail = list(distribution.pValues(scores))
+    assert tail == sorted(tail, reverse=True)
+    assert any(0 < p < 1e-100 for p in tail)
+    assert distribution.pValues(distribution.low) == pytest.approx(1)
+
+
+def test_score_distribution_cache(monkeypatch):
+    bm = bl.BLOSUM(62)
+    first = bl.scoreDistribution(bm, 10)
+    assert bl.scoreDistribution(bm, 10) is first
+    assert bl.scoreDistribution(bm, 11) is not first
+    assert bl.scoreDistribution(bm, 10, {"A": 1, "C": 1}) is not first
+
+    monkeypatch.setattr(_statistics, "DISTRIBUTION_CACHE_SIZE", 2)
+    bm = bl.BLOSUM(80)
+    first = bl.scoreDistribution(bm, 1)
+    bl.scoreDistribution(bm, 2)
+    bl.scoreDistribution(bm, 1)
+    bl.scoreDistribution(bm, 3)
+    assert bl.scoreDistribution(bm, 1) is first
+    assert len(bm._tables["scoreDistributions"]) == 2
+
+
+def test_score_distribution_errors(tmp_path):
+    with pytest.raises(ValueError):
+        bl.scoreDistribution(bl.BLOSUM(62), -1)
+    filename = tmp_path / "half.blosum"
+    filename.write_text("   A    C\nA 1.5 -1\nC -1 2\n")
+    with pytest.raises(ValueError):
+        bl.scoreDistribution(bl.BLOSUM(str(filename)), 3, {"A": 1, "C": 1})